@@ -12,7 +12,9 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import os
-from decouple import config
+from importlib.util import find_spec
+from decouple import Csv, config
+from core_utils.utils.cache import is_shared_cache
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -23,6 +25,8 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = config("SECRET_KEY")
+#? previous keys, still accepted for signed data (session cookies, password reset) while rotating
+SECRET_KEY_FALLBACKS = config("SECRET_KEY_FALLBACKS", default="", cast=Csv())
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
@@ -30,6 +34,10 @@ DEBUG = True
 ALLOWED_HOSTS = []
 
 AUTH_USER_MODEL = 'user_auth.UserModel'
+
+AUTHENTICATION_BACKENDS = [
+    'user_config.user_auth.backends.EmailModelBackend',
+]
 # Application definition
 
 CUSTOM_APPS = [
@@ -57,14 +65,19 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'core_utils.middleware.RoutedSessionMiddleware',
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
+    'core_utils.middleware.RoutedCsrfViewMiddleware',
+    'core_utils.middleware.RoutedAuthenticationMiddleware',
+    'core_utils.middleware.RoutedMessageMiddleware',
+    'core_utils.middleware.AuditContextMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Session, CSRF, auth and messages middleware are skipped for these path
+# prefixes; routes under them authenticate with JWT only.
+SESSION_FREE_PATH_PREFIXES = config("SESSION_FREE_PATH_PREFIXES", default="/api/", cast=Csv())
+
 ROOT_URLCONF = 'core.urls'
 
 TEMPLATES = [
@@ -87,8 +100,25 @@ WSGI_APPLICATION = 'core.wsgi.application'
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
     "PAGE_SIZE": 10,
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "user_config.user_auth.authentication.JWTAuthentication",
+        "rest_framework.authentication.SessionAuthentication",
+    ],
 }
 
+# JWT
+# JWT_PRIVATE_KEY / JWT_PREVIOUS_PUBLIC_KEY accept a PEM string or a path to a PEM file.
+# HS* algorithms sign with SECRET_KEY and need no key files.
+
+JWT_ALGORITHM = config("JWT_ALGORITHM", default="EdDSA")
+JWT_PRIVATE_KEY = config("JWT_PRIVATE_KEY", default="")
+JWT_KEY_ID = config("JWT_KEY_ID", default="default")
+JWT_PREVIOUS_PUBLIC_KEY = config("JWT_PREVIOUS_PUBLIC_KEY", default="")
+JWT_PREVIOUS_KEY_ID = config("JWT_PREVIOUS_KEY_ID", default="previous")
+JWT_ISSUER = config("JWT_ISSUER", default="weepstay")
+JWT_ACCESS_TOKEN_LIFETIME_SECONDS = config("JWT_ACCESS_TOKEN_LIFETIME_SECONDS", default=60 * 15, cast=int)
+JWT_REFRESH_TOKEN_LIFETIME_SECONDS = config("JWT_REFRESH_TOKEN_LIFETIME_SECONDS", default=60 * 60 * 24 * 7, cast=int)
+
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
@@ -103,6 +133,123 @@ DATABASES = {
     }
 }
 
+# Connection pooling
+# With DB_POOL on (PostgreSQL, needs psycopg[pool]), each process keeps a
+# psycopg pool per alias instead of connecting per request; requests wait
+# at most DB_POOL_TIMEOUT seconds for a free connection. Otherwise
+# DB_CONN_MAX_AGE keeps connections open across requests. Health checks
+# test a connection before it is reused, in both modes.
+
+DB_POOL = config("DB_POOL", default=False, cast=bool)
+
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    #? same backend, plus connection wait metrics (core_utils.db_pool)
+    DATABASES["default"]["ENGINE"] = "core_utils.db_backends.postgresql"
+
+if DB_POOL and DATABASES["default"]["ENGINE"] == "core_utils.db_backends.postgresql" and find_spec("psycopg_pool") is not None:
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+            "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),
+            "timeout": config("DB_POOL_TIMEOUT", default=10.0, cast=float),
+            "max_idle": config("DB_POOL_MAX_IDLE", default=600.0, cast=float),
+            "max_lifetime": config("DB_POOL_MAX_LIFETIME", default=3600.0, cast=float),
+        },
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = config("DB_CONN_MAX_AGE", default=0, cast=int)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = config("DB_CONN_HEALTH_CHECKS", default=True, cast=bool)
+
+# Generic views run each request in a transaction with this statement_timeout
+# (PostgreSQL); views override it with `statement_timeout_ms`, 0 disables it.
+DB_STATEMENT_TIMEOUT_MS = config("DB_STATEMENT_TIMEOUT_MS", default=30000, cast=int)
+
+# Queries slower than SLOW_QUERY_THRESHOLD_MS (0 disables) are logged, with the
+# generic view that ran them, to a rotating JSON-lines file; a sample of them
+# also gets its EXPLAIN plan (PostgreSQL). Aggregate with `manage.py slow_queries`.
+SLOW_QUERY_THRESHOLD_MS = config("SLOW_QUERY_THRESHOLD_MS", default=200, cast=int)
+SLOW_QUERY_EXPLAIN_SAMPLE_RATE = config("SLOW_QUERY_EXPLAIN_SAMPLE_RATE", default=0.1, cast=float)
+SLOW_QUERY_LOG_FILE = config("SLOW_QUERY_LOG_FILE", default=str(BASE_DIR / "logs" / "slow_queries.log"))
+
+# Adds a Server-Timing header (connection wait, pool state) to generic view responses.
+DB_SERVER_TIMING = config("DB_SERVER_TIMING", default=DEBUG, cast=bool)
+
+# Read replicas
+# DB_REPLICAS is a comma separated list of streaming replicas of `default`,
+# as "host:port" (for SQLite, database file names). Each becomes a
+# `replica_<n>` alias; CoreGenericListAPIView / CoreGenericGetAPIView read
+# from one whose lag is at most DB_REPLICA_MAX_LAG seconds, and a user's
+# reads stay on the primary for DB_READ_YOUR_WRITES_WINDOW seconds after
+# they write (the pin is kept in the default cache, share it across workers).
+
+DATABASE_REPLICAS = []
+for replica_index, replica in enumerate(config("DB_REPLICAS", default="", cast=Csv()), start=1):
+    replica_alias : str = f"replica_{replica_index}"
+    if "sqlite" in DATABASES["default"]["ENGINE"]:
+        replica_settings : dict = {"NAME": replica}
+    else:
+        replica_host, _, replica_port = replica.partition(":")
+        replica_settings : dict = {"HOST": replica_host, "PORT": replica_port or DATABASES["default"]["PORT"]}
+    DATABASES[replica_alias] = {
+        **DATABASES["default"],
+        **replica_settings,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(replica_alias)
+
+DATABASE_ROUTERS = ["core_utils.db_routing.PrimaryReplicaRouter"]
+DATABASE_REPLICA_MAX_LAG = config("DB_REPLICA_MAX_LAG", default=2.0, cast=float)
+DATABASE_READ_YOUR_WRITES_WINDOW = config("DB_READ_YOUR_WRITES_WINDOW", default=5, cast=int)
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# The default LocMem cache is per process: enough for one development worker.
+# Version counters and invalidations kept in it never reach other workers, so
+# the core_utils.E001 deployment check (check --deploy) fails until a shared
+# backend is set.
+
+CACHES = {
+    'default': {
+        "BACKEND": config("CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": config("CACHE_LOCATION", default="weepstay"),
+    }
+}
+
+# Handler results cached with core_utils.handler_cache.cache_aside live in a
+# per-process LRU of HANDLER_CACHE_LOCAL_MAX_ENTRIES values (0 disables it) in
+# front of this cache. It must be shared (Redis, Memcached): with a
+# process-local backend (LocMem) cache_aside does not cache at all.
+HANDLER_CACHE_ALIAS = config("HANDLER_CACHE_ALIAS", default="default")
+HANDLER_CACHE_LOCAL_MAX_ENTRIES = config("HANDLER_CACHE_LOCAL_MAX_ENTRIES", default=1024, cast=int)
+
+# Sessions
+# https://docs.djangoproject.com/en/5.2/topics/http/sessions/
+# When SESSION_CACHE_ALIAS is a shared cache, sessions default to
+# "django.contrib.sessions.backends.cached_db": read from the cache, the table
+# is only queried on a miss. With a process-local cache they stay in the table
+# ("django.contrib.sessions.backends.db"), since a logged out session would
+# stay alive in the other workers' caches (see the core_utils.E001 check).
+# "django.contrib.sessions.backends.signed_cookies" keeps no server-side state
+# at all. Expired rows are removed by the purge_expired_sessions command.
+
+SESSION_CACHE_ALIAS = config("SESSION_CACHE_ALIAS", default="default")
+SESSION_ENGINE = config(
+    "SESSION_ENGINE",
+    default=(
+        "django.contrib.sessions.backends.cached_db"
+        if is_shared_cache(SESSION_CACHE_ALIAS, cache_settings=CACHES)
+        else "django.contrib.sessions.backends.db"
+    ),
+)
+SESSION_COOKIE_AGE = config("SESSION_COOKIE_AGE", default=60 * 60 * 24 * 14, cast=int)
+
+# Token blacklist
+# Rows are purged once the revoked token has expired; rows without an expiry
+# (and whole partitions, when partitioned) are kept for this many days.
+
+BLACKLIST_TOKEN_RETENTION_DAYS = config("BLACKLIST_TOKEN_RETENTION_DAYS", default=30, cast=int)
+BLACKLIST_TOKEN_PARTITIONING = config("BLACKLIST_TOKEN_PARTITIONING", default=False, cast=bool)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -122,6 +269,26 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+if find_spec("argon2") is not None:
+    #? argon2-cffi is optional, existing PBKDF2 hashes are upgraded on login
+    PASSWORD_HASHERS.insert(0, 'user_config.user_auth.hashers.TunableArgon2PasswordHasher')
+
+PASSWORD_ARGON2_TIME_COST = config("PASSWORD_ARGON2_TIME_COST", default=2, cast=int)
+PASSWORD_ARGON2_MEMORY_COST = config("PASSWORD_ARGON2_MEMORY_COST", default=102400, cast=int)
+PASSWORD_ARGON2_PARALLELISM = config("PASSWORD_ARGON2_PARALLELISM", default=8, cast=int)
+
+PASSWORD_HASH_MAX_WORKERS = config("PASSWORD_HASH_MAX_WORKERS", default=4, cast=int)
+PASSWORD_REHASH_MAX_PENDING = config("PASSWORD_REHASH_MAX_PENDING", default=100, cast=int)
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import m2m_changed
 
 
 class CoreUtilsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core_utils'
+
+    def ready(self):
+        from core_utils import checks  # noqa: F401
+        from core_utils.handler_cache import invalidate_on_m2m_change
+        from core_utils.slow_queries import install_slow_query_logger
+
+        connection_created.connect(install_slow_query_logger, dispatch_uid="core_utils.slow_queries")
+        m2m_changed.connect(invalidate_on_m2m_change, dispatch_uid="core_utils.handler_cache")
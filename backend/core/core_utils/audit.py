@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Iterator, Optional
+from django.apps import apps
+from core_utils.utils.constants import CORE_UTILS_AUDIT_USER_MODEL
+
+
+class AuditContext:
+    """
+    Who is writing, as the `UserDetailModel` id stamped into
+    `core_generic_created_by` / `core_generic_updated_by`.
+
+    The id is resolved on first use and then reused for the rest of the
+    context, so a request costs at most one lookup however many rows it
+    writes, and none if it writes nothing.
+    """
+
+    def __init__(
+        self,
+        user : Any = None,
+        user_detail_id : Optional[int] = None,
+        get_user : Optional[Callable[[], Any]] = None,
+    ):
+        self._user : Any = user
+        self._get_user : Optional[Callable[[], Any]] = get_user
+        self._user_detail_id : Optional[int] = user_detail_id
+        self._resolved : bool = user_detail_id is not None
+
+    def get_user(self) -> Any :
+        if self._user is None and self._get_user is not None :
+            return self._get_user()
+        return self._user
+
+    def resolve_user_detail_id(self, user : Any) -> Optional[int] :
+        user_detail_model = apps.get_model(CORE_UTILS_AUDIT_USER_MODEL)
+        return user_detail_model._base_manager.filter(user_id=user.pk).values_list("pk", flat=True).first()
+
+    @property
+    def user_detail_id(self) -> Optional[int] :
+        if self._resolved :
+            return self._user_detail_id
+        user : Any = self.get_user()
+        #? not authenticated (yet): DRF authenticates inside the view, so ask again later
+        if user is None or not getattr(user, "is_authenticated", False) or user.pk is None :
+            return None
+        self._user_detail_id = self.resolve_user_detail_id(user)
+        self._resolved = True
+        return self._user_detail_id
+
+
+audit_context_var : ContextVar[Optional[AuditContext]] = ContextVar("audit_context", default=None)
+
+
+def get_audit_user_detail_id() -> Optional[int] :
+    """
+    `UserDetailModel` id of the current writer, None outside an audit context.
+    """
+    context : Optional[AuditContext] = audit_context_var.get()
+    return context.user_detail_id if context is not None else None
+
+
+@contextmanager
+def audit_context(user : Any = None, user_detail_id : Optional[int] = None) -> Iterator[AuditContext] :
+    """
+    Stamps writes made inside the block with `user` (or `user_detail_id`),
+    for commands and background jobs that run outside a request.
+    """
+    context : AuditContext = AuditContext(user=user, user_detail_id=user_detail_id)
+    token : Token = audit_context_var.set(context)
+    try :
+        yield context
+    finally :
+        audit_context_var.reset(token)
@@ -0,0 +1,164 @@
+from typing import Dict, Iterator, List, Optional, Set, Type
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS
+from django.core.checks import Error, Tags, Warning, register
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import ForeignObjectRel, Model, UniqueConstraint
+from django.db.models.options import Options
+from django.urls import URLPattern, URLResolver, get_resolver
+from core_utils.utils.generics.views.queryset import (
+    CoreGenericQueryset,
+    CoreGenericQuerysetInstance,
+)
+from core_utils.utils.cache import is_shared_cache
+from core_utils.utils.constants import CORE_UTILS_CACHED_SESSION_ENGINES
+
+CORE_UTILS_INDEX_CHECK_TAG = "indexes"
+
+
+def iter_view_classes(patterns : List, prefix : str = "") -> Iterator[tuple] :
+    """
+    Yields (route, view class) for every class-based view in the URLconf.
+    """
+    for pattern in patterns :
+        if isinstance(pattern, URLResolver) :
+            yield from iter_view_classes(pattern.url_patterns, prefix + str(pattern.pattern))
+        elif isinstance(pattern, URLPattern) :
+            #? DRF sets `cls`, Django's View.as_view() sets `view_class`
+            view_class = getattr(pattern.callback, "cls", None) or getattr(pattern.callback, "view_class", None)
+            if view_class is not None :
+                yield prefix + str(pattern.pattern), view_class
+
+
+def get_indexed_fields(model : Type[Model]) -> Set[str] :
+    """
+    Names of the fields that are the leading column of some index.
+    """
+    meta : Options = model._meta
+    indexed_fields : Set[str] = set()
+    for field in meta.concrete_fields :
+        if field.primary_key or field.unique or field.db_index :
+            indexed_fields.add(field.name)
+    for index in meta.indexes :
+        if index.fields :
+            indexed_fields.add(index.fields[0].lstrip("-"))
+    for constraint in meta.constraints :
+        if isinstance(constraint, UniqueConstraint) and constraint.fields :
+            indexed_fields.add(constraint.fields[0])
+    for fields in meta.unique_together :
+        indexed_fields.add(fields[0])
+    return indexed_fields
+
+
+def get_view_lookups(view_class : Type) -> List[tuple] :
+    """
+    Returns (kind, field name) pairs a generic view orders or filters by.
+    """
+    lookups : List[tuple] = []
+    if issubclass(view_class, CoreGenericQueryset) :
+        for ordering in [view_class.default_ordering_field, *getattr(view_class, "ordering_fields", [])] :
+            if ordering :
+                lookups.append(("ordering", ordering.lstrip("-")))
+    if issubclass(view_class, CoreGenericQuerysetInstance) :
+        lookups.append(("lookup", view_class.pk_field))
+    for filter_field in getattr(view_class, "filterset_fields", None) or [] :
+        lookups.append(("filter", filter_field))
+    return lookups
+
+
+def get_field_name(model : Type[Model], lookup : str) -> Optional[str] :
+    """
+    Resolves `lookup` to a local concrete field; None for lookups that span
+    relations or are not fields (annotations), which this check can't judge.
+    """
+    field_name : str = lookup.split("__")[0]
+    if field_name == "pk" :
+        return model._meta.pk.name
+    try :
+        field = model._meta.get_field(field_name)
+    except FieldDoesNotExist :
+        return None
+    if isinstance(field, ForeignObjectRel) or not field.concrete :
+        return None
+    if "__" in lookup and field.is_relation :
+        return None
+    return field.name
+
+
+@register(CORE_UTILS_INDEX_CHECK_TAG)
+def check_generic_view_indexes(app_configs=None, **kwargs) -> List[Warning] :
+    """
+    Warns about generic views whose ordering, lookup or filter fields have no
+    index starting with that field, i.e. lists that sort or scan the whole
+    table. Run alone with `manage.py check --tag indexes`.
+    """
+    warnings : List[Warning] = []
+    seen : Set[tuple] = set()
+    for route, view_class in iter_view_classes(get_resolver().url_patterns) :
+        queryset = getattr(view_class, "queryset", None)
+        if queryset is None or not issubclass(view_class, (CoreGenericQueryset, CoreGenericQuerysetInstance)) :
+            continue
+        model : Type[Model] = queryset.model
+        if app_configs is not None and model._meta.app_config not in app_configs :
+            continue
+        indexed_fields : Set[str] = get_indexed_fields(model)
+
+        for kind, lookup in get_view_lookups(view_class) :
+            field_name : Optional[str] = get_field_name(model, lookup)
+            if field_name is None or field_name in indexed_fields :
+                continue
+            if (view_class, field_name) in seen :
+                continue
+            seen.add((view_class, field_name))
+            warnings.append(
+                Warning(
+                    f"{view_class.__module__}.{view_class.__qualname__} ({route}) uses "
+                    f"{model._meta.label}.{field_name} for {kind} but no index starts with it.",
+                    hint=(
+                        f"Add an index led by '{field_name}' to {model.__name__}.Meta.indexes "
+                        f"(or db_index=True), or stop ordering/filtering by it."
+                    ),
+                    obj=view_class,
+                    id="core_utils.W001",
+                )
+            )
+    return warnings
+
+
+def get_shared_cache_users() -> Dict[str, List[str]] :
+    """
+    Cache aliases that must be shared between workers, with what relies on them.
+    """
+    users : Dict[str, List[str]] = {
+        DEFAULT_CACHE_ALIAS : [
+            "user access versions",
+            "role registry version",
+            "token blacklist filter changes",
+            "token versions",
+        ],
+    }
+    users.setdefault(settings.HANDLER_CACHE_ALIAS, []).append("handler cache generations")
+    if settings.SESSION_ENGINE in CORE_UTILS_CACHED_SESSION_ENGINES :
+        users.setdefault(settings.SESSION_CACHE_ALIAS, []).append("sessions")
+    return users
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_caches(app_configs=None, **kwargs) -> List[Error] :
+    """
+    Deployment check (`manage.py check --deploy`): fails when a cache used
+    to tell the other workers about a change is process-local. With several
+    workers, the change would only be seen by the worker that made it.
+    """
+    errors : List[Error] = []
+    for alias, users in get_shared_cache_users().items() :
+        if is_shared_cache(alias) :
+            continue
+        errors.append(
+            Error(
+                f"The '{alias}' cache is process-local but holds {', '.join(users)}.",
+                hint=f"Point CACHES['{alias}'] at a shared backend (Redis, Memcached, database).",
+                id="core_utils.E001",
+            )
+        )
+    return errors
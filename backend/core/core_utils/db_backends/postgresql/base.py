@@ -0,0 +1,18 @@
+import time
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgreSQLDatabaseWrapper
+from core_utils.db_pool import connection_wait_recorder
+
+
+class DatabaseWrapper(PostgreSQLDatabaseWrapper):
+    """
+    The stock PostgreSQL backend, timing how long each connection took to
+    get: the wait for a free pooled connection, or the connect itself
+    without a pool. Read by `core_utils.db_pool`.
+    """
+
+    def get_new_connection(self, conn_params):
+        started_at : float = time.perf_counter()
+        try :
+            return super().get_new_connection(conn_params)
+        finally :
+            connection_wait_recorder.record(self.alias, time.perf_counter() - started_at)
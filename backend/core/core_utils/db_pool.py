@@ -0,0 +1,86 @@
+import threading
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Optional
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class ConnectionWaitRecorder:
+    """
+    Time spent getting database connections, per process (for metrics) and
+    per request (for the generic views' `Server-Timing` header).
+
+    Fed by the `core_utils.db_backends.postgresql` backend.
+    """
+
+    def __init__(self):
+        self._lock : threading.Lock = threading.Lock()
+        self._totals : Dict[str, Dict[str, float]] = {}
+        self._request_wait : ContextVar[Optional[Dict[str, float]]] = ContextVar("connection_wait", default=None)
+
+    def record(self, alias : str, seconds : float):
+        with self._lock :
+            totals : Dict[str, float] = self._totals.setdefault(alias, {"count" : 0, "total" : 0.0, "max" : 0.0})
+            totals["count"] += 1
+            totals["total"] += seconds
+            totals["max"] = max(totals["max"], seconds)
+        request_wait : Optional[Dict[str, float]] = self._request_wait.get()
+        if request_wait is not None :
+            request_wait["count"] += 1
+            request_wait["total"] += seconds
+
+    def get_totals(self, alias : str) -> Dict[str, float] :
+        with self._lock :
+            return dict(self._totals.get(alias, {"count" : 0, "total" : 0.0, "max" : 0.0}))
+
+    def start_request(self) -> Token :
+        return self._request_wait.set({"count" : 0, "total" : 0.0})
+
+    def finish_request(self, token : Token) -> Dict[str, float] :
+        """
+        Returns:
+            Dict[str, float]: Connections got during the request and the seconds it took.
+        """
+        request_wait : Dict[str, float] = self._request_wait.get() or {"count" : 0, "total" : 0.0}
+        self._request_wait.reset(token)
+        return request_wait
+
+
+connection_wait_recorder : ConnectionWaitRecorder = ConnectionWaitRecorder()
+
+
+def get_pool_metrics(alias : str = DEFAULT_DB_ALIAS) -> Optional[Dict[str, Any]] :
+    """
+    Pool gauges and counters of this process for `alias`, None when it is
+    not pooled (`DB_POOL` off or not PostgreSQL).
+
+    - `in_use` / `available` / `size`: connections lent out, idle, open.
+    - `waiting`: requests queued for a connection right now.
+    - `wait_ms`: total time requests spent queued; `timeouts`: requests
+      that gave up after the pool `timeout`.
+    - `acquire_*`: time to get a connection as measured by the backend,
+      including requests served without queueing.
+    """
+    pool = getattr(connections[alias], "pool", None)
+    if pool is None :
+        return None
+    stats : Dict[str, int] = pool.get_stats()
+    acquire_totals : Dict[str, float] = connection_wait_recorder.get_totals(alias)
+    size : int = stats.get("pool_size", 0)
+    available : int = stats.get("pool_available", 0)
+    return {
+        "size" : size,
+        "min_size" : pool.min_size,
+        "max_size" : pool.max_size,
+        "in_use" : size - available,
+        "available" : available,
+        "waiting" : stats.get("requests_waiting", 0),
+        "requests" : stats.get("requests_num", 0),
+        "requests_queued" : stats.get("requests_queued", 0),
+        "wait_ms" : stats.get("requests_wait_ms", 0),
+        "timeouts" : stats.get("requests_errors", 0),
+        "connections_opened" : stats.get("connections_num", 0),
+        "connections_lost" : stats.get("connections_lost", 0),
+        "acquire_count" : int(acquire_totals["count"]),
+        "acquire_ms_total" : acquire_totals["total"] * 1000,
+        "acquire_ms_max" : acquire_totals["max"] * 1000,
+    }
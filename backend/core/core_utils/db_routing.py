@@ -0,0 +1,204 @@
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from core_utils.utils.constants import (
+    CORE_UTILS_PRIMARY_PIN_CACHE_KEY,
+    CORE_UTILS_REPLICA_LAG_CHECK_INTERVAL,
+)
+
+#? lag of a streaming replica; 0 while it has replayed everything it received,
+#? so an idle primary does not make its replicas look behind. NULL while its
+#? WAL receiver is not streaming: it then receives nothing and only looks caught up
+REPLICA_LAG_SQL : str = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+def get_replica_aliases() -> List[str] :
+    return list(getattr(settings, "DATABASE_REPLICAS", []))
+
+
+class ReplicaLagMonitor:
+    """
+    Measures replica lag at most once per `check_interval` per replica and
+    process, so routing a read costs no extra query in the common case.
+
+    A replica that can't be reached, or that is not streaming from the
+    primary, counts as infinitely behind until the next check. Only one
+    thread measures a replica at a time; the others keep using the last
+    lag meanwhile (infinite before the first one) instead of waiting on its
+    connection.
+    """
+
+    check_interval : float = CORE_UTILS_REPLICA_LAG_CHECK_INTERVAL
+
+    def __init__(self):
+        self._lags : Dict[str, Tuple[float, float]] = {}
+        self._lock : threading.Lock = threading.Lock()
+
+    def measure_lag(self, alias : str) -> float :
+        connection : BaseDatabaseWrapper = connections[alias]
+        if connection.vendor != "postgresql" :
+            return 0.0
+        try :
+            with connection.cursor() as cursor :
+                cursor.execute(REPLICA_LAG_SQL)
+                lag : Any = cursor.fetchone()[0]
+        except DatabaseError :
+            return math.inf
+        return math.inf if lag is None else float(lag)
+
+    def get_lag(self, alias : str) -> float :
+        now : float = time.monotonic()
+        measured_at, lag = self._lags.get(alias, (-math.inf, math.inf))
+        if now - measured_at < self.check_interval :
+            return lag
+        with self._lock :
+            #? another thread may have claimed the check while this one waited
+            measured_at, lag = self._lags.get(alias, (-math.inf, math.inf))
+            if now - measured_at < self.check_interval :
+                return lag
+            #? claim it, so other threads keep the last lag while this one measures
+            self._lags[alias] = (now, lag)
+        #? outside the lock: connecting to an unreachable replica can block for long
+        lag = self.measure_lag(alias)
+        with self._lock :
+            self._lags[alias] = (time.monotonic(), lag)
+        return lag
+
+    def get_healthy_replicas(self) -> List[str] :
+        max_lag : float = settings.DATABASE_REPLICA_MAX_LAG
+        return [alias for alias in get_replica_aliases() if self.get_lag(alias) <= max_lag]
+
+
+replica_lag_monitor : ReplicaLagMonitor = ReplicaLagMonitor()
+
+
+# -----------------------
+# ? Read-Your-Writes
+# -----------------------
+
+def get_primary_pin_key(user : Any) -> Optional[str] :
+    if user is None or not getattr(user, "is_authenticated", False) or user.pk is None :
+        return None
+    return CORE_UTILS_PRIMARY_PIN_CACHE_KEY.format(user_id=user.pk)
+
+
+def pin_to_primary(user : Any):
+    """
+    Sends `user`'s reads to the primary for `DATABASE_READ_YOUR_WRITES_WINDOW`
+    seconds, long enough for replicas to catch up with what they just wrote.
+    The pin lives in the cache, so it holds across workers when the cache
+    is shared.
+    """
+    key : Optional[str] = get_primary_pin_key(user)
+    if key is not None and get_replica_aliases() :
+        cache.set(key, True, timeout=settings.DATABASE_READ_YOUR_WRITES_WINDOW)
+
+
+def is_pinned_to_primary(user : Any) -> bool :
+    key : Optional[str] = get_primary_pin_key(user)
+    return key is not None and bool(cache.get(key))
+
+
+# -----------------------
+# ? Routing Context
+# -----------------------
+
+replica_alias_var : ContextVar[Optional[str]] = ContextVar("replica_alias", default=None)
+
+
+def choose_replica(user : Any = None) -> Optional[str] :
+    """
+    A replica within the lag threshold, or None when reads should stay on
+    the primary (no healthy replica, or `user` wrote recently).
+    """
+    if not get_replica_aliases() or is_pinned_to_primary(user) :
+        return None
+    replicas : List[str] = replica_lag_monitor.get_healthy_replicas()
+    return random.choice(replicas) if replicas else None
+
+
+def start_replica_reads(user : Any = None) -> Optional[Token] :
+    """
+    Routes reads to one replica until `stop_replica_reads(token)`.
+
+    Returns:
+        Optional[Token]: None when reads stay on the primary.
+    """
+    alias : Optional[str] = choose_replica(user=user)
+    if alias is None :
+        return None
+    return replica_alias_var.set(alias)
+
+
+def stop_replica_reads(token : Optional[Token]):
+    if token is not None :
+        replica_alias_var.reset(token)
+
+
+@contextmanager
+def replica_reads(user : Any = None) -> Iterator[Optional[str]] :
+    """
+    Reads inside the block go to one healthy replica (the same one for the
+    whole block), unless `user` is pinned to the primary.
+    """
+    token : Optional[Token] = start_replica_reads(user=user)
+    try :
+        yield replica_alias_var.get()
+    finally :
+        stop_replica_reads(token)
+
+
+@contextmanager
+def primary_reads() -> Iterator[None] :
+    """
+    Reads inside the block go to the primary, even within `replica_reads`.
+    """
+    token : Token = replica_alias_var.set(None)
+    try :
+        yield
+    finally :
+        replica_alias_var.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Writes, migrations and reads outside `replica_reads` use the primary
+    (`default`). Reads inside it use the replica chosen for the block.
+
+    Reads are only sent to replicas where a view opts in (the generic list
+    and get views), so code that reads then writes keeps seeing its own data.
+    """
+
+    def db_for_read(self, model, **hints) -> Optional[str] :
+        return replica_alias_var.get()
+
+    def db_for_write(self, model, **hints) -> Optional[str] :
+        #? without this, saving an instance read from a replica would write to it
+        return DEFAULT_DB_ALIAS if get_replica_aliases() else None
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool] :
+        databases : set = {DEFAULT_DB_ALIAS, *get_replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases :
+            return True
+        return None
+
+    def allow_migrate(self, db : str, app_label : str, model_name : Optional[str] = None, **hints) -> Optional[bool] :
+        #? replicas receive the schema through replication
+        if db in get_replica_aliases() :
+            return False
+        return None
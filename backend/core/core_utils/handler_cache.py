@@ -0,0 +1,354 @@
+import functools
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from core_utils.db_routing import primary_reads
+from core_utils.utils.cache import is_shared_cache
+from core_utils.utils.constants import (
+    CORE_UTILS_HANDLER_CACHE_GENERATION_KEY,
+    CORE_UTILS_HANDLER_CACHE_KEY,
+    CORE_UTILS_HANDLER_CACHE_LOCK_TIMEOUT,
+    CORE_UTILS_HANDLER_CACHE_POLL_INTERVAL,
+    CORE_UTILS_HANDLER_CACHE_TIMEOUT,
+)
+
+#? tells a miss apart from a cached None
+MISSING : object = object()
+
+
+class LocalLRUCache:
+    """
+    Per-process cache holding at most `max_entries` values, evicting the
+    least recently used one first. Thread-safe.
+
+    Values are returned as stored, not copied: callers must not mutate them.
+    """
+
+    def __init__(self, max_entries : int):
+        self.max_entries : int = max_entries
+        self._entries : "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock : threading.Lock = threading.Lock()
+
+    def get(self, key : str, default : Any = MISSING) -> Any :
+        with self._lock :
+            entry : Optional[Tuple[float, Any]] = self._entries.get(key)
+            if entry is None :
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic() :
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key : str, value : Any, timeout : float):
+        if self.max_entries <= 0 :
+            return
+        with self._lock :
+            self._entries[key] = (time.monotonic() + timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries :
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock :
+            self._entries.clear()
+
+    def __len__(self) -> int :
+        return len(self._entries)
+
+
+class SingleFlight:
+    """
+    Per-key locks, so only one thread of the process computes a given
+    missing value while the others wait for it.
+    """
+
+    def __init__(self):
+        self._flights : Dict[str, List] = {}
+        self._lock : threading.Lock = threading.Lock()
+
+    @contextmanager
+    def hold(self, key : str) -> Iterator[None] :
+        with self._lock :
+            flight : List = self._flights.setdefault(key, [threading.Lock(), 0])
+            flight[1] += 1
+        try :
+            with flight[0] :
+                yield
+        finally :
+            with self._lock :
+                flight[1] -= 1
+                if not flight[1] :
+                    del self._flights[key]
+
+
+class TieredCache:
+    """
+    Cache-aside storage for handler results: a bounded per-process LRU in
+    front of the shared Django cache `HANDLER_CACHE_ALIAS`.
+
+    Every model a cached value depends on has a generation token in the
+    shared cache, and the tokens are part of the value's key. Invalidating
+    a model replaces its token, which orphans every value built from it in
+    all processes at once; the orphans expire on their own. A lookup reads
+    the tokens with one `get_many`, then is served by the local tier
+    without unpickling, or by the shared tier.
+
+    Misses are computed once: one thread per process (`SingleFlight`) and,
+    through a lock key added to the shared cache, one process at a time.
+    Processes that lose the lock poll the shared cache for the value and
+    compute it themselves if it does not show up within the lock timeout.
+    Values are computed against the primary: a lagging replica could
+    otherwise store rows older than the generation they are keyed on.
+    """
+
+    lock_timeout : int = CORE_UTILS_HANDLER_CACHE_LOCK_TIMEOUT
+    poll_interval : float = CORE_UTILS_HANDLER_CACHE_POLL_INTERVAL
+
+    def __init__(self, max_entries : Optional[int] = None):
+        self.local : LocalLRUCache = LocalLRUCache(
+            settings.HANDLER_CACHE_LOCAL_MAX_ENTRIES if max_entries is None else max_entries
+        )
+        self.flights : SingleFlight = SingleFlight()
+
+    @property
+    def shared(self):
+        return caches[settings.HANDLER_CACHE_ALIAS]
+
+    # -----------------------
+    # ? Generations
+    # -----------------------
+
+    def get_generations(self, labels : Iterable[str]) -> List[str] :
+        keys : Dict[str, str] = {
+            label : CORE_UTILS_HANDLER_CACHE_GENERATION_KEY.format(model=label) for label in labels
+        }
+        generations : Dict[str, Any] = self.shared.get_many(list(keys.values()))
+        for key in keys.values() :
+            if key not in generations :
+                #? a fresh token rather than a counter: a token evicted from the cache
+                #? must not come back with a value older entries were built with
+                token : str = uuid.uuid4().hex
+                if not self.shared.add(key, token, timeout=None) :
+                    token = self.shared.get(key) or token
+                generations[key] = token
+        return [generations[key] for key in keys.values()]
+
+    def invalidate(self, label : str):
+        self.shared.set(CORE_UTILS_HANDLER_CACHE_GENERATION_KEY.format(model=label), uuid.uuid4().hex, timeout=None)
+
+    # -----------------------
+    # ? Lookup
+    # -----------------------
+
+    def get_or_set(self, key : str, compute : Callable[[], Any], timeout : int) -> Any :
+        value : Any = self.local.get(key)
+        if value is not MISSING :
+            return value
+        value = self.shared.get(key, MISSING)
+        if value is not MISSING :
+            self.local.set(key, value, timeout)
+            return value
+        with self.flights.hold(key) :
+            #? filled by the thread that held the flight
+            value = self.local.get(key)
+            if value is not MISSING :
+                return value
+            value = self.compute_once(key, compute, timeout)
+        self.local.set(key, value, timeout)
+        return value
+
+    def compute_once(self, key : str, compute : Callable[[], Any], timeout : int) -> Any :
+        lock_key : str = f"{key}:lock"
+        if self.shared.add(lock_key, 1, timeout=self.lock_timeout) :
+            try :
+                value : Any = self.compute_on_primary(compute)
+                self.shared.set(key, value, timeout=timeout)
+            finally :
+                self.shared.delete(lock_key)
+            return value
+        value = self.wait_for(key)
+        if value is MISSING :
+            #? the process holding the lock is slow or gone
+            value = self.compute_on_primary(compute)
+            self.shared.set(key, value, timeout=timeout)
+        return value
+
+    def compute_on_primary(self, compute : Callable[[], Any]) -> Any :
+        with primary_reads() :
+            return compute()
+
+    def wait_for(self, key : str) -> Any :
+        deadline : float = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline :
+            time.sleep(self.poll_interval)
+            value : Any = self.shared.get(key, MISSING)
+            if value is not MISSING :
+                return value
+        return MISSING
+
+
+tiered_cache : TieredCache = TieredCache()
+
+
+# -----------------------
+# ? Invalidation
+# -----------------------
+
+#? labels of the models some cached method depends on; changes to other models are ignored
+watched_labels : set = set()
+
+
+def get_model_label(model : Union[str, Type[Model]]) -> str :
+    if isinstance(model, str) :
+        return model.lower()
+    return model._meta.label_lower
+
+
+def invalidate_handler_cache(*models : Union[str, Type[Model]], using : Optional[str] = None):
+    """
+    Drops the cached values depending on `models`, once the current
+    transaction on `using` commits (at once outside a transaction).
+
+    Called for every watched model on `post_save`, `post_delete`,
+    `m2m_changed` and the bulk writes of `CoreGenericQuerySet`; call it
+    directly after raw SQL or `QuerySet` writes that send no signal.
+    """
+    labels : List[str] = [get_model_label(model) for model in models]
+
+    def invalidate():
+        for label in labels :
+            tiered_cache.invalidate(label)
+
+    #? before the commit, a concurrent miss could cache the old rows under the new generation
+    transaction.on_commit(invalidate, using=using, robust=True)
+
+
+def invalidate_on_change(sender, using : Optional[str] = None, **kwargs):
+    """
+    `post_save` / `post_delete` / `core_generic_rows_changed` receiver.
+    """
+    invalidate_handler_cache(sender, using=using)
+
+
+def invalidate_on_m2m_change(sender, instance, action : str, model, using : Optional[str] = None, **kwargs):
+    """
+    `m2m_changed` receiver: a relation change invalidates both sides.
+    """
+    if not action.startswith("post_") :
+        return
+    labels : List[str] = [
+        label for label in {get_model_label(type(instance)), get_model_label(model), get_model_label(sender)}
+        if label in watched_labels
+    ]
+    if labels :
+        invalidate_handler_cache(*labels, using=using)
+
+
+def watch_model(model : Type[Model]):
+    from core_utils.utils.generics.generic_models import core_generic_rows_changed
+
+    label : str = get_model_label(model)
+    #? per sender, so deletes of unwatched models keep their fast path
+    for signal in (post_save, post_delete, core_generic_rows_changed) :
+        signal.connect(invalidate_on_change, sender=model, dispatch_uid=f"core_utils.handler_cache:{label}")
+
+
+def watch_models(models : Iterable[Union[str, Type[Model]]]) -> List[str] :
+    labels : List[str] = []
+    for model in models :
+        label : str = get_model_label(model)
+        labels.append(label)
+        if label in watched_labels :
+            continue
+        watched_labels.add(label)
+        if isinstance(model, str) :
+            #? runs once the model is registered, at once if it already is
+            apps.lazy_model_operation(watch_model, tuple(label.split(".")))
+        else :
+            watch_model(model)
+    return labels
+
+
+# -----------------------
+# ? Decorator
+# -----------------------
+
+def get_key_part(value : Any) -> Any :
+    """
+    Stable, hashable stand-in for a method argument.
+    """
+    if isinstance(value, Model) :
+        return (value._meta.label_lower, value.pk)
+    if isinstance(value, dict) :
+        return tuple(sorted((str(key), get_key_part(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)) :
+        parts : List[Any] = [get_key_part(item) for item in value]
+        return tuple(sorted(parts, key=repr) if isinstance(value, (set, frozenset)) else parts)
+    return value
+
+
+def cache_aside(
+    depends_on : Iterable[Union[str, Type[Model]]],
+    timeout : int = CORE_UTILS_HANDLER_CACHE_TIMEOUT,
+    key : Optional[Callable[..., Any]] = None,
+):
+    """
+    Caches what a `CoreGenericBaseHandler` method returns in the
+    `tiered_cache`, until `timeout` or until a model of `depends_on`
+    changes.
+
+    The value is keyed on the method and its arguments (model instances by
+    pk), not on the handler: pass `key(handler, *args, **kwargs)` when the
+    result also depends on `handler.request` or `handler.data`. Return
+    plain, evaluated data (not a lazy QuerySet), and treat it as read-only.
+
+    When `HANDLER_CACHE_ALIAS` is process-local (LocMem), the method is
+    called directly: the generation tokens would not see the invalidations
+    made by other workers.
+
+    Args:
+        depends_on (Iterable[Union[str, Type[Model]]]): Models (or "app_label.ModelName")
+                                                        read to build the value.
+        timeout (int): Seconds a value lives in either tier.
+        key (Optional[Callable[..., Any]]): Extra key parts built from the call.
+
+    Example:
+        @cache_aside(depends_on=[PropertyModel, "user_auth.UserRoleModel"])
+        def get_available_rooms(self, property_id : int) -> List[Dict] :
+            ...
+    """
+    labels : List[str] = watch_models(depends_on)
+
+    def decorator(method : Callable) -> Callable :
+        method_name : str = f"{method.__module__}.{method.__qualname__}"
+
+        @functools.wraps(method)
+        def wrapper(handler, *args, **kwargs):
+            if not is_shared_cache(settings.HANDLER_CACHE_ALIAS) :
+                return method(handler, *args, **kwargs)
+            key_parts : Any = get_key_part((args, kwargs, key(handler, *args, **kwargs) if key else None))
+            digest : str = hashlib.sha1(
+                repr((tiered_cache.get_generations(labels), key_parts)).encode()
+            ).hexdigest()
+            return tiered_cache.get_or_set(
+                CORE_UTILS_HANDLER_CACHE_KEY.format(method=method_name, digest=digest),
+                lambda : method(handler, *args, **kwargs),
+                timeout,
+            )
+
+        wrapper.depends_on = labels
+        return wrapper
+
+    return decorator
@@ -0,0 +1,244 @@
+import copy
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from django.db import router, transaction
+from django.db.models import Field, Model
+from django.utils import timezone
+from core_utils.utils.enums import HistoryActionEnum
+
+
+@lru_cache(maxsize=None)
+def get_history_fields(model) -> Tuple[Field, ...] :
+    """
+    Versioned columns of `model`: every concrete field except the primary
+    key, the `core_generic_*` audit columns (the record has its own
+    `changed_by` / `changed_at`) and `history_excluded_fields`.
+    """
+    excluded_fields : Tuple[str, ...] = getattr(model, "history_excluded_fields", ())
+    return tuple(
+        field for field in model._meta.concrete_fields
+        if not field.primary_key
+        and not field.name.startswith("core_generic_")
+        and field.name not in excluded_fields
+    )
+
+
+def get_history_attnames(model, names : Optional[Iterable[str]] = None) -> List[str] :
+    """
+    Attnames of the versioned columns, limited to `names` (field names or
+    attnames) when given.
+    """
+    fields : Tuple[Field, ...] = get_history_fields(model)
+    if names is None :
+        return [field.attname for field in fields]
+    names = set(names)
+    return [field.attname for field in fields if field.name in names or field.attname in names]
+
+
+def copy_value(value : Any) -> Any :
+    #? the record is written after commit, JSON values may be mutated by then
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
+class HistoryRecorder:
+    """
+    Collects history records and writes each recorded batch (one save or
+    bulk call) with one bulk INSERT once the surrounding transaction commits.
+
+    Batches are queued with the public `transaction.on_commit`, so a batch
+    recorded in a savepoint that rolls back is dropped with it. Outside a
+    transaction, records are written at once.
+    """
+
+    def write(self, records : List, using : str):
+        from core_utils.models import HistoryRecordModel
+
+        if records :
+            HistoryRecordModel.objects.using(using).bulk_create(records)
+
+    def add(self, records : List, using : str):
+        if not records :
+            return
+        #? the records may be routed to another database than the rows they describe
+        from core_utils.models import HistoryRecordModel
+
+        history_using : str = router.db_for_write(HistoryRecordModel)
+        #? robust: the change is committed already, a failed history write must not fail the request
+        transaction.on_commit(lambda : self.write(records, history_using), using=using, robust=True)
+
+    def build(
+        self,
+        model,
+        pk : Any,
+        action : HistoryActionEnum,
+        changes : Optional[Dict[str, Any]] = None,
+        changed_by_id : Optional[int] = None,
+        changed_at : Optional[datetime] = None,
+    ):
+        from core_utils.models import HistoryRecordModel
+
+        return HistoryRecordModel(
+            model=model._meta.label_lower,
+            object_pk=str(pk),
+            action=action.value,
+            changes=changes,
+            changed_by_id=changed_by_id,
+            changed_at=changed_at or timezone.now(),
+        )
+
+    # -----------------------
+    # ? Recording
+    # -----------------------
+
+    def get_stored_values(self, instance : Model, using : str) -> Optional[Dict[str, Any]] :
+        """
+        Versioned column values of `instance` as stored: its load snapshot
+        when that covers them, else one SELECT.
+        """
+        attnames : List[str] = get_history_attnames(type(instance))
+        loaded_values : Optional[Dict[str, Any]] = getattr(instance, "_loaded_values", None)
+        if loaded_values is not None and all(attname in loaded_values for attname in attnames) :
+            return {attname : loaded_values[attname] for attname in attnames}
+        return type(instance)._base_manager.using(using).filter(pk=instance.pk).values(*attnames).first()
+
+    def record_save(
+        self,
+        instance : Model,
+        created : bool,
+        stored_values : Optional[Dict[str, Any]],
+        update_fields : Optional[Iterable[str]],
+        using : str,
+    ):
+        model = type(instance)
+        if created :
+            self.add([
+                self.build(model, instance.pk, HistoryActionEnum.CREATE, changed_by_id=instance.core_generic_created_by_id)
+            ], using)
+            return
+        changes : Dict[str, List] = {}
+        for attname in get_history_attnames(model, update_fields) :
+            old_value : Any = (stored_values or {}).get(attname)
+            new_value : Any = instance.__dict__.get(attname)
+            if old_value != new_value :
+                changes[attname] = [copy_value(old_value), copy_value(new_value)]
+        if changes :
+            self.add([
+                self.build(model, instance.pk, HistoryActionEnum.UPDATE, changes, instance.core_generic_updated_by_id)
+            ], using)
+
+    def record_created(self, model, objs : Iterable[Model], using : str):
+        changed_at : datetime = timezone.now()
+        self.add([
+            self.build(model, obj.pk, HistoryActionEnum.CREATE, changed_by_id=obj.core_generic_created_by_id, changed_at=changed_at)
+            for obj in objs if obj.pk is not None
+        ], using)
+
+    def record_updated(
+        self,
+        model,
+        old_rows : Dict[Any, Dict[str, Any]],
+        new_rows : Dict[Any, Dict[str, Any]],
+        using : str,
+        changed_by_id : Optional[int] = None,
+        changed_by_ids : Optional[Dict[Any, Optional[int]]] = None,
+    ):
+        """
+        Args:
+            old_rows / new_rows (Dict[Any, Dict[str, Any]]): pk -> {attname: value}
+                                                             of the written columns.
+            changed_by_ids (Optional[Dict[Any, Optional[int]]]): Per pk, overrides `changed_by_id`.
+        """
+        changed_at : datetime = timezone.now()
+        records : List = []
+        for pk, new_values in new_rows.items() :
+            old_values : Dict[str, Any] = old_rows.get(pk, {})
+            changes : Dict[str, List] = {
+                attname : [copy_value(old_values.get(attname)), copy_value(value)]
+                for attname, value in new_values.items()
+                if old_values.get(attname) != value
+            }
+            if changes :
+                records.append(self.build(
+                    model, pk, HistoryActionEnum.UPDATE, changes,
+                    changed_by_ids.get(pk) if changed_by_ids is not None else changed_by_id, changed_at,
+                ))
+        self.add(records, using)
+
+    def record_deleted(
+        self,
+        model,
+        old_rows : Dict[Any, Dict[str, Any]],
+        using : str,
+        changed_by_id : Optional[int] = None,
+    ):
+        changed_at : datetime = timezone.now()
+        self.add([
+            self.build(
+                model, pk, HistoryActionEnum.DELETE,
+                {attname : copy_value(value) for attname, value in old_values.items()},
+                changed_by_id, changed_at,
+            )
+            for pk, old_values in old_rows.items()
+        ], using)
+
+    # -----------------------
+    # ? Reading
+    # -----------------------
+
+    def get_history(self, model, pk : Any):
+        """
+        History records of one row, newest first.
+        """
+        from core_utils.models import HistoryRecordModel
+
+        return HistoryRecordModel.objects.filter(
+            model=model._meta.label_lower, object_pk=str(pk)
+        ).order_by("-changed_at", "-id")
+
+    def get_as_of(self, model, pk : Any, at : datetime, using : Optional[str] = None) -> Optional[Model] :
+        """
+        The row as it was at `at`, or None if it did not exist then.
+
+        Starts from the current row (or the last delete record) and undoes
+        only the records newer than `at`, so the cost follows the number of
+        changes since then, not the length of the history.
+
+        The instance is read-only in spirit: only the versioned columns are
+        loaded; the audit columns and `history_excluded_fields` are deferred
+        and read their current values if accessed.
+        """
+        using = using or router.db_for_read(model)
+        records : List = list(self.get_history(model, pk).filter(changed_at__gt=at))
+        attnames : List[str] = get_history_attnames(model)
+
+        values : Optional[Dict[str, Any]] = None
+        if not records or records[0].action != HistoryActionEnum.DELETE.value :
+            values = model._base_manager.using(using).filter(pk=pk).values(*attnames).first()
+        for record in records :
+            if record.action == HistoryActionEnum.CREATE.value :
+                values : Optional[Dict[str, Any]] = None
+            elif record.action == HistoryActionEnum.DELETE.value :
+                values = dict(record.changes or {})
+            elif values is not None :
+                for attname, (old_value, _new_value) in (record.changes or {}).items() :
+                    values[attname] = old_value
+        if values is None :
+            return None
+
+        fields : Dict[str, Field] = {field.attname : field for field in get_history_fields(model)}
+        field_names : List[str] = []
+        row : List[Any] = []
+        #? from_db takes the loaded columns in concrete field order, the rest are deferred
+        for field in model._meta.concrete_fields :
+            if field.primary_key :
+                column_value : Any = pk
+            elif field.attname in fields and field.attname in values :
+                column_value : Any = values[field.attname]
+            else :
+                continue
+            field_names.append(field.attname)
+            row.append(field.to_python(column_value))
+        return model.from_db(using, field_names, row)
+
+history_recorder : HistoryRecorder = HistoryRecorder()
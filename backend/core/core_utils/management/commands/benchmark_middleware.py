@@ -0,0 +1,86 @@
+import time
+from typing import List
+from django.conf import settings
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.handlers.base import BaseHandler
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import re_path
+
+STOCK_MIDDLEWARE : List[str] = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+
+def benchmark_view(request):
+    #? same access DRF's SessionAuthentication makes when no token matched
+    user = getattr(request, "user", None)
+    if user is not None :
+        user.is_authenticated
+    return HttpResponse("ok")
+
+
+class BenchmarkUrlConf:
+    urlpatterns : List = [re_path(r"", benchmark_view)]
+
+
+class Command(BaseCommand):
+    help : str = "Measures per-request middleware overhead, stock chain vs path-routed chain"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000, help="Requests per run")
+
+    def get_handler(self, middleware : List[str]) -> BaseHandler :
+        with override_settings(MIDDLEWARE=middleware):
+            handler : BaseHandler = BaseHandler()
+            handler.load_middleware()
+        return handler
+
+    def measure(self, label : str, handler : BaseHandler, path : str, session_key : str, requests : int):
+        factory : RequestFactory = RequestFactory(SERVER_NAME="localhost")
+        factory.cookies[settings.SESSION_COOKIE_NAME] = session_key
+
+        def send():
+            request = factory.get(path)
+            request.urlconf = BenchmarkUrlConf
+            return handler.get_response(request)
+
+        for _ in range(50) :
+            send()
+
+        with CaptureQueriesContext(connection) as queries :
+            started_at : float = time.perf_counter()
+            for _ in range(requests) :
+                send()
+            elapsed : float = time.perf_counter() - started_at
+
+        self.stdout.write(
+            f"{label:<28} {path:<12} {elapsed / requests * 1e6:8.1f} us/request  "
+            f"{len(queries) / requests:.2f} queries/request"
+        )
+
+    def handle(self, *args, **options):
+        requests : int = options["requests"]
+
+        #? a real session cookie, so the session store is actually read
+        session : SessionStore = SessionStore()
+        session["benchmark"] = True
+        session.create()
+
+        stock_handler : BaseHandler = self.get_handler(STOCK_MIDDLEWARE)
+        routed_handler : BaseHandler = self.get_handler(settings.MIDDLEWARE)
+        try :
+            for path in ("/api/ping/", "/admin/ping/") :
+                self.measure("stock MIDDLEWARE", stock_handler, path, session.session_key, requests)
+                self.measure("routed MIDDLEWARE", routed_handler, path, session.session_key, requests)
+        finally :
+            session.delete()
@@ -0,0 +1,63 @@
+import time
+import uuid
+from typing import Callable, Optional
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from core_utils.utils.uuid7 import uuid7
+
+
+class Command(BaseCommand):
+    help : str = "Compares insert throughput and primary key index size, uuid4 vs uuid7 (PostgreSQL)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=200000)
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def measure(self, label : str, generate : Callable[[], uuid.UUID], rows : int, batch_size : int):
+        table : str = f"benchmark_uuid_keys_{label}"
+        with connection.cursor() as cursor :
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            cursor.execute(
+                f"CREATE TABLE {table} (id uuid CONSTRAINT {table}_pkey PRIMARY KEY, payload text)"
+            )
+            try :
+                cursor.execute("SELECT pg_current_wal_lsn()")
+                start_lsn : str = cursor.fetchone()[0]
+                started_at : float = time.perf_counter()
+                for offset in range(0, rows, batch_size) :
+                    with transaction.atomic():
+                        cursor.executemany(
+                            f"INSERT INTO {table} (id, payload) VALUES (%s, %s)",
+                            [(generate(), "x" * 32) for _ in range(min(batch_size, rows - offset))],
+                        )
+                elapsed : float = time.perf_counter() - started_at
+
+                cursor.execute(
+                    "SELECT pg_relation_size(%s), pg_wal_lsn_diff(pg_current_wal_lsn(), %s)",
+                    [f"{table}_pkey", start_lsn],
+                )
+                index_size, wal_bytes = cursor.fetchone()
+                leaf_density : Optional[float] = None
+                if self.has_pgstattuple :
+                    cursor.execute("SELECT avg_leaf_density FROM pgstatindex(%s)", [f"{table}_pkey"])
+                    leaf_density = cursor.fetchone()[0]
+            finally :
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+        density : str = f", leaf density {leaf_density:.0f}%" if leaf_density is not None else ""
+        self.stdout.write(
+            f"{label}: {rows / elapsed:,.0f} rows/s, "
+            f"pkey index {index_size / 1024 / 1024:.1f} MiB{density}, "
+            f"WAL {wal_bytes / 1024 / 1024:.1f} MiB"
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql" :
+            raise CommandError("This benchmark needs PostgreSQL.")
+
+        with connection.cursor() as cursor :
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pgstattuple'")
+            self.has_pgstattuple : bool = cursor.fetchone() is not None
+
+        self.measure("uuid4", uuid.uuid4, options["rows"], options["batch_size"])
+        self.measure("uuid7", uuid7, options["rows"], options["batch_size"])
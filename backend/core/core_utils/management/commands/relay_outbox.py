@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from core_utils.outbox import OutboxRelay
+from core_utils.utils.constants import (
+    CORE_UTILS_OUTBOX_BATCH_SIZE,
+    CORE_UTILS_OUTBOX_POLL_INTERVAL,
+)
+
+
+class Command(BaseCommand):
+    help : str = "Drains the outbox in batches (SELECT ... FOR UPDATE SKIP LOCKED) to outbox_events_relayed receivers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=CORE_UTILS_OUTBOX_BATCH_SIZE)
+        parser.add_argument("--loop", action="store_true", help="Keep polling instead of exiting once empty")
+        parser.add_argument("--interval", type=float, default=CORE_UTILS_OUTBOX_POLL_INTERVAL, help="Seconds between polls when idle")
+        parser.add_argument("--max-batches", type=int, default=None)
+
+    def handle(self, *args, **options):
+        relay = OutboxRelay(batch_size=options["batch_size"], poll_interval=options["interval"])
+        relayed = relay.run(
+            loop=options["loop"],
+            max_batches=options["max_batches"],
+            log=self.stdout.write,
+        )
+        self.stdout.write(f"Relayed {relayed} outbox events")
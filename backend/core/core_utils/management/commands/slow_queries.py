@@ -0,0 +1,35 @@
+import json
+from typing import Any, Dict, List
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from core_utils.slow_queries import aggregate_entries, iter_entries, iter_log_files
+
+
+class Command(BaseCommand):
+    help : str = "Lists the query templates with the most total time in the slow query log"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=10)
+        parser.add_argument("--file", default=None, help="Log file (default: SLOW_QUERY_LOG_FILE and its backups)")
+        parser.add_argument("--plans", action="store_true", help="Print the last captured plan of each template")
+
+    def handle(self, *args, **options):
+        log_file : str = options["file"] or str(settings.SLOW_QUERY_LOG_FILE)
+        paths : List[str] = iter_log_files(log_file)
+        if not paths :
+            raise CommandError(f"No slow query log at {log_file}.")
+
+        templates : List[Dict[str, Any]] = aggregate_entries(iter_entries(paths))[:options["top"]]
+        if not templates :
+            self.stdout.write("No slow queries recorded.")
+            return
+        for rank, stats in enumerate(templates, start=1) :
+            top_origin, top_origin_count = max(stats["views"].items(), key=lambda item : item[1])
+            self.stdout.write(
+                f"#{rank} total {stats['total_ms']:,.0f} ms  count {stats['count']}  "
+                f"avg {stats['avg_ms']:,.1f} ms  max {stats['max_ms']:,.1f} ms"
+            )
+            self.stdout.write(f"    from {top_origin} ({top_origin_count}/{stats['count']})")
+            self.stdout.write(f"    {stats['template'][:500]}")
+            if options["plans"] and stats["plan"] is not None :
+                self.stdout.write("    plan: " + json.dumps(stats["plan"])[:2000])
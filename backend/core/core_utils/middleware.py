@@ -0,0 +1,77 @@
+from contextvars import Token
+from typing import Optional, Tuple
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+from core_utils.audit import AuditContext, audit_context_var
+
+
+class SessionFreePathMiddlewareMixin:
+    """
+    Skips the wrapped middleware for paths under `SESSION_FREE_PATH_PREFIXES`.
+
+    Token-authenticated API routes need no session, CSRF cookie, messages or
+    session-backed `request.user`, so for those paths the request goes straight
+    to the next middleware: no hooks run and nothing is read from the session
+    store. Every other path (e.g. `/admin/`) gets the stock behaviour.
+
+    The routed classes subclass the Django ones, so checks that look for them
+    in `MIDDLEWARE` (admin.E408-E410) keep passing.
+    """
+
+    def is_session_free_path(self, path : str) -> bool :
+        prefixes : Tuple[str, ...] = tuple(settings.SESSION_FREE_PATH_PREFIXES)
+        return bool(prefixes) and path.startswith(prefixes)
+
+    def __call__(self, request):
+        if self.is_session_free_path(request.path_info) :
+            #? returns a coroutine in async mode, the caller awaits it
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class RoutedSessionMiddleware(SessionFreePathMiddlewareMixin, SessionMiddleware):
+    pass
+
+
+class RoutedAuthenticationMiddleware(SessionFreePathMiddlewareMixin, AuthenticationMiddleware):
+    pass
+
+
+class RoutedMessageMiddleware(SessionFreePathMiddlewareMixin, MessageMiddleware):
+    pass
+
+
+class RoutedCsrfViewMiddleware(SessionFreePathMiddlewareMixin, CsrfViewMiddleware):
+
+    def process_view(self, request, callback, callback_args, callback_kwargs) -> Optional[object] :
+        #? process_view is called by the handler, outside of __call__
+        if self.is_session_free_path(request.path_info) :
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class AuditContextMiddleware:
+    """
+    Opens an audit context per request, so CoreGenericModel writes stamp
+    `core_generic_created_by` / `core_generic_updated_by` with the
+    authenticated user.
+
+    `request.user` is read when the first row is written rather than here,
+    since DRF authenticates (JWT) inside the view; on session-free paths
+    `request.user` is only set by then.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token : Token = audit_context_var.set(
+            AuditContext(get_user=lambda : getattr(request, "user", None))
+        )
+        try :
+            return self.get_response(request)
+        finally :
+            audit_context_var.reset(token)
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEventModel',
+            fields=[
+                ('id', models.BigAutoField(db_column='OUTBOX_EVENT_ID', primary_key=True, serialize=False)),
+                ('model', models.CharField(db_column='MODEL', max_length=100)),
+                ('object_pk', models.CharField(db_column='OBJECT_PK', max_length=64)),
+                ('action', models.CharField(choices=[('C', 'Create'), ('U', 'Update'), ('D', 'Delete')], db_column='ACTION', max_length=1)),
+                ('fields', models.JSONField(blank=True, db_column='FIELDS', null=True)),
+                ('created_at', models.DateTimeField(db_column='CREATED_AT', default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:29
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core_utils', '0001_initial'),
+        ('user_auth', '0005_core_generic_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HistoryRecordModel',
+            fields=[
+                ('id', models.BigAutoField(db_column='HISTORY_RECORD_ID', primary_key=True, serialize=False)),
+                ('model', models.CharField(db_column='MODEL', max_length=100)),
+                ('object_pk', models.CharField(db_column='OBJECT_PK', max_length=64)),
+                ('action', models.CharField(choices=[('C', 'Create'), ('U', 'Update'), ('D', 'Delete')], db_column='ACTION', max_length=1)),
+                ('changes', models.JSONField(blank=True, db_column='CHANGES', encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('changed_at', models.DateTimeField(db_column='CHANGED_AT', default=django.utils.timezone.now)),
+                ('changed_by', models.ForeignKey(blank=True, db_column='CHANGED_BY', db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='user_auth.userdetailmodel')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['model', 'object_pk', 'changed_at'], name='history_record_obj_idx')],
+            },
+        ),
+    ]
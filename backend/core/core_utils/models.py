@@ -0,0 +1,127 @@
+from typing import Any, Dict
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from core_utils.utils.enums import HistoryActionEnum, OutboxActionEnum
+
+# Create your models here.
+
+
+class OutboxEventModel(models.Model):
+    """
+    One row per changed object, written in the same transaction as the
+    change and drained by the `relay_outbox` command.
+
+    Events carry identity only (model, pk, action and, for updates, the
+    field names); consumers re-read the row if they need its values.
+    """
+
+    id = models.BigAutoField(
+        primary_key=True,
+        db_column="OUTBOX_EVENT_ID"
+    )
+
+    model = models.CharField(
+        max_length=100,
+        db_column="MODEL"
+    )
+
+    object_pk = models.CharField(
+        max_length=64,
+        db_column="OBJECT_PK"
+    )
+
+    action = models.CharField(
+        max_length=1,
+        choices=OutboxActionEnum.choices(),
+        db_column="ACTION"
+    )
+
+    fields = models.JSONField(
+        null=True,
+        blank=True,
+        db_column="FIELDS"
+    )
+
+    created_at = models.DateTimeField(
+        default=timezone.now,
+        db_column="CREATED_AT"
+    )
+
+    def to_message(self) -> Dict[str, Any] :
+        """
+        Compact wire format: {"id", "m", "pk", "a", "f", "t"}.
+        """
+        return {
+            "id" : self.id,
+            "m" : self.model,
+            "pk" : self.object_pk,
+            "a" : self.action,
+            "f" : self.fields,
+            "t" : self.created_at.isoformat(),
+        }
+
+
+class HistoryRecordModel(models.Model):
+    """
+    One row per change of a `history_enabled` CoreGenericModel row, written
+    in bulk once the changing transaction commits.
+
+    `changes` holds only what is needed to walk a row back in time:
+        - create: null (the row itself is the state after it)
+        - update: {attname: [old, new]} for the changed columns
+        - delete: {attname: old} for every versioned column
+    """
+
+    id = models.BigAutoField(
+        primary_key=True,
+        db_column="HISTORY_RECORD_ID"
+    )
+
+    model = models.CharField(
+        max_length=100,
+        db_column="MODEL"
+    )
+
+    object_pk = models.CharField(
+        max_length=64,
+        db_column="OBJECT_PK"
+    )
+
+    action = models.CharField(
+        max_length=1,
+        choices=HistoryActionEnum.choices(),
+        db_column="ACTION"
+    )
+
+    changes = models.JSONField(
+        null=True,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+        db_column="CHANGES"
+    )
+
+    #? no constraint: history outlives the user detail row and keeps its id
+    changed_by = models.ForeignKey(
+        'user_auth.UserDetailModel',
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name="+",
+        db_column="CHANGED_BY"
+    )
+
+    changed_at = models.DateTimeField(
+        default=timezone.now,
+        db_column="CHANGED_AT"
+    )
+
+    class Meta:
+        indexes = [
+            #? serves both the per-row timeline and point-in-time lookups
+            models.Index(
+                fields=["model", "object_pk", "changed_at"],
+                name="history_record_obj_idx",
+            ),
+        ]
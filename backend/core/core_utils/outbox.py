@@ -0,0 +1,101 @@
+import time
+from typing import Callable, Iterable, List, Optional
+from django.db import router, transaction
+from django.dispatch import Signal
+from core_utils.utils.constants import (
+    CORE_UTILS_OUTBOX_BATCH_SIZE,
+    CORE_UTILS_OUTBOX_POLL_INTERVAL,
+)
+
+#? sent by the relay with `events` (List[OutboxEventModel]) inside the draining transaction;
+#? a receiver that raises rolls the batch back and it is delivered again (at-least-once)
+outbox_events_relayed : Signal = Signal()
+
+
+def record_outbox_events(
+    model,
+    pks : Iterable,
+    action : str,
+    fields : Optional[Iterable[str]] = None,
+    using : Optional[str] = None,
+):
+    """
+    Inserts one outbox row per pk with a single bulk INSERT.
+
+    Must be called inside the transaction of the change it describes.
+    """
+    from core_utils.models import OutboxEventModel
+
+    model_label : str = model._meta.label_lower
+    field_names : Optional[List[str]] = sorted(fields) if fields else None
+    events : List[OutboxEventModel] = [
+        OutboxEventModel(model=model_label, object_pk=str(pk), action=action, fields=field_names)
+        for pk in pks
+    ]
+    if events :
+        OutboxEventModel.objects.using(using or router.db_for_write(OutboxEventModel)).bulk_create(events)
+
+
+class OutboxRelay:
+    """
+    Drains the outbox in id order.
+
+    Each batch is claimed with `SELECT ... FOR UPDATE SKIP LOCKED`, handed to
+    `outbox_events_relayed` receivers and deleted in the same transaction, so
+    several relays can run side by side without blocking or double-sending.
+    """
+
+    batch_size : int = CORE_UTILS_OUTBOX_BATCH_SIZE
+    poll_interval : float = CORE_UTILS_OUTBOX_POLL_INTERVAL
+
+    def __init__(self, batch_size : Optional[int] = None, poll_interval : Optional[float] = None):
+        self.batch_size = batch_size or self.batch_size
+        self.poll_interval = self.poll_interval if poll_interval is None else poll_interval
+
+    def relay_batch(self) -> int :
+        """
+        Returns:
+            int: Number of events relayed.
+        """
+        from core_utils.models import OutboxEventModel
+
+        using : str = router.db_for_write(OutboxEventModel)
+        with transaction.atomic(using=using):
+            events : List[OutboxEventModel] = list(
+                OutboxEventModel.objects.using(using)
+                .select_for_update(skip_locked=True)
+                .order_by("id")[:self.batch_size]
+            )
+            if not events :
+                return 0
+            outbox_events_relayed.send(sender=OutboxEventModel, events=events)
+            OutboxEventModel.objects.using(using).filter(
+                pk__in=[event.pk for event in events]
+            ).delete()
+        return len(events)
+
+    def run(
+        self,
+        loop : bool = False,
+        max_batches : Optional[int] = None,
+        log : Optional[Callable[[str], None]] = None,
+    ) -> int :
+        """
+        Relays until the outbox is empty, or forever when `loop` is set.
+
+        Returns:
+            int: Number of events relayed.
+        """
+        total_relayed : int = 0
+        batches : int = 0
+        while max_batches is None or batches < max_batches :
+            relayed : int = self.relay_batch()
+            batches += 1
+            total_relayed += relayed
+            if relayed and log :
+                log(f"Relayed {relayed} outbox events ({total_relayed} total)")
+            if relayed < self.batch_size :
+                if not loop :
+                    break
+                time.sleep(self.poll_interval)
+        return total_relayed
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('region_data', '0002_initial'),
+        ('user_auth', '0004_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='citymodel',
+            index=models.Index(fields=['core_generic_created_at', 'id'], name='citymodel_cg_ca_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='citymodel',
+            index=models.Index(fields=['core_generic_updated_at'], name='citymodel_cg_ua_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='countrymodel',
+            index=models.Index(fields=['core_generic_created_at', 'id'], name='countrymodel_cg_ca_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='countrymodel',
+            index=models.Index(fields=['core_generic_updated_at'], name='countrymodel_cg_ua_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='statemodel',
+            index=models.Index(fields=['core_generic_created_at', 'id'], name='statemodel_cg_ca_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='statemodel',
+            index=models.Index(fields=['core_generic_updated_at'], name='statemodel_cg_ua_idx'),
+        ),
+    ]
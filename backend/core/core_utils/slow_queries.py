@@ -0,0 +1,206 @@
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from contextvars import ContextVar
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from django.conf import settings
+from django.utils import timezone
+from core_utils.utils.constants import (
+    CORE_UTILS_SLOW_QUERY_LOG_BACKUP_COUNT,
+    CORE_UTILS_SLOW_QUERY_LOG_MAX_BYTES,
+    CORE_UTILS_SLOW_QUERY_LOGGER,
+)
+
+#? statements EXPLAIN accepts; without ANALYZE none of them is executed
+EXPLAINABLE_SQL = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
+
+#? what varies between runs of the same query, in the order it is replaced
+TEMPLATE_PATTERNS : List[tuple] = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"(?<![\w\".])-?\d+(?:\.\d+)?(?![\w\"])"), "?"),
+    (re.compile(r"%s"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)"), "(?, ...)"),
+    (re.compile(r"\s+"), " "),
+]
+
+#? set by the generic views for the duration of a request
+query_origin_var : ContextVar[Optional[Dict[str, Optional[str]]]] = ContextVar("query_origin", default=None)
+
+
+def get_query_template(sql : str) -> str :
+    """
+    `sql` with literals and placeholders replaced by `?` and IN lists
+    collapsed, so runs with different arguments aggregate together.
+    """
+    for pattern, replacement in TEMPLATE_PATTERNS :
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+class SlowQueryLogger:
+    """
+    Database execute wrapper recording every query slower than
+    `SLOW_QUERY_THRESHOLD_MS` as a JSON line in `SLOW_QUERY_LOG_FILE`
+    (rotated), with the view / handler / serializer that issued it.
+
+    On PostgreSQL, a `SLOW_QUERY_EXPLAIN_SAMPLE_RATE` share of the slow
+    queries also gets its plan from `EXPLAIN (ANALYZE off, FORMAT JSON)`,
+    run on a separate cursor (inside a savepoint when in a transaction).
+    Parameters are never logged.
+
+    Installed on every connection by `install`; aggregate the log with the
+    `slow_queries` command.
+    """
+
+    def __init__(self):
+        self._lock : threading.Lock = threading.Lock()
+        self._logger : Optional[logging.Logger] = None
+
+    def get_logger(self) -> logging.Logger :
+        if self._logger is not None :
+            return self._logger
+        with self._lock :
+            logger : logging.Logger = logging.getLogger(CORE_UTILS_SLOW_QUERY_LOGGER)
+            #? a handler from LOGGING wins over the default file
+            if not logger.handlers :
+                log_file : str = str(settings.SLOW_QUERY_LOG_FILE)
+                os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+                handler : RotatingFileHandler = RotatingFileHandler(
+                    log_file,
+                    maxBytes=CORE_UTILS_SLOW_QUERY_LOG_MAX_BYTES,
+                    backupCount=CORE_UTILS_SLOW_QUERY_LOG_BACKUP_COUNT,
+                    delay=True,
+                )
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                logger.addHandler(handler)
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+            self._logger = logger
+        return self._logger
+
+    def install(self, connection):
+        #? connection_created fires again each time the wrapper reconnects
+        if self not in connection.execute_wrappers :
+            connection.execute_wrappers.append(self)
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at : float = time.perf_counter()
+        try :
+            result = execute(sql, params, many, context)
+        except Exception :
+            self.record_if_slow(sql, params, many, context["connection"], started_at, failed=True)
+            raise
+        self.record_if_slow(sql, params, many, context["connection"], started_at, failed=False)
+        return result
+
+    def record_if_slow(self, sql : str, params : Any, many : bool, connection, started_at : float, failed : bool):
+        duration_ms : float = (time.perf_counter() - started_at) * 1000
+        threshold_ms : int = settings.SLOW_QUERY_THRESHOLD_MS
+        if threshold_ms > 0 and duration_ms >= threshold_ms :
+            self.record(sql, params, many, connection, duration_ms, failed)
+
+    def record(self, sql : str, params : Any, many : bool, connection, duration_ms : float, failed : bool):
+        origin : Dict[str, Optional[str]] = query_origin_var.get() or {}
+        entry : Dict[str, Any] = {
+            "at" : timezone.now().isoformat(),
+            "alias" : connection.alias,
+            "duration_ms" : round(duration_ms, 3),
+            "template" : get_query_template(sql),
+            "sql" : sql,
+            "many" : many,
+            "failed" : failed,
+            "view" : origin.get("view"),
+            "handler" : origin.get("handler"),
+            "serializer" : origin.get("serializer"),
+        }
+        if not failed and not many and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE :
+            entry["plan"] = self.explain(sql, params, connection)
+        try :
+            self.get_logger().info(json.dumps(entry, default=str))
+        except OSError :
+            #? logging must never fail the query
+            pass
+
+    def explain(self, sql : str, params : Any, connection) -> Optional[Any] :
+        if connection.vendor != "postgresql" or not EXPLAINABLE_SQL.match(sql) or connection.connection is None :
+            return None
+        in_transaction : bool = connection.in_atomic_block
+        #? a raw cursor: no execute wrappers (no recursion) and the caller's results are untouched
+        with connection.connection.cursor() as cursor :
+            try :
+                if in_transaction :
+                    cursor.execute("SAVEPOINT slow_query_explain")
+                cursor.execute("EXPLAIN (ANALYZE off, FORMAT JSON) " + sql, params)
+                plan = cursor.fetchone()[0]
+                if in_transaction :
+                    cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            except Exception :
+                if in_transaction :
+                    cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                return None
+        return json.loads(plan) if isinstance(plan, str) else plan
+
+
+slow_query_logger : SlowQueryLogger = SlowQueryLogger()
+
+
+def install_slow_query_logger(sender, connection, **kwargs):
+    """
+    `connection_created` receiver.
+    """
+    slow_query_logger.install(connection)
+
+
+# -----------------------
+# ? Aggregation
+# -----------------------
+
+def iter_log_files(log_file : str) -> List[str] :
+    """
+    `log_file` and its rotated backups, oldest first.
+    """
+    backups : List[str] = [
+        f"{log_file}.{index}" for index in range(CORE_UTILS_SLOW_QUERY_LOG_BACKUP_COUNT, 0, -1)
+    ]
+    return [path for path in [*backups, log_file] if os.path.exists(path)]
+
+
+def iter_entries(paths : Iterable[str]) -> Iterator[Dict[str, Any]] :
+    for path in paths :
+        with open(path, encoding="utf-8") as log :
+            for line in log :
+                try :
+                    yield json.loads(line)
+                except ValueError :
+                    continue
+
+
+def aggregate_entries(entries : Iterable[Dict[str, Any]]) -> List[Dict[str, Any]] :
+    """
+    Groups entries by query template, worst total time first.
+    """
+    templates : Dict[str, Dict[str, Any]] = {}
+    for entry in entries :
+        stats : Dict[str, Any] = templates.setdefault(entry["template"], {
+            "template" : entry["template"],
+            "count" : 0,
+            "total_ms" : 0.0,
+            "max_ms" : 0.0,
+            "views" : {},
+            "plan" : None,
+        })
+        stats["count"] += 1
+        stats["total_ms"] += entry["duration_ms"]
+        stats["max_ms"] = max(stats["max_ms"], entry["duration_ms"])
+        origin : str = " ".join(filter(None, [entry.get("view"), entry.get("handler")])) or "-"
+        stats["views"][origin] = stats["views"].get(origin, 0) + 1
+        if entry.get("plan") is not None :
+            stats["plan"] = entry["plan"]
+    for stats in templates.values() :
+        stats["avg_ms"] = stats["total_ms"] / stats["count"]
+    return sorted(templates.values(), key=lambda stats : stats["total_ms"], reverse=True)
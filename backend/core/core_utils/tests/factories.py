@@ -0,0 +1,13 @@
+from user_config.accounts.enums import UserRoleEnum
+from user_config.user_auth.models import UserModel
+from user_config.user_auth.role_registry import user_role_registry
+
+
+def create_tenant(email : str, **extra_fields) -> UserModel :
+    """
+    A tenant user, creating the role row if needed.
+    """
+    #? the registry outlives the test transactions, a role id it holds may have been rolled back
+    user_role_registry.invalidate()
+    user_role_registry.get_role_id(UserRoleEnum.TENANT, create_missing=True)
+    return UserModel.objects.create_user(email=email, password="secret", role=UserRoleEnum.TENANT, **extra_fields)
@@ -0,0 +1,101 @@
+from typing import Callable, List, Optional
+from django.test import TestCase
+from rest_framework import serializers
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from core_utils.utils.generics.serializers.mixins import CoreGenericBaseHandler, CoreGenericSerializerMixin
+from core_utils.utils.generics.views.process_view import CoreGenericProcessDataModelSerializerAPIView
+from core_utils.tests.factories import create_tenant
+from user_config.user_auth.models import UserModel
+
+
+class RenameUserHandler(CoreGenericBaseHandler):
+    #? runs between the version check and the save, to interleave another request
+    before_save : Optional[Callable[[], None]] = None
+
+    def validate(self):
+        pass
+
+    def create(self):
+        self.instance.first_name = self.data["first_name"]
+        if RenameUserHandler.before_save is not None :
+            before_save : Callable[[], None] = RenameUserHandler.before_save
+            RenameUserHandler.before_save = None
+            before_save()
+        self.save_instance()
+
+
+class RenameUserSerializer(CoreGenericSerializerMixin, serializers.ModelSerializer):
+    handler_class : type = RenameUserHandler
+
+    class Meta:
+        model : type = UserModel
+        fields : List[str] = ["first_name"]
+
+
+class RenameUserView(CoreGenericProcessDataModelSerializerAPIView, GenericAPIView):
+    queryset = UserModel.objects.all()
+    serializer_class : type = RenameUserSerializer
+    authentication_classes : List[type] = []
+    permission_classes : List[type] = [AllowAny]
+    pk_scope : str = "KWARGS"
+    exception_message : str = "Rename failed"
+
+    def put(self, request, *args, **kwargs):
+        return self.handle_request()
+
+
+class ConditionalUpdateViewTests(TestCase):
+    """
+    `CoreGenericProcessDataModelSerializerAPIView` writes with the version
+    it checked, and answers with the version it wrote.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_tenant("concurrency@example.com", first_name="Ann")
+
+    def tearDown(self):
+        RenameUserHandler.before_save = None
+
+    def put(self, first_name : str, if_match : Optional[str] = None) -> Response :
+        headers : dict = {"HTTP_IF_MATCH" : if_match} if if_match else {}
+        request = APIRequestFactory().put("/", {"first_name" : first_name}, format="json", **headers)
+        return RenameUserView.as_view()(request, id=self.user.pk)
+
+    def get_etag(self) -> str :
+        return f'"{UserModel.objects.get(pk=self.user.pk).get_version()}"'
+
+    def test_interleaved_puts_conflict(self):
+        etag : str = self.get_etag()
+        responses : dict = {}
+
+        def put_first():
+            responses["first"] = self.put("Bea", if_match=etag)
+            #? read here: on the test's single connection the first request runs inside
+            #? the second one's transaction, and is rolled back with it
+            responses["written"] = UserModel.objects.get(pk=self.user.pk).first_name
+
+        #? both requests pass the If-Match check, the first one saves in between
+        RenameUserHandler.before_save = put_first
+        responses["second"] = self.put("Cid", if_match=etag)
+
+        self.assertEqual(responses["first"].status_code, 200)
+        self.assertEqual(responses["written"], "Bea")
+        self.assertEqual(responses["second"].status_code, 412)
+
+    def test_stale_if_match_is_rejected(self):
+        etag : str = self.get_etag()
+        self.assertEqual(self.put("Bea", if_match=etag).status_code, 200)
+        self.assertEqual(self.put("Cid", if_match=etag).status_code, 412)
+
+    def test_returned_etag_allows_next_put(self):
+        response : Response = self.put("Bea", if_match=self.get_etag())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], self.get_etag())
+
+        response = self.put("Cid", if_match=response["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(UserModel.objects.get(pk=self.user.pk).first_name, "Cid")
@@ -0,0 +1,95 @@
+import math
+from types import SimpleNamespace
+from unittest import mock, skipUnless
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from core_utils.db_routing import (
+    REPLICA_LAG_SQL,
+    PrimaryReplicaRouter,
+    ReplicaLagMonitor,
+    choose_replica,
+    pin_to_primary,
+    primary_reads,
+    replica_lag_monitor,
+    replica_reads,
+)
+from core_utils.region_data.models import CountryModel
+
+REPLICA_ALIAS : str = "replica_1"
+
+
+@override_settings(DATABASE_REPLICAS=[REPLICA_ALIAS], DATABASE_REPLICA_MAX_LAG=2.0)
+class ReplicaRoutingTests(SimpleTestCase):
+    """
+    Reads go to a healthy replica inside `replica_reads` only.
+    """
+
+    def setUp(self):
+        self.router : PrimaryReplicaRouter = PrimaryReplicaRouter()
+        self.lag_patch = mock.patch.object(replica_lag_monitor, "get_lag", return_value=0.0)
+        self.get_lag : mock.MagicMock = self.lag_patch.start()
+        cache.clear()
+
+    def tearDown(self):
+        self.lag_patch.stop()
+        cache.clear()
+
+    def test_reads_use_the_primary_outside_replica_reads(self):
+        self.assertIsNone(self.router.db_for_read(CountryModel))
+        self.assertEqual(self.router.db_for_write(CountryModel), DEFAULT_DB_ALIAS)
+
+    def test_replica_reads_route_reads_not_writes(self):
+        with replica_reads() as alias :
+            self.assertEqual(alias, REPLICA_ALIAS)
+            self.assertEqual(self.router.db_for_read(CountryModel), REPLICA_ALIAS)
+            self.assertEqual(self.router.db_for_write(CountryModel), DEFAULT_DB_ALIAS)
+            with primary_reads() :
+                self.assertIsNone(self.router.db_for_read(CountryModel))
+            self.assertEqual(self.router.db_for_read(CountryModel), REPLICA_ALIAS)
+        self.assertIsNone(self.router.db_for_read(CountryModel))
+
+    def test_lagging_replica_is_skipped(self):
+        self.get_lag.return_value = 5.0
+        with replica_reads() as alias :
+            self.assertIsNone(alias)
+
+    def test_recent_writer_is_pinned_to_the_primary(self):
+        user : SimpleNamespace = SimpleNamespace(pk=1, is_authenticated=True)
+        other_user : SimpleNamespace = SimpleNamespace(pk=2, is_authenticated=True)
+        pin_to_primary(user)
+        self.assertIsNone(choose_replica(user=user))
+        self.assertEqual(choose_replica(user=other_user), REPLICA_ALIAS)
+
+    def test_replicas_are_never_migrated(self):
+        self.assertFalse(self.router.allow_migrate(REPLICA_ALIAS, "region_data"))
+        self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, "region_data"))
+
+
+class ReplicaLagMonitorTests(SimpleTestCase):
+    """
+    Lag is measured at most once per check interval, unreachable replicas are behind.
+    """
+
+    def test_lag_is_cached_for_the_check_interval(self):
+        monitor : ReplicaLagMonitor = ReplicaLagMonitor()
+        with mock.patch.object(monitor, "measure_lag", return_value=0.5) as measure_lag :
+            self.assertEqual(monitor.get_lag(REPLICA_ALIAS), 0.5)
+            self.assertEqual(monitor.get_lag(REPLICA_ALIAS), 0.5)
+        self.assertEqual(measure_lag.call_count, 1)
+
+    def test_unreachable_replica_is_infinitely_behind(self):
+        monitor : ReplicaLagMonitor = ReplicaLagMonitor()
+        fake_connection : mock.MagicMock = mock.MagicMock(vendor="postgresql")
+        fake_connection.cursor.side_effect = DatabaseError("connection refused")
+        with mock.patch("core_utils.db_routing.connections", {REPLICA_ALIAS : fake_connection}) :
+            self.assertEqual(monitor.measure_lag(REPLICA_ALIAS), math.inf)
+
+
+@skipUnless(connection.vendor == "postgresql", "PostgreSQL only")
+class ReplicaLagSqlTests(TestCase):
+
+    def test_primary_has_no_lag(self):
+        with connection.cursor() as cursor :
+            cursor.execute(REPLICA_LAG_SQL)
+            self.assertEqual(float(cursor.fetchone()[0]), 0.0)
@@ -0,0 +1,46 @@
+from datetime import datetime
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from core_utils.region_data.models import CountryModel
+
+
+class DirtyFieldSaveTests(TestCase):
+    """
+    `CoreGenericModel.save` writes only the columns changed since the load.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.country = CountryModel.objects.create(name="India")
+
+    def test_unchanged_save_writes_nothing(self):
+        country : CountryModel = CountryModel.objects.get(pk=self.country.pk)
+        updated_at : datetime = country.core_generic_updated_at
+        with CaptureQueriesContext(connection) as queries :
+            country.save()
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(country.core_generic_updated_at, updated_at)
+
+    def test_changed_save_writes_changed_columns(self):
+        country : CountryModel = CountryModel.objects.get(pk=self.country.pk)
+        self.assertEqual(country.get_dirty_fields(), [])
+        country.name = "Nepal"
+        self.assertEqual(country.get_dirty_fields(), ["name"])
+        with CaptureQueriesContext(connection) as queries :
+            country.save()
+
+        self.assertEqual(len(queries), 1)
+        update_sql : str = queries[0]["sql"]
+        self.assertTrue(update_sql.startswith("UPDATE"))
+        self.assertIn("COUNTRY_NAME", update_sql)
+        self.assertIn("CORE_GENERIC_UPDATED_AT", update_sql)
+        self.assertNotIn("CORE_GENERIC_CREATED_AT", update_sql)
+        self.assertEqual(country.get_dirty_fields(), [])
+        self.assertEqual(CountryModel.objects.get(pk=self.country.pk).name, "Nepal")
+
+    def test_explicit_update_fields_bypass_the_diff(self):
+        country : CountryModel = CountryModel.objects.get(pk=self.country.pk)
+        with CaptureQueriesContext(connection) as queries :
+            country.save(update_fields=["name"])
+        self.assertEqual(len(queries), 1)
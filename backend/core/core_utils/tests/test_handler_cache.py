@@ -0,0 +1,90 @@
+import shutil
+import tempfile
+from typing import List
+from unittest import mock
+from django.db import router, transaction
+from django.test import TestCase, override_settings
+from core_utils.db_routing import replica_lag_monitor, replica_reads
+from core_utils.handler_cache import cache_aside, tiered_cache
+from core_utils.region_data.models import CountryModel
+
+HANDLER_CACHE_DIR : str = tempfile.mkdtemp(prefix="handler_cache_tests_")
+SHARED_CACHES : dict = {
+    "default" : {"BACKEND" : "django.core.cache.backends.locmem.LocMemCache"},
+    "handlers" : {"BACKEND" : "django.core.cache.backends.filebased.FileBasedCache", "LOCATION" : HANDLER_CACHE_DIR},
+}
+
+
+class CountryHandler:
+    computed : int = 0
+
+    @cache_aside(depends_on=[CountryModel])
+    def get_country_names(self) -> List[str] :
+        CountryHandler.computed += 1
+        return list(CountryModel.objects.order_by("name").values_list("name", flat=True))
+
+    @cache_aside(depends_on=[CountryModel])
+    def get_read_alias(self) -> str :
+        return router.db_for_read(CountryModel) or "default"
+
+
+@override_settings(CACHES=SHARED_CACHES, HANDLER_CACHE_ALIAS="handlers")
+class HandlerCacheTests(TestCase):
+    """
+    `cache_aside` values are reused until a model they depend on changes.
+    """
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(HANDLER_CACHE_DIR, ignore_errors=True)
+
+    def setUp(self):
+        tiered_cache.shared.clear()
+        tiered_cache.local.clear()
+        CountryHandler.computed = 0
+        with self.captureOnCommitCallbacks(execute=True):
+            CountryModel.objects.create(name="India")
+
+    def test_value_is_reused(self):
+        self.assertEqual(CountryHandler().get_country_names(), ["India"])
+        self.assertEqual(CountryHandler().get_country_names(), ["India"])
+        self.assertEqual(CountryHandler.computed, 1)
+
+    def test_committed_change_invalidates(self):
+        CountryHandler().get_country_names()
+        with self.captureOnCommitCallbacks(execute=True):
+            CountryModel.objects.create(name="Nepal")
+        self.assertEqual(CountryHandler().get_country_names(), ["India", "Nepal"])
+        self.assertEqual(CountryHandler.computed, 2)
+
+    def test_bulk_update_invalidates(self):
+        CountryHandler().get_country_names()
+        with self.captureOnCommitCallbacks(execute=True):
+            CountryModel.objects.update(name="Bhutan")
+        self.assertEqual(CountryHandler().get_country_names(), ["Bhutan"])
+
+    def test_rolled_back_change_keeps_the_value(self):
+        CountryHandler().get_country_names()
+        with self.captureOnCommitCallbacks(execute=True):
+            try :
+                with transaction.atomic():
+                    CountryModel.objects.create(name="Nepal")
+                    raise RuntimeError
+            except RuntimeError :
+                pass
+        self.assertEqual(CountryHandler().get_country_names(), ["India"])
+        self.assertEqual(CountryHandler.computed, 1)
+
+    @override_settings(DATABASE_REPLICAS=["replica_1"])
+    def test_misses_are_computed_on_the_primary(self):
+        with mock.patch.object(replica_lag_monitor, "get_lag", return_value=0.0) :
+            with replica_reads() as alias :
+                self.assertEqual(alias, "replica_1")
+                self.assertEqual(CountryHandler().get_read_alias(), "default")
+
+    @override_settings(HANDLER_CACHE_ALIAS="default")
+    def test_process_local_cache_is_bypassed(self):
+        CountryHandler().get_country_names()
+        CountryHandler().get_country_names()
+        self.assertEqual(CountryHandler.computed, 2)
@@ -0,0 +1,76 @@
+from datetime import datetime
+from uuid import UUID
+from django.db import transaction
+from django.test import TestCase
+from django.utils import timezone
+from core_utils.models import HistoryRecordModel
+from core_utils.tests.factories import create_tenant
+from user_config.user_auth.models import UserModel
+
+
+class HistoryAsOfTests(TestCase):
+    """
+    `CoreGenericModel.get_as_of` over create / update / delete sequences.
+    """
+
+    def create_user(self) -> UserModel :
+        with self.captureOnCommitCallbacks(execute=True):
+            user : UserModel = create_tenant("history@example.com", first_name="Ann")
+        return UserModel.objects.get(pk=user.pk)
+
+    def rename(self, user : UserModel, first_name : str) -> datetime :
+        with self.captureOnCommitCallbacks(execute=True):
+            user.first_name = first_name
+            user.save()
+        return timezone.now()
+
+    def test_before_create_is_none(self):
+        before : datetime = timezone.now()
+        user : UserModel = self.create_user()
+        self.assertIsNone(UserModel.get_as_of(user.pk, before))
+
+    def test_each_update_is_undone(self):
+        user : UserModel = self.create_user()
+        created_at : datetime = timezone.now()
+        renamed_at : datetime = self.rename(user, "Bea")
+        self.rename(user, "Cid")
+
+        self.assertEqual(UserModel.get_as_of(user.pk, created_at).first_name, "Ann")
+        self.assertEqual(UserModel.get_as_of(user.pk, renamed_at).first_name, "Bea")
+        self.assertEqual(UserModel.get_as_of(user.pk, timezone.now()).first_name, "Cid")
+
+    def test_deleted_row_is_rebuilt_until_deleted(self):
+        user : UserModel = self.create_user()
+        user_id : UUID = user.pk
+        renamed_at : datetime = self.rename(user, "Bea")
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
+
+        self.assertFalse(UserModel.objects.filter(pk=user_id).exists())
+        self.assertEqual(UserModel.get_as_of(user_id, renamed_at).first_name, "Bea")
+        self.assertIsNone(UserModel.get_as_of(user_id, timezone.now()))
+
+    def test_bulk_update_is_recorded(self):
+        user : UserModel = self.create_user()
+        created_at : datetime = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            UserModel.objects.filter(pk=user.pk).update(first_name="Dan")
+
+        self.assertEqual(UserModel.get_as_of(user.pk, created_at).first_name, "Ann")
+        self.assertEqual(UserModel.get_as_of(user.pk, timezone.now()).first_name, "Dan")
+
+    def test_rolled_back_savepoint_records_nothing(self):
+        user : UserModel = self.create_user()
+        records_before : int = HistoryRecordModel.objects.count()
+        with self.captureOnCommitCallbacks(execute=True):
+            try :
+                with transaction.atomic():
+                    user.first_name = "Eve"
+                    user.save()
+                    raise RuntimeError
+            except RuntimeError :
+                pass
+            user.first_name = "Fay"
+            user.save()
+
+        self.assertEqual(HistoryRecordModel.objects.count(), records_before + 1)
@@ -0,0 +1,85 @@
+from typing import List
+from unittest import mock
+from django.db import transaction
+from django.test import TestCase
+from core_utils.models import OutboxEventModel
+from core_utils.outbox import OutboxRelay, outbox_events_relayed
+from core_utils.region_data.models import CountryModel
+from core_utils.utils.enums import OutboxActionEnum
+
+
+@mock.patch.object(CountryModel, "outbox_enabled", True)
+class OutboxTests(TestCase):
+    """
+    Outbox events are written with the change they describe and relayed once.
+    """
+
+    def get_events(self) -> List[tuple] :
+        return list(OutboxEventModel.objects.order_by("id").values_list("object_pk", "action", "fields"))
+
+    def test_save_and_delete_record_events(self):
+        country : CountryModel = CountryModel.objects.create(name="India")
+        country.name = "Nepal"
+        country.save()
+        country_id : str = str(country.pk)
+        country.delete()
+
+        self.assertEqual(
+            self.get_events(),
+            [
+                (country_id, OutboxActionEnum.CREATE.value, None),
+                (country_id, OutboxActionEnum.UPDATE.value, ["core_generic_updated_at", "name"]),
+                (country_id, OutboxActionEnum.DELETE.value, None),
+            ],
+        )
+
+    def test_rolled_back_change_records_nothing(self):
+        try :
+            with transaction.atomic():
+                CountryModel.objects.create(name="India")
+                raise RuntimeError
+        except RuntimeError :
+            pass
+        self.assertEqual(self.get_events(), [])
+
+    def test_bulk_update_records_one_event_per_row(self):
+        countries : List[CountryModel] = CountryModel.objects.bulk_create(
+            [CountryModel(name="India"), CountryModel(name="Nepal")]
+        )
+        OutboxEventModel.objects.all().delete()
+        CountryModel.objects.filter(pk__in=[country.pk for country in countries]).update(name="Bhutan")
+
+        self.assertEqual(
+            sorted(event[0] for event in self.get_events()),
+            sorted(str(country.pk) for country in countries),
+        )
+
+    def test_relay_delivers_and_deletes(self):
+        CountryModel.objects.create(name="India")
+        CountryModel.objects.create(name="Nepal")
+        received : List[int] = []
+
+        def receiver(sender, events, **kwargs):
+            received.extend(event.pk for event in events)
+
+        outbox_events_relayed.connect(receiver)
+        try :
+            self.assertEqual(OutboxRelay(batch_size=1).run(), 2)
+        finally :
+            outbox_events_relayed.disconnect(receiver)
+        self.assertEqual(len(received), 2)
+        self.assertFalse(OutboxEventModel.objects.exists())
+
+    def test_failed_delivery_keeps_the_batch(self):
+        CountryModel.objects.create(name="India")
+
+        def receiver(sender, events, **kwargs):
+            raise RuntimeError("broker down")
+
+        outbox_events_relayed.connect(receiver)
+        try :
+            with self.assertRaises(RuntimeError) :
+                OutboxRelay().run()
+        finally :
+            outbox_events_relayed.disconnect(receiver)
+        self.assertEqual(OutboxEventModel.objects.count(), 1)
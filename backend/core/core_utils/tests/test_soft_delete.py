@@ -0,0 +1,68 @@
+from typing import Tuple
+from django.db import models
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import isolate_apps
+from core_utils.tests.factories import create_tenant
+from core_utils.utils.generics.generic_models import CORE_GENERIC_NOT_DELETED, CoreGenericSoftDeleteModel
+from user_config.accounts.models import BlackListTokenModel
+
+
+class SoftDeleteQueryTests(TestCase):
+    """
+    Soft deletes through `CoreGenericSoftDeleteModel` and its queryset.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_tenant("soft-delete@example.com")
+        cls.tokens = [
+            BlackListTokenModel.objects.blacklist_token(user=cls.user, token=f"token-{index}")
+            for index in range(3)
+        ]
+
+    def test_soft_deleted_rows_are_hidden(self):
+        self.tokens[0].soft_delete()
+
+        self.assertEqual(BlackListTokenModel.objects.count(), 2)
+        self.assertEqual(BlackListTokenModel.all_objects.count(), 3)
+        self.assertEqual(BlackListTokenModel.all_objects.deleted().get(), self.tokens[0])
+
+    def test_queryset_soft_delete_and_restore(self):
+        self.assertEqual(BlackListTokenModel.objects.all().soft_delete(), 3)
+        self.assertFalse(BlackListTokenModel.objects.exists())
+        #? already deleted rows are not counted twice
+        self.assertEqual(BlackListTokenModel.all_objects.all().soft_delete(), 0)
+        self.assertEqual(BlackListTokenModel.all_objects.all().restore(), 3)
+        self.assertEqual(BlackListTokenModel.objects.count(), 3)
+
+
+class SoftDeleteIndexTests(SimpleTestCase):
+    """
+    `make_indexes_partial` turns declared indexes into partial ones.
+    """
+
+    def test_inherited_indexes_are_partial(self):
+        for index in BlackListTokenModel._meta.indexes :
+            self.assertEqual(index.condition, CORE_GENERIC_NOT_DELETED, index.name)
+
+    @isolate_apps("core_utils")
+    def test_declared_indexes_are_partial_unless_kept_full(self):
+        class SoftDeleteItemModel(CoreGenericSoftDeleteModel):
+            soft_delete_full_indexes : Tuple[str, ...] = ("soft_item_code_idx",)
+
+            name = models.CharField(max_length=50)
+            code = models.CharField(max_length=50)
+
+            class Meta(CoreGenericSoftDeleteModel.Meta):
+                app_label : str = "core_utils"
+                indexes : list = [
+                    *CoreGenericSoftDeleteModel.Meta.indexes,
+                    models.Index(fields=["name"], name="soft_item_name_idx"),
+                    models.Index(fields=["code"], name="soft_item_code_idx"),
+                    models.Index(fields=["name", "code"], name="soft_item_both_idx", condition=models.Q(code="x")),
+                ]
+
+        indexes : dict = {index.name : index for index in SoftDeleteItemModel._meta.indexes}
+        self.assertEqual(indexes["soft_item_name_idx"].condition, CORE_GENERIC_NOT_DELETED)
+        self.assertIsNone(indexes["soft_item_code_idx"].condition)
+        self.assertEqual(indexes["soft_item_both_idx"].condition, models.Q(code="x"))
@@ -0,0 +1,59 @@
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Minimal Bloom filter over hex digests.
+
+    Items are expected to already be uniformly distributed (e.g. SHA-256 hex
+    digests), so the bit positions are derived from the digest itself with
+    double hashing instead of re-hashing every item k times.
+
+    Attributes:
+        capacity (int): Number of items the filter is sized for.
+        error_rate (float): Target false positive rate at `capacity`.
+        size (int): Number of bits.
+        hash_count (int): Number of bit positions per item.
+        count (int): Number of items added so far.
+    """
+
+    def __init__(self, capacity : int, error_rate : float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def get_positions(self, digest : str) -> Iterable[int] :
+        first_hash : int = int(digest[:16], 16)
+        second_hash : int = int(digest[16:32], 16) | 1
+        return (
+            (first_hash + index * second_hash) % self.size
+            for index in range(self.hash_count)
+        )
+
+    def add(self, digest : str):
+        for position in self.get_positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, digests : Iterable[str]):
+        for digest in digests :
+            self.add(digest)
+
+    def __contains__(self, digest : str) -> bool :
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self.get_positions(digest)
+        )
+
+    def is_saturated(self) -> bool :
+        return self.count > self.capacity
+
+    def get_expected_error_rate(self) -> float :
+        """
+        Theoretical false positive rate at the current fill.
+        """
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
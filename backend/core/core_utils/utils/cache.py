@@ -0,0 +1,22 @@
+from typing import Any, Dict, Optional
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS
+from core_utils.utils.constants import CORE_UTILS_PROCESS_LOCAL_CACHE_BACKENDS
+
+
+def is_shared_cache(alias : str = DEFAULT_CACHE_ALIAS, cache_settings : Optional[Dict[str, Any]] = None) -> bool :
+    """
+    Whether the cache `alias` is seen by every worker process.
+
+    Version counters and invalidation tokens kept in a process-local cache
+    (LocMem) never reach the other workers, so code relying on them has to
+    fall back to the database when this is False.
+
+    Args:
+        alias (str): The cache alias.
+        cache_settings (Optional[Dict[str, Any]]): A CACHES dict to read instead
+                                                   of settings.CACHES, for use
+                                                   while settings are loading.
+    """
+    backend : str = (settings.CACHES if cache_settings is None else cache_settings).get(alias, {}).get("BACKEND", "")
+    return backend not in CORE_UTILS_PROCESS_LOCAL_CACHE_BACKENDS
@@ -1 +1,19 @@
-CORE_UTILS_DEV_ERROR_MESSAGE = "Dev Error"
\ No newline at end of file
+CORE_UTILS_DEV_ERROR_MESSAGE = "Dev Error"
+CORE_UTILS_OUTBOX_BATCH_SIZE = 500
+CORE_UTILS_OUTBOX_POLL_INTERVAL = 1.0
+CORE_UTILS_AUDIT_USER_MODEL = "user_auth.UserDetailModel"
+CORE_UTILS_REPLICA_LAG_CHECK_INTERVAL = 1.0
+CORE_UTILS_PRIMARY_PIN_CACHE_KEY = "core_utils:primary_pin:{user_id}"
+CORE_UTILS_SLOW_QUERY_LOGGER = "core_utils.slow_queries"
+CORE_UTILS_SLOW_QUERY_LOG_MAX_BYTES = 10 * 1024 * 1024
+CORE_UTILS_SLOW_QUERY_LOG_BACKUP_COUNT = 5
+CORE_UTILS_HANDLER_CACHE_TIMEOUT = 300
+CORE_UTILS_HANDLER_CACHE_LOCK_TIMEOUT = 10
+CORE_UTILS_HANDLER_CACHE_POLL_INTERVAL = 0.05
+CORE_UTILS_HANDLER_CACHE_KEY = "core_utils:handler_cache:{method}:{digest}"
+CORE_UTILS_HANDLER_CACHE_GENERATION_KEY = "core_utils:handler_cache:generation:{model}"
+CORE_UTILS_PROCESS_LOCAL_CACHE_BACKENDS = ("django.core.cache.backends.locmem.LocMemCache",)
+CORE_UTILS_CACHED_SESSION_ENGINES = (
+    "django.contrib.sessions.backends.cache",
+    "django.contrib.sessions.backends.cached_db",
+)
@@ -0,0 +1,45 @@
+import time
+from typing import Callable, List, Optional
+from django.db import transaction
+from django.db.models import QuerySet
+
+
+def delete_in_batches(
+    queryset : QuerySet,
+    batch_size : int,
+    sleep_seconds : float = 0.0,
+    log : Optional[Callable[[str], None]] = None,
+    label : str = "rows",
+) -> int :
+    """
+    Deletes the rows of `queryset` `batch_size` at a time.
+
+    Every batch is its own short transaction (`DELETE ... WHERE pk IN (...)`),
+    so locks are held briefly and replicas/vacuum keep up, unlike a single
+    `DELETE` over the whole set.
+
+    Args:
+        queryset (QuerySet): Rows to delete; re-evaluated for every batch.
+        batch_size (int): Rows per batch.
+        sleep_seconds (float): Pause between batches.
+        log (Optional[Callable[[str], None]]): Receives one line per batch.
+        label (str): What the rows are, for the log lines.
+
+    Returns:
+        int: Number of deleted rows.
+    """
+    total_deleted : int = 0
+    while True :
+        batch_pks : List = list(queryset.values_list("pk", flat=True)[:batch_size])
+        if not batch_pks :
+            break
+        with transaction.atomic(using=queryset.db):
+            deleted, _ = queryset.filter(pk__in=batch_pks).delete()
+        total_deleted += deleted
+        if log :
+            log(f"Deleted {deleted} {label} ({total_deleted} total)")
+        if len(batch_pks) < batch_size :
+            break
+        if sleep_seconds :
+            time.sleep(sleep_seconds)
+    return total_deleted
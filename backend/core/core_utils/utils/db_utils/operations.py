@@ -0,0 +1,71 @@
+from django.db.migrations.operations import AddIndex, RemoveIndex
+
+
+def can_index_concurrently(schema_editor, model) -> bool :
+    """
+    PostgreSQL only, and not on partitioned tables (PostgreSQL can't build
+    their indexes concurrently; the blacklist table may be partitioned).
+    """
+    if schema_editor.connection.vendor != "postgresql" :
+        return False
+    with schema_editor.connection.cursor() as cursor :
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = %s",
+            [model._meta.db_table],
+        )
+        return cursor.fetchone() is None
+
+
+class AddIndexConcurrently(AddIndex):
+    """
+    `AddIndex` that builds the index with `CREATE INDEX CONCURRENTLY` on
+    PostgreSQL, so writes to a large table are not blocked while it builds.
+    Other databases and partitioned tables get a plain `AddIndex`.
+
+    The migration using it must set `atomic = False`.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model) :
+            return
+        if can_index_concurrently(schema_editor, model) :
+            schema_editor.add_index(model, self.index, concurrently=True)
+        else :
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model) :
+            return
+        if can_index_concurrently(schema_editor, model) :
+            schema_editor.remove_index(model, self.index, concurrently=True)
+        else :
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class RemoveIndexConcurrently(RemoveIndex):
+    """
+    `RemoveIndex` counterpart of `AddIndexConcurrently`.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model) :
+            return
+        if can_index_concurrently(schema_editor, model) :
+            index = from_state.models[app_label, self.model_name_lower].get_index_by_name(self.name)
+            schema_editor.remove_index(model, index, concurrently=True)
+        else :
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model) :
+            return
+        if can_index_concurrently(schema_editor, model) :
+            index = to_state.models[app_label, self.model_name_lower].get_index_by_name(self.name)
+            schema_editor.add_index(model, index, concurrently=True)
+        else :
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
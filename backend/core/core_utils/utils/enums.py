@@ -4,4 +4,14 @@ from enum import Enum
 class EnumChoices(Enum):
     @classmethod
     def choices(cls):
-        return [(key.value, key.name.capitalize()) for key in cls]
\ No newline at end of file
+        return [(key.value, key.name.capitalize()) for key in cls]
+
+class OutboxActionEnum(EnumChoices):
+    CREATE = "C"
+    UPDATE = "U"
+    DELETE = "D"
+
+class HistoryActionEnum(EnumChoices):
+    CREATE = "C"
+    UPDATE = "U"
+    DELETE = "D"
@@ -1,4 +1,213 @@
-from django.db import models
+import copy
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from django.db import models, router, transaction
+from django.dispatch import Signal
+from django.utils import timezone
+from core_utils.audit import get_audit_user_detail_id
+from core_utils.history import get_history_attnames, history_recorder
+from core_utils.outbox import record_outbox_events
+from core_utils.utils.enums import OutboxActionEnum
+
+
+CORE_GENERIC_VERSION_EPOCH : datetime = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+#? sent by the bulk writes of CoreGenericQuerySet (which send no post_save) with `using`,
+#? after rows of `sender` were created or updated
+core_generic_rows_changed : Signal = Signal()
+
+
+class CoreGenericConcurrencyError(Exception):
+    """
+    Raised when a conditional save finds the row changed (or deleted) since
+    the version it was checked against.
+    """
+
+
+class CoreGenericPreconditionRequiredError(Exception):
+    """
+    Raised when a view requires `If-Match` and the request has none.
+    """
+
+
+class CoreGenericQuerySet(models.QuerySet):
+    """
+    Base queryset of CoreGenericModel.
+
+    For models with `outbox_enabled`, bulk writes (`update`, `delete`,
+    `bulk_create`, `bulk_update`) record their outbox events in the same
+    transaction as the write. For models with `history_enabled`, they
+    record the history of the rows they change, reading the old values
+    with one SELECT per call.
+
+    Inside an audit context (see `core_utils.audit`), `update`,
+    `bulk_create` and `bulk_update` also stamp `core_generic_created_by` /
+    `core_generic_updated_by`, with no per-row queries.
+
+    `update`, `bulk_create` and `bulk_update` send `core_generic_rows_changed`
+    once per call when they wrote rows.
+    """
+
+    def is_outbox_enabled(self) -> bool :
+        return getattr(self.model, "outbox_enabled", False)
+
+    def is_history_enabled(self) -> bool :
+        return getattr(self.model, "history_enabled", False)
+
+    def record_outbox_events(self, pks : Iterable, action : OutboxActionEnum, fields : Optional[Iterable[str]] = None):
+        record_outbox_events(self.model, pks, action.value, fields=fields, using=self.db)
+
+    def get_base_queryset(self) -> models.QuerySet :
+        #? a plain queryset, whose writes record no events or history of their own
+        return models.QuerySet(model=self.model, using=self.db)
+
+    def get_rows(self, queryset : models.QuerySet, attnames : List[str]) -> Dict[Any, Dict[str, Any]] :
+        return {row.pop("pk") : row for row in queryset.values("pk", *attnames)}
+
+    def send_rows_changed(self):
+        core_generic_rows_changed.send(sender=self.model, using=self.db)
+
+    def update(self, **kwargs) -> int :
+        user_detail_id : Optional[int] = get_audit_user_detail_id()
+        if user_detail_id is not None and "core_generic_updated_by" not in kwargs :
+            kwargs.setdefault("core_generic_updated_by_id", user_detail_id)
+        outbox_enabled : bool = self.is_outbox_enabled()
+        history_attnames : List[str] = get_history_attnames(self.model, kwargs) if self.is_history_enabled() else []
+        if not outbox_enabled and not history_attnames :
+            rows : int = super().update(**kwargs)
+            if rows :
+                self.send_rows_changed()
+            return rows
+        with transaction.atomic(using=self.db):
+            #? lock the matched rows so the events describe exactly what was updated
+            old_rows : Dict[Any, Dict[str, Any]] = self.get_rows(self.select_for_update(), history_attnames)
+            if not old_rows :
+                return 0
+            queryset : models.QuerySet = self.get_base_queryset().filter(pk__in=list(old_rows))
+            rows : int = models.QuerySet.update(queryset, **kwargs)
+            if outbox_enabled :
+                self.record_outbox_events(list(old_rows), OutboxActionEnum.UPDATE, fields=kwargs)
+            if history_attnames :
+                #? re-read, the new values may be expressions
+                updated_by = kwargs.get("core_generic_updated_by", kwargs.get("core_generic_updated_by_id"))
+                history_recorder.record_updated(
+                    self.model, old_rows, self.get_rows(queryset, history_attnames), self.db,
+                    changed_by_id=getattr(updated_by, "pk", updated_by),
+                )
+        self.send_rows_changed()
+        return rows
+
+    update.alters_data = True
+
+    def delete(self):
+        outbox_enabled : bool = self.is_outbox_enabled()
+        history_enabled : bool = self.is_history_enabled()
+        if not outbox_enabled and not history_enabled :
+            return super().delete()
+        with transaction.atomic(using=self.db):
+            old_rows : Dict[Any, Dict[str, Any]] = self.get_rows(
+                self, get_history_attnames(self.model) if history_enabled else []
+            )
+            deleted = super().delete()
+            if outbox_enabled :
+                self.record_outbox_events(list(old_rows), OutboxActionEnum.DELETE)
+            if history_enabled :
+                history_recorder.record_deleted(
+                    self.model, old_rows, self.db, changed_by_id=get_audit_user_detail_id()
+                )
+        return deleted
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def bulk_create(self, objs, *args, **kwargs):
+        user_detail_id : Optional[int] = get_audit_user_detail_id()
+        if user_detail_id is not None :
+            objs = list(objs)
+            for obj in objs :
+                if obj.core_generic_created_by_id is None :
+                    obj.core_generic_created_by_id = user_detail_id
+                if obj.core_generic_updated_by_id is None :
+                    obj.core_generic_updated_by_id = user_detail_id
+        outbox_enabled : bool = self.is_outbox_enabled()
+        history_enabled : bool = self.is_history_enabled()
+        if not outbox_enabled and not history_enabled :
+            objs = super().bulk_create(objs, *args, **kwargs)
+            if objs :
+                self.send_rows_changed()
+            return objs
+        with transaction.atomic(using=self.db):
+            objs = super().bulk_create(objs, *args, **kwargs)
+            if outbox_enabled :
+                self.record_outbox_events(
+                    [obj.pk for obj in objs if obj.pk is not None], OutboxActionEnum.CREATE
+                )
+            if history_enabled :
+                history_recorder.record_created(self.model, objs, self.db)
+        if objs :
+            self.send_rows_changed()
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs) -> int :
+        user_detail_id : Optional[int] = get_audit_user_detail_id()
+        if user_detail_id is not None :
+            objs = list(objs)
+            for obj in objs :
+                obj.core_generic_updated_by_id = user_detail_id
+            if "core_generic_updated_by" not in fields and "core_generic_updated_by_id" not in fields :
+                fields = [*fields, "core_generic_updated_by"]
+        outbox_enabled : bool = self.is_outbox_enabled()
+        history_attnames : List[str] = get_history_attnames(self.model, fields) if self.is_history_enabled() else []
+        if not outbox_enabled and not history_attnames :
+            #? its update() calls send core_generic_rows_changed
+            return super().bulk_update(objs, fields, *args, **kwargs)
+        objs = list(objs)
+        with transaction.atomic(using=self.db):
+            old_rows : Dict[Any, Dict[str, Any]] = {}
+            if history_attnames :
+                #? load snapshots cover the old values, only the rest are selected
+                unloaded_pks : List = []
+                for obj in objs :
+                    loaded_values : Dict[str, Any] = getattr(obj, "_loaded_values", None) or {}
+                    if all(attname in loaded_values for attname in history_attnames) :
+                        old_rows[obj.pk] = {attname : loaded_values[attname] for attname in history_attnames}
+                    else :
+                        unloaded_pks.append(obj.pk)
+                if unloaded_pks :
+                    old_rows.update(self.get_rows(self.get_base_queryset().filter(pk__in=unloaded_pks), history_attnames))
+
+            #? on a plain queryset, its internal update() calls must not record events again
+            rows : int = models.QuerySet.bulk_update(self.get_base_queryset(), objs, fields, *args, **kwargs)
+            if outbox_enabled :
+                self.record_outbox_events([obj.pk for obj in objs], OutboxActionEnum.UPDATE, fields=fields)
+            if history_attnames :
+                new_rows : Dict[Any, Dict[str, Any]] = {
+                    obj.pk : {attname : getattr(obj, attname) for attname in history_attnames} for obj in objs
+                }
+                has_expressions : bool = any(
+                    hasattr(value, "resolve_expression") for values in new_rows.values() for value in values.values()
+                )
+                if has_expressions :
+                    new_rows = self.get_rows(self.get_base_queryset().filter(pk__in=list(new_rows)), history_attnames)
+                history_recorder.record_updated(
+                    self.model, old_rows, new_rows, self.db,
+                    changed_by_ids={obj.pk : obj.core_generic_updated_by_id for obj in objs},
+                )
+                if not has_expressions :
+                    #? the next bulk_update of these objects diffs against what was just written
+                    for obj in objs :
+                        obj.snapshot_loaded_values(fields=fields)
+        if rows :
+            self.send_rows_changed()
+        return rows
+
+    bulk_update.alters_data = True
+
+
+class CoreGenericManager(models.Manager.from_queryset(CoreGenericQuerySet)):
+    pass
+
+
 class CoreGenericModel(models.Model):
     core_generic_created_at = models.DateTimeField(
         auto_now_add=True,
@@ -30,5 +239,372 @@ class CoreGenericModel(models.Model):
         db_column='CORE_GENERIC_UPDATED_BY'
     )
 
+    objects = CoreGenericManager()
+
+    #? opt-in: record an OutboxEventModel row for every write, in the same transaction
+    outbox_enabled : bool = False
+
+    #? opt-in: keep per-change column diffs in HistoryRecordModel, see `get_as_of`
+    history_enabled : bool = False
+
+    #? columns kept out of the history (e.g. secrets); they are not rebuilt by `get_as_of`
+    history_excluded_fields : Tuple[str, ...] = ()
+
+    #? never written by a plain save(), only by dedicated queryset updates
+    save_excluded_fields : Tuple[str, ...] = ()
+
     class Meta:
         abstract = True
+        #? inherited by every subclass; a subclass declaring its own Meta must
+        #? extend CoreGenericModel.Meta (and its indexes) to keep them
+        indexes = [
+            #? (created_at, id) serves the default "-core_generic_created_at"
+            #? ordering and keyset pagination; a created_at-only index would be redundant
+            models.Index(
+                fields=["core_generic_created_at", "id"],
+                name="%(class)s_cg_ca_idx",
+            ),
+            models.Index(
+                fields=["core_generic_updated_at"],
+                name="%(class)s_cg_ua_idx",
+            ),
+        ]
+
+    # -----------------------
+    # ? Optimistic Concurrency
+    # -----------------------
+
+    def get_version(self) -> Optional[str] :
+        """
+        Version token (used as ETag) derived from `core_generic_updated_at`,
+        in whole microseconds since the epoch.
+        """
+        if self.core_generic_updated_at is None :
+            return None
+        return str((self.core_generic_updated_at - CORE_GENERIC_VERSION_EPOCH) // timedelta(microseconds=1))
+
+    @staticmethod
+    def parse_version(version : str) -> datetime :
+        return CORE_GENERIC_VERSION_EPOCH + timedelta(microseconds=int(version))
+
+    def expect_version(self, updated_at : Optional[datetime]):
+        """
+        Makes the next save an `UPDATE ... WHERE core_generic_updated_at = %s`,
+        raising CoreGenericConcurrencyError if another writer got there first.
+        No lock is taken, concurrent editors never wait on each other.
+        """
+        self._expected_updated_at = updated_at
+        self._has_expected_version = True
+
+    def _do_update(self, base_qs, *args, **kwargs):
+        if not getattr(self, "_has_expected_version", False) :
+            return super()._do_update(base_qs, *args, **kwargs)
+        #? one-shot, later saves of this instance are plain again
+        self._has_expected_version = False
+        updated : bool = super()._do_update(
+            base_qs.filter(core_generic_updated_at=self._expected_updated_at), *args, **kwargs
+        )
+        if not updated :
+            raise CoreGenericConcurrencyError(
+                f"{self._meta.label} {self.pk} was modified by someone else."
+            )
+        return updated
+
+    # -----------------------
+    # ? Dirty Field Tracking
+    # -----------------------
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.snapshot_loaded_values()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        self.snapshot_loaded_values(fields=fields)
+
+    def snapshot_loaded_values(self, fields : Optional[Iterable[str]] = None):
+        """
+        Remembers the column values as stored, to diff against on save.
+
+        Args:
+            fields (Optional[Iterable[str]]): Only refresh these; all loaded fields when None.
+        """
+        deferred_fields = self.get_deferred_fields()
+        field_names : Optional[set] = set(fields) if fields is not None else None
+        loaded_values : Dict[str, Any] = {}
+        if field_names is not None :
+            loaded_values = getattr(self, "_loaded_values", None) or {}
+        for field in self._meta.concrete_fields :
+            if field.attname in deferred_fields :
+                continue
+            if field_names is not None and field.name not in field_names and field.attname not in field_names :
+                continue
+            value : Any = self.__dict__.get(field.attname)
+            #? JSON values can be mutated in place
+            loaded_values[field.attname] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+        self._loaded_values = loaded_values
+
+    def get_dirty_fields(self) -> Optional[List[str]] :
+        """
+        Names of the fields changed since the row was loaded or last saved.
+
+        Returns:
+            Optional[List[str]]: None when the instance has no snapshot (never
+                                 loaded from or saved to the database).
+        """
+        loaded_values : Optional[Dict[str, Any]] = getattr(self, "_loaded_values", None)
+        if loaded_values is None :
+            return None
+        dirty_fields : List[str] = []
+        for field in self._meta.concrete_fields :
+            if field.primary_key or field.attname not in self.__dict__ :
+                continue
+            if field.attname not in loaded_values or loaded_values[field.attname] != self.__dict__[field.attname] :
+                dirty_fields.append(field.name)
+        return dirty_fields
+
+    def get_save_update_fields(self) -> Optional[List[str]] :
+        """
+        `update_fields` for a plain save() of an existing row: the dirty
+        fields plus `auto_now` ones, minus `save_excluded_fields`.
+
+        Returns:
+            Optional[List[str]]: [] when nothing changed, None for a full save.
+        """
+        dirty_fields : Optional[List[str]] = self.get_dirty_fields()
+        if dirty_fields is None :
+            if not self.save_excluded_fields :
+                return None
+            dirty_fields = [field.name for field in self._meta.concrete_fields if not field.primary_key]
+        dirty_fields = [name for name in dirty_fields if name not in self.save_excluded_fields]
+        if not dirty_fields :
+            return []
+        auto_now_fields : List[str] = [
+            field.name for field in self._meta.concrete_fields
+            if getattr(field, "auto_now", False) and field.name not in dirty_fields
+        ]
+        return dirty_fields + auto_now_fields
+
+    def stamp_audit_fields(self, update_fields : Optional[Iterable[str]]) -> Optional[Iterable[str]] :
+        """
+        Sets `core_generic_created_by` (on insert) and `core_generic_updated_by`
+        from the audit context, adding the latter to `update_fields`.
+        """
+        user_detail_id : Optional[int] = get_audit_user_detail_id()
+        if user_detail_id is None :
+            return update_fields
+        if self._state.adding and self.core_generic_created_by_id is None :
+            self.core_generic_created_by_id = user_detail_id
+        if self.core_generic_updated_by_id == user_detail_id :
+            return update_fields
+        self.core_generic_updated_by_id = user_detail_id
+        if update_fields is not None and "core_generic_updated_by" not in update_fields :
+            update_fields = [*update_fields, "core_generic_updated_by"]
+        return update_fields
+
+    def save(self, *args, **kwargs):
+        """
+        Updates of loaded rows write only the changed columns, and nothing at
+        all (no UPDATE, no auto_now bump, no signals) when nothing changed.
+        Pass `update_fields` explicitly to bypass the diff.
+
+        Rows that are written get their audit columns stamped from the
+        audit context.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert") :
+            update_fields : Optional[List[str]] = self.get_save_update_fields()
+            if update_fields == [] :
+                self._has_expected_version = False
+                return
+            if update_fields is not None :
+                kwargs["update_fields"] = update_fields
+        update_fields = self.stamp_audit_fields(kwargs.get("update_fields"))
+        if update_fields is not None :
+            kwargs["update_fields"] = update_fields
+
+        using : str = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        adding : bool = self._state.adding
+        stored_values : Optional[Dict[str, Any]] = None
+        if self.history_enabled and not adding :
+            stored_values = history_recorder.get_stored_values(self, using)
+
+        if not self.outbox_enabled :
+            super().save(*args, **kwargs)
+        else :
+            action : OutboxActionEnum = OutboxActionEnum.CREATE if adding else OutboxActionEnum.UPDATE
+            with transaction.atomic(using=using):
+                super().save(*args, **kwargs)
+                record_outbox_events(
+                    type(self), [self.pk], action.value, fields=kwargs.get("update_fields"), using=using
+                )
+        if self.history_enabled :
+            history_recorder.record_save(self, adding, stored_values, kwargs.get("update_fields"), using)
+        #? with update_fields, other changed fields were not written and stay dirty
+        self.snapshot_loaded_values(fields=kwargs.get("update_fields"))
+
+    def delete(self, *args, **kwargs):
+        if not self.outbox_enabled and not self.history_enabled :
+            return super().delete(*args, **kwargs)
+        using : str = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        pk = self.pk
+        with transaction.atomic(using=using):
+            stored_values : Optional[Dict[str, Any]] = None
+            if self.history_enabled :
+                stored_values = history_recorder.get_stored_values(self, using)
+            deleted = super().delete(*args, **kwargs)
+            if self.outbox_enabled :
+                record_outbox_events(type(self), [pk], OutboxActionEnum.DELETE.value, using=using)
+            if stored_values is not None :
+                history_recorder.record_deleted(
+                    type(self), {pk : stored_values}, using, changed_by_id=get_audit_user_detail_id()
+                )
+        return deleted
+
+    # -----------------------
+    # ? History
+    # -----------------------
+
+    def get_history(self):
+        """
+        HistoryRecordModel rows of this object, newest first.
+        """
+        return history_recorder.get_history(type(self), self.pk)
+
+    @classmethod
+    def get_as_of(cls, pk, at : datetime):
+        """
+        The row `pk` as it was at `at` (None if it did not exist then),
+        rebuilt from its history. Needs `history_enabled`.
+        """
+        return history_recorder.get_as_of(cls, pk, at)
+
+
+CORE_GENERIC_NOT_DELETED = models.Q(is_delete=False)
+
+
+class CoreGenericSoftDeleteQuerySet(CoreGenericQuerySet):
+    """
+    Queryset for soft-deletable models; `delete()` stays a hard delete.
+    """
+
+    def alive(self):
+        return self.filter(is_delete=False)
+
+    def deleted(self):
+        return self.filter(is_delete=True)
+
+    def soft_delete(self) -> int :
+        """
+        Marks every row as deleted with a single UPDATE.
+
+        Returns:
+            int: Number of rows marked.
+        """
+        return self.filter(is_delete=False).update(
+            is_delete=True,
+            core_generic_updated_at=timezone.now(),
+        )
+
+    def restore(self) -> int :
+        return self.filter(is_delete=True).update(
+            is_delete=False,
+            core_generic_updated_at=timezone.now(),
+        )
+
+
+class CoreGenericSoftDeleteManager(CoreGenericManager.from_queryset(CoreGenericSoftDeleteQuerySet)):
+    """
+    Hides soft-deleted rows unless built with `include_deleted=True`.
+    """
+
+    def __init__(self, include_deleted : bool = False):
+        super().__init__()
+        self.include_deleted = include_deleted
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.include_deleted :
+            return queryset
+        return queryset.filter(is_delete=False)
+
+
+def get_soft_delete_indexes(indexes : List[models.Index]) -> List[models.Index] :
+    """
+    Partial (`WHERE NOT is_delete`) copies of `indexes`, named `<name>l_idx`.
+
+    Every query through the default manager carries `is_delete = false`, so
+    the planner uses these, and deleted rows take no space in them.
+    """
+    return [
+        models.Index(
+            *index.expressions,
+            fields=index.fields,
+            name=index.name.removesuffix("_idx") + "l_idx",
+            condition=CORE_GENERIC_NOT_DELETED,
+            opclasses=index.opclasses,
+            include=index.include,
+        )
+        for index in indexes
+    ]
+
+
+class CoreGenericSoftDeleteModel(CoreGenericModel):
+    """
+    CoreGenericModel with soft deletes.
+
+    - `objects` excludes deleted rows; `all_objects` sees everything.
+    - `soft_delete()` / `restore()` on instances and querysets.
+    - Every index in `Meta.indexes`, inherited or declared by the subclass,
+      becomes a partial index over live rows (see `make_indexes_partial`),
+      except those named in `soft_delete_full_indexes`.
+    - `db_index=True` and `unique=True` fields keep full indexes: `all_objects`
+      lookups, joins and uniqueness also cover deleted rows. Declare a
+      `Meta.indexes` entry instead of `db_index=True` to get a partial one.
+
+    Related lookups (`_base_manager`) and cascades still see deleted rows.
+    """
+
+    #? names of Meta.indexes kept full, for lookups through `all_objects`
+    soft_delete_full_indexes : Tuple[str, ...] = ()
+
+    is_delete = models.BooleanField(
+        default=False,
+        db_column="IS_DELETE"
+    )
+
+    objects = CoreGenericSoftDeleteManager()
+    all_objects = CoreGenericSoftDeleteManager(include_deleted=True)
+
+    class Meta(CoreGenericModel.Meta):
+        abstract = True
+        indexes = get_soft_delete_indexes(CoreGenericModel.Meta.indexes)
+
+    def soft_delete(self):
+        self.is_delete = True
+        self.save(update_fields=["is_delete", "core_generic_updated_at"])
+
+    def restore(self):
+        self.is_delete = False
+        self.save(update_fields=["is_delete", "core_generic_updated_at"])
+
+
+def make_indexes_partial(sender, **kwargs):
+    """
+    `class_prepared` receiver: adds `WHERE NOT is_delete` to the indexes a
+    concrete CoreGenericSoftDeleteModel declares, keeping their names.
+    Indexes that already have a condition are left as they are.
+    """
+    if not issubclass(sender, CoreGenericSoftDeleteModel) or sender._meta.abstract :
+        return
+    indexes : List[models.Index] = []
+    for index in sender._meta.indexes :
+        if index.condition is None and index.name not in sender.soft_delete_full_indexes :
+            _path, args, index_kwargs = index.deconstruct()
+            index = models.Index(*args, **{**index_kwargs, "condition" : CORE_GENERIC_NOT_DELETED})
+        indexes.append(index)
+    sender._meta.indexes = indexes
+
+
+models.signals.class_prepared.connect(make_indexes_partial, dispatch_uid="core_utils.soft_delete_indexes")
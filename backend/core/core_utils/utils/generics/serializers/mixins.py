@@ -1,5 +1,5 @@
 from typing import Dict,Type,Optional
-from backend.core.core_utils.utils.generics.serializers.generic_serializers import (
+from core_utils.utils.generics.serializers.generic_serializers import (
     CoreGenericGetQuerysetSerializer)
 from django.db.models import QuerySet,Model
 from rest_framework.request import Request
@@ -87,16 +87,21 @@ class CoreGenericBaseHandler :
     Note:
         - Designed to be subclassed by handler classes.
         - Should be inherited first if multiple inheritance is used.
+        - Expensive lookups can be cached with `core_utils.handler_cache.cache_aside`.
 
     Attributes:
         request (Request): DRF request instance.
         data (Dict): Validated data passed from the serializer.
         queryset (QuerySet[Model]): Optional queryset context.
+        instance (Optional[Model]): The row a model-bound view updates, already
+                                    checked against `If-Match`; change it and
+                                    call `save_instance()`.
     """
     request : Request
     data : Dict
     queryset: QuerySet[Model]
     context : Dict
+    instance : Optional[Model]
 
     def __init__(self,request: Request, queryset: QuerySet, context: Dict):
         """
@@ -109,6 +114,21 @@ class CoreGenericBaseHandler :
         self.request = request
         self.queryset = queryset
         self.context = context
+        self.instance = context.get("instance")
+
+    def save_instance(self) -> Optional[Model] :
+        """
+        Saves `instance`. In a model-bound view the save is an `UPDATE ...
+        WHERE core_generic_updated_at = %s` on the version the view checked,
+        so a concurrent write in between raises CoreGenericConcurrencyError
+        (412). Saving another copy of the row skips that check.
+
+        Returns:
+            Optional[Model]: The saved instance, None outside model-bound views.
+        """
+        if self.instance is not None :
+            self.instance.save()
+        return self.instance
     
     def set_data(self, data : Dict):
         """
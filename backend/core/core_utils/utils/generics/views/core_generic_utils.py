@@ -1,10 +1,19 @@
-from typing import Dict,Any,Optional
+from typing import Dict,Any,Optional,List
 from django.db.models.query import QuerySet
 from django.db.models import Model 
 from rest_framework.response import Response
 from rest_framework import status
-
-class CoreGenericUtils:
+from rest_framework.permissions import BasePermission
+from core_utils.utils.generics.generic_models import (
+    CoreGenericConcurrencyError,
+    CoreGenericPreconditionRequiredError,
+)
+from user_config.accounts.enums import UserRoleEnum
+from user_config.user_auth.permissions import CoreGenericRolePermission,user_access_resolver
+from core_utils.utils.generics.views.db_metrics import CoreGenericDbMetricsMixin
+from core_utils.utils.generics.views.statement_timeout import is_query_canceled
+
+class CoreGenericUtils(CoreGenericDbMetricsMixin):
     # -----------
     # ? Class Attributes
     # -----------
@@ -15,11 +24,16 @@ class CoreGenericUtils:
     success_message : Dict[str,str] = {
         "POST" : "Successfully Created",
         "PUT" : "Successfully Updated",
+        "PATCH" : "Successfully Updated",
         "DELETE" : "Successfully Deleted"
     }
 
     exception_message : str = "Internal Server Error"
 
+    #? Role / permission requirements enforced by CoreGenericRolePermission
+    allowed_roles : List[UserRoleEnum] = []
+    required_permissions : List[str] = []
+
     # -------------------------------
     # Request Utilities
     # -------------------------------
@@ -47,6 +61,35 @@ class CoreGenericUtils:
         """
         return self.queryset.all()
 
+    # -------------------------------
+    # ? Access Utilities
+    # -------------------------------
+
+    def get_permissions(self) -> List[BasePermission]:
+        """
+        Appends the role/permission check when the view declares
+        `allowed_roles` or `required_permissions`.
+
+        Returns:
+            List[BasePermission]: DRF permission instances for this view.
+        """
+        permissions : List[BasePermission] = super().get_permissions()
+        if self.allowed_roles or self.required_permissions :
+            permissions.append(CoreGenericRolePermission())
+        return permissions
+
+    def has_role(self,*roles : UserRoleEnum) -> bool :
+        """
+        Checks the request user's role using the cached access resolver.
+        """
+        return user_access_resolver.has_role(self.request.user,*roles)
+
+    def has_perm(self,perm : str) -> bool :
+        """
+        Checks a "app_label.codename" permission using the cached access resolver.
+        """
+        return user_access_resolver.has_perm(user=self.request.user,perm=perm)
+
     def get_success_message(self) -> Optional[Any] :
         """
         Returns the default success message for the current HTTP method.
@@ -114,6 +157,8 @@ class CoreGenericUtils:
         """
         Handles exceptions consistently:
             - Returns a standardized error response
+            - 412 / 428 for optimistic concurrency failures
+            - 503 for queries cancelled by the statement timeout
 
         Args:
             e (Exception): The raised exception.
@@ -121,6 +166,33 @@ class CoreGenericUtils:
         Returns:
             Response: DRF Response with error payload and HTTP 400.
         """ 
+        if isinstance(e, CoreGenericConcurrencyError) :
+            #? optimistic concurrency conflict, the client must re-read and retry
+            return Response(
+                {
+                    "message" : "Record was modified by someone else",
+                    "error" : str(e)
+                },
+                status=status.HTTP_412_PRECONDITION_FAILED
+            )
+        if isinstance(e, CoreGenericPreconditionRequiredError) :
+            return Response(
+                {
+                    "message" : "If-Match header is required",
+                    "error" : str(e)
+                },
+                status=status.HTTP_428_PRECONDITION_REQUIRED
+            )
+        if is_query_canceled(e) :
+            #? the query ran past statement_timeout_ms and was cut off
+            return Response(
+                {
+                    "message" : "Request took too long, please try again",
+                    "error" : str(e)
+                },
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After" : "1"}
+            )
         return Response(
             {
                 "message" : self.exception_message,
@@ -174,7 +246,8 @@ class CoreGenericUtils:
         if isinstance(success_message,str) :
             success_message : str = self.toast_message_value + "" + success_message
         
-        success_message : str = success_message.strip().capitalize()
+        #? GET has no mapped message
+        success_message : str = (success_message or self.toast_message_value).strip().capitalize()
 
         return success_message 
     
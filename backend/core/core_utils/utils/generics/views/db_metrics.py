@@ -0,0 +1,57 @@
+from contextvars import Token
+from typing import Any, Dict, List, Optional
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.request import Request
+from rest_framework.response import Response
+from core_utils.db_pool import connection_wait_recorder, get_pool_metrics
+from core_utils.slow_queries import query_origin_var
+
+
+class CoreGenericDbMetricsMixin:
+    """
+    Database instrumentation of the generic views:
+        - tags the request's queries with the view, handler and serializer
+          for the slow query log (`core_utils.slow_queries`)
+        - reports the time spent getting database connections and the
+          state of the primary's pool in a `Server-Timing` header (shown in
+          the browser's network panel), when `DB_SERVER_TIMING` is on.
+    """
+
+    def get_query_origin(self, request : Request) -> Dict[str, Optional[str]] :
+        serializer_class = getattr(self, "serializer_class", None)
+        return {
+            "view" : f"{type(self).__module__}.{type(self).__qualname__}",
+            "handler" : request.method.lower(),
+            "serializer" : serializer_class.__name__ if serializer_class is not None else None,
+        }
+
+    def dispatch(self, request : Request, *args, **kwargs) -> Response :
+        origin_token : Token = query_origin_var.set(self.get_query_origin(request))
+        try :
+            return self.dispatch_with_server_timing(request, *args, **kwargs)
+        finally :
+            query_origin_var.reset(origin_token)
+
+    def dispatch_with_server_timing(self, request : Request, *args, **kwargs) -> Response :
+        if not settings.DB_SERVER_TIMING :
+            return super().dispatch(request, *args, **kwargs)
+        token : Token = connection_wait_recorder.start_request()
+        try :
+            response : Response = super().dispatch(request, *args, **kwargs)
+        finally :
+            connection_wait : Dict[str, float] = connection_wait_recorder.finish_request(token)
+        response["Server-Timing"] = ", ".join(self.get_server_timing(connection_wait))
+        return response
+
+    def get_server_timing(self, connection_wait : Dict[str, float]) -> List[str] :
+        server_timing : List[str] = [
+            f'db-conn;dur={connection_wait["total"] * 1000:.2f};desc="{connection_wait["count"]} acquired"'
+        ]
+        pool_metrics : Optional[Dict[str, Any]] = get_pool_metrics(DEFAULT_DB_ALIAS)
+        if pool_metrics is not None :
+            server_timing.append(
+                f'db-pool;desc="in_use={pool_metrics["in_use"]} available={pool_metrics["available"]} '
+                f'waiting={pool_metrics["waiting"]} size={pool_metrics["size"]}/{pool_metrics["max_size"]}"'
+            )
+        return server_timing
@@ -2,14 +2,20 @@ from core_utils.utils.generics.views.queryset import CoreGenericQueryset
 from django.db.models.query import QuerySet
 from django.db.models import Model
 from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.serializers import Serializer
-from typing import List,Dict
-from backend.core.core_utils.utils.generics.views.queryset import CoreGenericQuerysetInstance
-from backend.core.core_utils.utils.generics.views.process_view import CoreGenericProcessDataAPIView
+from typing import List,Dict,Any
+from core_utils.utils.generics.views.queryset import CoreGenericQuerysetInstance
+from core_utils.utils.generics.views.process_view import (
+    CoreGenericProcessDataAPIView,
+    CoreGenericProcessDataModelSerializerAPIView,
+)
+from core_utils.utils.generics.views.replica_routing import CoreGenericReplicaReadMixin
+from core_utils.utils.generics.views.statement_timeout import CoreGenericStatementTimeoutMixin
 
 
 
-class CoreGenericListAPIView(CoreGenericQueryset):
+class CoreGenericListAPIView(CoreGenericStatementTimeoutMixin,CoreGenericReplicaReadMixin,CoreGenericQueryset):
     """
     Generic GET API for returning a paginated queryset of model instances.
 
@@ -50,7 +56,7 @@ class CoreGenericListAPIView(CoreGenericQueryset):
             return self.custom_handle_exception(e=e)
 
 
-class CoreGenericGetAPIView(CoreGenericQueryset,CoreGenericQuerysetInstance):
+class CoreGenericGetAPIView(CoreGenericStatementTimeoutMixin,CoreGenericReplicaReadMixin,CoreGenericQueryset,CoreGenericQuerysetInstance):
     """
     Generic GET API for returning one or more model instances based on the `many` flag.
 
@@ -86,7 +92,11 @@ class CoreGenericGetAPIView(CoreGenericQueryset,CoreGenericQuerysetInstance):
                 many = self.many
             )
 
-            return self.success_response(validated_data=serializer.data)
+            response : Response = self.success_response(validated_data=serializer.data)
+            if not self.many and hasattr(queryset, "get_version") :
+                #? clients send it back in If-Match on PUT/PATCH
+                response["ETag"] = f'"{queryset.get_version()}"'
+            return response
         except Exception as e :
             #? custom exception handler
             return self.custom_handle_exception(e=e)
@@ -157,26 +167,72 @@ class CoreGenericPutAPIView(CoreGenericProcessDataAPIView) :
         """
         return self.handle_request()
 
-class CoreGenericDeleteAPIView(CoreGenericProcessDataAPIView) :
+class CoreGenericPatchAPIView(CoreGenericProcessDataModelSerializerAPIView) :
     """
-    Generic DELETE API to handle deletion logic through serializers.
+    Generic PATCH API for partial updates of a single model instance.
 
-    Use this when business rules are involved in deletion,
-    such as soft deletes, cascading checks, etc.
+    The serializer runs with `partial=True`, and the instance's save writes
+    only the columns that actually changed (nothing when none did). Like
+    every model-bound update it honours `If-Match`.
     """
-
-    def delete(self,request: Request, *args: List, **kwargs: Dict) :
+    def patch(self,request: Request, *args: List, **kwargs: Dict) :
         """
-        DELETE handler that delegates logic to serializer.
+        PATCH handler for partially updating data via serializer logic.
         """
         return self.handle_request()
-     
-
-
-
 
+class CoreGenericDeleteAPIView(CoreGenericProcessDataAPIView,CoreGenericQuerysetInstance) :
+    """
+    Generic DELETE API to handle deletion logic through serializers.
 
+    Use this when business rules are involved in deletion,
+    such as soft deletes, cascading checks, etc.
 
+    When `queryset` belongs to a CoreGenericSoftDeleteModel and no
+    `serializer_class` is set, the rows matching `pk_field` (one value or a
+    list) are soft deleted with a single UPDATE instead.
+    """
 
+    soft_delete : bool = True
 
+    def is_soft_delete(self) -> bool :
+        """
+        Returns:
+            bool: True when the request is handled by the built-in soft delete.
+        """
+        queryset = getattr(self, "queryset", None)
+        return (
+            self.soft_delete
+            and getattr(self, "serializer_class", None) is None
+            and queryset is not None
+            and hasattr(queryset, "soft_delete")
+        )
+
+    def get_soft_delete_queryset(self) -> QuerySet[Model] :
+        """
+        Returns:
+            QuerySet[Model]: Live rows whose `pk_field` is in the request.
+        """
+        pk_value : Any = self.get_pk_value(pk_field=self.pk_field)
+        pk_values : List = pk_value if isinstance(pk_value, (list, tuple)) else [pk_value]
+        return self.get_queryset().filter(**{f"{self.pk_field}__in" : pk_values})
+
+    def soft_delete_response(self) -> Response :
+        deleted : int = self.get_soft_delete_queryset().soft_delete()
+        if not deleted :
+            error_message : Dict = {
+                "error_message" : "No matching records to delete"
+            }
+            return self.validation_response(validated_data=error_message)
+        return self.success_response(validated_data={"deleted" : deleted})
 
+    def delete(self,request: Request, *args: List, **kwargs: Dict) :
+        """
+        DELETE handler that soft deletes, or delegates logic to serializer.
+        """
+        if self.is_soft_delete() :
+            try :
+                return self.soft_delete_response()
+            except Exception as e :
+                return self.custom_handle_exception(e=e)
+        return self.handle_request()
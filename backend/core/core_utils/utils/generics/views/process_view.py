@@ -1,12 +1,21 @@
 from core_utils.utils.generics.views.core_generic_utils import CoreGenericUtils
 from rest_framework.request import Request
 from rest_framework.serializers import Serializer
-from typing import Dict
+from typing import Dict,List,Optional,Type
 from rest_framework.response import Response
 from core_utils.utils.constants import CORE_UTILS_DEV_ERROR_MESSAGE
 from core_utils.utils.generics.views.queryset import CoreGenericQuerysetInstance
-
-class CoreGenericProcessDataAPIView(CoreGenericUtils):
+from core_utils.utils.generics.views.replica_routing import CoreGenericPrimaryWriteMixin
+from core_utils.utils.generics.views.statement_timeout import CoreGenericStatementTimeoutMixin
+from core_utils.utils.generics.generic_models import (
+    CoreGenericConcurrencyError,
+    CoreGenericPreconditionRequiredError,
+)
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import router, transaction
+from django.db.models import Model
+
+class CoreGenericProcessDataAPIView(CoreGenericStatementTimeoutMixin,CoreGenericPrimaryWriteMixin,CoreGenericUtils):
     """
     A base API view designed to handle data processing using DRF serializers.
     Supports data ingestion from various request types (JSON, multipart, query params),
@@ -214,14 +223,62 @@ class CoreGenericProcessDataAPIView(CoreGenericUtils):
         return self.success_response(validated_data=response_data["results"])
 
 
-class CoreGenericProcessDataModelSerializerAPIView(CoreGenericQuerysetInstance):
+class CoreGenericProcessDataModelSerializerAPIView(CoreGenericProcessDataAPIView,CoreGenericQuerysetInstance):
     """
     A specialized base view for updating model instances using model-bound serializers.
 
     Retrieves the target model instance, applies request data to it, and invokes serializer logic.
     Suitable for PUT/PATCH operations that involve modifying a single object.
+
+    Writes are optimistic: the save only succeeds if `core_generic_updated_at`
+    still holds the value that was read (`UPDATE ... WHERE` on it, no row
+    lock), else 412. Clients send the ETag of their copy in `If-Match` to
+    also catch edits made since they read it.
+
+    The handler gets the instance as `context["instance"]` (its `instance`)
+    and saves it with `save_instance()`; changes it leaves unsaved are saved
+    by the view. The handler's writes and that save share one transaction,
+    and the response's `ETag` is the version of the row as written.
     """
 
+    #? respond 428 when the request carries no If-Match header
+    require_if_match : bool = False
+
+    def get_if_match_versions(self) -> Optional[List[str]] :
+        """
+        Parses `If-Match` into bare version tokens.
+
+        Returns:
+            Optional[List[str]]: None when the header is absent.
+        """
+        if_match : Optional[str] = self.request.headers.get("If-Match")
+        if not if_match :
+            return None
+        return [
+            version.strip().removeprefix("W/").strip('"')
+            for version in if_match.split(",")
+        ]
+
+    def check_version(self, instance : Model) :
+        """
+        Compares `If-Match` with the loaded row and arms the conditional save.
+
+        Raises:
+            CoreGenericPreconditionRequiredError: If-Match required but missing.
+            CoreGenericConcurrencyError: If-Match does not match the current version.
+        """
+        if not hasattr(instance, "expect_version") :
+            return
+        versions : Optional[List[str]] = self.get_if_match_versions()
+        if versions is None :
+            if self.require_if_match :
+                raise CoreGenericPreconditionRequiredError(f"{instance._meta.label} {instance.pk}")
+        elif "*" not in versions and instance.get_version() not in versions :
+            raise CoreGenericConcurrencyError(
+                f"{instance._meta.label} {instance.pk} was modified by someone else."
+            )
+        instance.expect_version(instance.core_generic_updated_at)
+
     def process_serializer(self) -> Serializer :
         """
         Prepares a model-bound serializer with the instance to update and incoming request data.
@@ -230,22 +287,52 @@ class CoreGenericProcessDataModelSerializerAPIView(CoreGenericQuerysetInstance):
             Serializer: DRF serializer preloaded with an instance and new data.
         """
         context : Dict = self.set_context_data()
+        self.instance : Model = self.get_object()
+        self.check_version(instance=self.instance)
+        #? the handler saves this copy, the one armed with the version check
+        context["instance"] = self.instance
         serializer_class : Serializer = self.get_serializer(
-            instance = self.get_object(),
+            instance = self.instance,
             data = self.get_process_body_data(request=self.request),
             many=False,
+            #? PATCH only validates the fields it sends
+            partial = self.request.method == "PATCH",
             context=context
         )
         return serializer_class
 
+    def handle_process_request(self) -> Response :
+        """
+        Runs the handler, then saves what it changed on the instance but did
+        not save, all in one transaction.
+        """
+        model : Type[Model] = self.get_queryset().model
+        with transaction.atomic(using=router.db_for_write(model)) :
+            response : Response = super().handle_process_request()
+            instance : Optional[Model] = getattr(self, "instance", None)
+            if response.status_code < 300 and getattr(instance, "_has_expected_version", False) :
+                instance.save()
+        return response
+
+    def get_written_version(self, instance : Model) -> Optional[str] :
+        """
+        Version of the row as committed by this request, read back so it is
+        right however the handler wrote it.
+        """
+        try :
+            instance.refresh_from_db(fields=["core_generic_updated_at"])
+        except ObjectDoesNotExist :
+            return None
+        return instance.get_version()
 
-
-
-
-
-
-
-
-
-
-        
+    def handle_request(self) -> Response :
+        """
+        Runs the update and returns the new version in the `ETag` header.
+        """
+        response : Response = super().handle_request()
+        instance : Optional[Model] = getattr(self, "instance", None)
+        if response.status_code < 300 and instance is not None and hasattr(instance, "get_version") :
+            version : Optional[str] = self.get_written_version(instance=instance)
+            if version is not None :
+                response["ETag"] = f'"{version}"'
+        return response
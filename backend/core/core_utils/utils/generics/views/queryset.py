@@ -95,6 +95,9 @@ class CoreGenericQuerysetInstance(CoreGenericUtils):
 
         if self.pk_scope == "PARAMS":
             pk_value = self.get_params().get(pk_field)
+            #? get_params() keeps every query param as a list
+            if isinstance(pk_value, list) and len(pk_value) == 1 :
+                return pk_value[0]
         elif self.pk_scope == "BODY":
             pk_value = self.request.data.get(pk_field)
         elif self.pk_scope == "KWARGS" :
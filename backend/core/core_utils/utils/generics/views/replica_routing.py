@@ -0,0 +1,38 @@
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.response import Response
+from core_utils.db_routing import pin_to_primary, start_replica_reads, stop_replica_reads
+
+
+class CoreGenericReplicaReadMixin:
+    """
+    Serves safe (GET/HEAD/OPTIONS) requests from a healthy read replica,
+    unless the user wrote recently (see `core_utils.db_routing`).
+
+    Set `replica_reads = False` on views that must read from the primary.
+    """
+
+    replica_reads : bool = True
+
+    def initial(self, request : Request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        #? after authentication, so the read-your-writes pin of the user is known
+        if self.replica_reads and request.method in SAFE_METHODS :
+            self.replica_token = start_replica_reads(user=request.user)
+
+    def finalize_response(self, request : Request, response : Response, *args, **kwargs) -> Response :
+        stop_replica_reads(getattr(self, "replica_token", None))
+        self.replica_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class CoreGenericPrimaryWriteMixin:
+    """
+    After a successful write, pins the user's reads to the primary for a
+    short window so replica lag never hides their own changes.
+    """
+
+    def finalize_response(self, request : Request, response : Response, *args, **kwargs) -> Response :
+        if request.method not in SAFE_METHODS and response.status_code < 400 :
+            pin_to_primary(user=getattr(request, "user", None))
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -0,0 +1,92 @@
+from typing import Optional
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, OperationalError, connections, transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+from rest_framework.request import Request
+from rest_framework.response import Response
+from core_utils.db_routing import replica_alias_var
+
+#? PostgreSQL's query_canceled, raised by statement_timeout (and pg_cancel_backend)
+QUERY_CANCELED_SQLSTATE : str = "57014"
+
+
+def is_query_canceled(e : Exception) -> bool :
+    if not isinstance(e, OperationalError) :
+        return False
+    #? psycopg names it `sqlstate`, psycopg2 `pgcode`
+    sqlstate : Optional[str] = getattr(e.__cause__, "sqlstate", None) or getattr(e.__cause__, "pgcode", None)
+    return sqlstate == QUERY_CANCELED_SQLSTATE
+
+
+class CoreGenericStatementTimeoutMixin:
+    """
+    Runs the request in a transaction with `SET LOCAL statement_timeout`, so
+    a runaway query is cancelled by PostgreSQL (and answered with a 503 by
+    `custom_handle_exception`) instead of holding its connection.
+
+    `statement_timeout_ms` overrides `DB_STATEMENT_TIMEOUT_MS` per view; 0
+    disables it. The transaction is opened on the database the request
+    reads from (a replica for replica-routed reads) once the view is
+    authenticated, and is committed before the response is finalized unless
+    a query failed, so a failing commit is answered by
+    `custom_handle_exception` too.
+    """
+
+    statement_timeout_ms : Optional[int] = None
+
+    def get_statement_timeout_ms(self) -> int :
+        if self.statement_timeout_ms is not None :
+            return self.statement_timeout_ms
+        return settings.DB_STATEMENT_TIMEOUT_MS
+
+    def initial(self, request : Request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        timeout_ms : int = self.get_statement_timeout_ms()
+        using : str = replica_alias_var.get() or DEFAULT_DB_ALIAS
+        if timeout_ms <= 0 or connections[using].vendor != "postgresql" :
+            return
+        self.statement_timeout_atomic = transaction.atomic(using=using)
+        self.statement_timeout_atomic.__enter__()
+        self.statement_timeout_using = using
+        with connections[using].cursor() as cursor :
+            #? LOCAL: reverts at the end of the transaction, pooled connections stay clean
+            cursor.execute("SELECT set_config('statement_timeout', %s, true)", [str(timeout_ms)])
+
+    def end_statement_timeout(self, failed : bool):
+        atomic : Optional[transaction.Atomic] = getattr(self, "statement_timeout_atomic", None)
+        if atomic is None :
+            return
+        self.statement_timeout_atomic = None
+        connection : BaseDatabaseWrapper = connections[self.statement_timeout_using]
+        #? a failed query (e.g. the cancelled one) leaves the transaction unusable
+        if failed or connection.needs_rollback or self.is_transaction_failed(connection) :
+            transaction.set_rollback(True, using=self.statement_timeout_using)
+        atomic.__exit__(None, None, None)
+
+    def is_transaction_failed(self, connection : BaseDatabaseWrapper) -> bool :
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+        if connection.connection is None :
+            return False
+        if is_psycopg3 :
+            from psycopg.pq import TransactionStatus
+
+            return connection.connection.info.transaction_status == TransactionStatus.INERROR
+        from psycopg2.extensions import TRANSACTION_STATUS_INERROR
+
+        return connection.connection.get_transaction_status() == TRANSACTION_STATUS_INERROR
+
+    def finalize_response(self, request : Request, response : Response, *args, **kwargs) -> Response :
+        try :
+            #? DRF marks the responses it built from an exception
+            self.end_statement_timeout(failed=getattr(response, "exception", False))
+        except DatabaseError as e :
+            response = self.custom_handle_exception(e=e)
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def dispatch(self, request : Request, *args, **kwargs) -> Response :
+        try :
+            return super().dispatch(request, *args, **kwargs)
+        finally :
+            #? no-op once finalize_response ended it; rolls back if an exception escaped before
+            self.end_statement_timeout(failed=True)
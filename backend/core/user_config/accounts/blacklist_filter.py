@@ -0,0 +1,204 @@
+import logging
+import threading
+from typing import Dict, List, Optional
+from django.core.cache import cache
+from core_utils.utils.bloom_filter import BloomFilter
+from user_config.accounts.constants import (
+    ACCOUNTS_BLACKLIST_FILTER_CACHE_PREFIX,
+    ACCOUNTS_BLACKLIST_FILTER_CHANGE_TIMEOUT,
+    ACCOUNTS_BLACKLIST_FILTER_ERROR_RATE,
+    ACCOUNTS_BLACKLIST_FILTER_MAX_REPLAY,
+    ACCOUNTS_BLACKLIST_FILTER_MIN_CAPACITY,
+)
+
+logger : logging.Logger = logging.getLogger(__name__)
+
+
+class BlackListTokenFilter:
+    """
+    Per-process Bloom filter in front of `BlackListTokenModel`.
+
+    A negative answer is definitive, so the vast majority of checks (tokens
+    that were never revoked) skip the database entirely. A positive answer is
+    confirmed with the indexed digest lookup.
+
+    Sync between processes:
+        - The filter is built from the table on first use.
+        - Every committed revocation increments a change counter in the shared cache and
+          stores its digest under that sequence number.
+        - Before answering, a process replays the digests it has not seen yet.
+          When the gap is too large or a change entry was evicted, it rebuilds.
+        - A revocation that can't be announced pushes the counter past the
+          replay limit, so every process rebuilds from the table. While the
+          cache can't be read, checks fall through to the database.
+
+    Removals (soft deletes, purges) cannot be applied to a Bloom filter; they
+    only raise the false positive rate until the next rebuild, which happens
+    automatically once the filter is over capacity.
+    """
+
+    cache_prefix : str = ACCOUNTS_BLACKLIST_FILTER_CACHE_PREFIX
+    min_capacity : int = ACCOUNTS_BLACKLIST_FILTER_MIN_CAPACITY
+    error_rate : float = ACCOUNTS_BLACKLIST_FILTER_ERROR_RATE
+    max_replay : int = ACCOUNTS_BLACKLIST_FILTER_MAX_REPLAY
+    change_timeout : int = ACCOUNTS_BLACKLIST_FILTER_CHANGE_TIMEOUT
+
+    def __init__(self):
+        self._lock : threading.RLock = threading.RLock()
+        self._bloom_filter : Optional[BloomFilter] = None
+        self._sequence : int = 0
+        self.reset_metrics()
+
+    # -----------------------
+    # ? Shared Change Log
+    # -----------------------
+
+    def get_counter_key(self) -> str :
+        return f"{self.cache_prefix}:counter"
+
+    def get_change_key(self, sequence : int) -> str :
+        return f"{self.cache_prefix}:change:{sequence}"
+
+    def get_counter(self) -> int :
+        return cache.get(self.get_counter_key()) or 0
+
+    def publish(self, digest : str):
+        """
+        Adds a revoked digest locally and announces it to other processes.
+        """
+        with self._lock :
+            if self._bloom_filter is not None :
+                self._bloom_filter.add(digest)
+        try :
+            cache.add(self.get_counter_key(), 0, timeout=None)
+            sequence : int = cache.incr(self.get_counter_key())
+            cache.set(self.get_change_key(sequence), digest, timeout=self.change_timeout)
+        except Exception :
+            logger.exception("Could not announce a token revocation, forcing every filter to rebuild")
+            self.force_rebuild()
+
+    def force_rebuild(self):
+        """
+        Moves the change counter past what any process can replay, so every
+        filter is rebuilt from the table on its next check.
+        """
+        try :
+            cache.add(self.get_counter_key(), 0, timeout=None)
+            cache.incr(self.get_counter_key(), self.max_replay + 1)
+        except Exception :
+            logger.exception("Could not force the token blacklist filters to rebuild")
+
+    # -----------------------
+    # ? Building
+    # -----------------------
+
+    def rebuild(self):
+        """
+        Rebuilds the filter from every active row of the blacklist table.
+        """
+        from user_config.accounts.models import BlackListTokenModel
+
+        #? read the counter first, changes made during the scan are replayed later
+        sequence : int = self.get_counter()
+        queryset = BlackListTokenModel.objects.active()
+        capacity : int = max(self.min_capacity, queryset.count() * 2)
+        bloom_filter : BloomFilter = BloomFilter(capacity=capacity, error_rate=self.error_rate)
+        bloom_filter.update(
+            queryset.values_list("token_digest", flat=True).iterator(chunk_size=5000)
+        )
+        with self._lock :
+            self._bloom_filter = bloom_filter
+            self._sequence = sequence
+            self.rebuilds += 1
+
+    def sync(self):
+        """
+        Brings the local filter up to date with the shared change counter.
+        """
+        counter : int = self.get_counter()
+        bloom_filter : Optional[BloomFilter] = self._bloom_filter
+        if bloom_filter is not None and not bloom_filter.is_saturated() and counter == self._sequence :
+            return
+
+        with self._lock :
+            if self._bloom_filter is None or self._bloom_filter.is_saturated() :
+                self.rebuild()
+                counter = self.get_counter()
+            if counter == self._sequence :
+                return
+            if counter < self._sequence or counter - self._sequence > self.max_replay :
+                #? counter was reset (cache flush) or too far behind to replay
+                self.rebuild()
+                return
+
+            sequences : List[int] = list(range(self._sequence + 1, counter + 1))
+            changes : Dict[str, str] = cache.get_many(
+                [self.get_change_key(sequence) for sequence in sequences]
+            )
+            if len(changes) != len(sequences) :
+                #? an entry expired or was evicted, the log can't be trusted
+                self.rebuild()
+                return
+            self._bloom_filter.update(changes.values())
+            self._sequence = counter
+
+    # -----------------------
+    # ? Lookups
+    # -----------------------
+
+    def might_contain(self, digest : str) -> bool :
+        """
+        False means the digest is definitely not blacklisted.
+        """
+        try :
+            self.sync()
+        except Exception :
+            #? the change log can't be read, the filter may have missed revocations
+            logger.exception("Could not sync the token blacklist filter, checking the database")
+            self.checks += 1
+            self.positives += 1
+            return True
+        self.checks += 1
+        if digest in self._bloom_filter :
+            self.positives += 1
+            return True
+        return False
+
+    def record_false_positive(self):
+        self.false_positives += 1
+
+    # -----------------------
+    # ? Metrics
+    # -----------------------
+
+    def reset_metrics(self):
+        self.checks : int = 0
+        self.positives : int = 0
+        self.false_positives : int = 0
+        self.rebuilds : int = 0
+
+    def get_metrics(self) -> Dict :
+        """
+        Returns counters for this process.
+
+        `false_positive_rate` is measured over checks whose true answer was
+        negative, the same definition as the filter's target `error_rate`.
+        """
+        negatives : int = self.checks - (self.positives - self.false_positives)
+        bloom_filter : Optional[BloomFilter] = self._bloom_filter
+        return {
+            "checks" : self.checks,
+            "db_lookups_skipped" : self.checks - self.positives,
+            "positives" : self.positives,
+            "false_positives" : self.false_positives,
+            "false_positive_rate" : self.false_positives / negatives if negatives else 0.0,
+            "expected_false_positive_rate" : (
+                bloom_filter.get_expected_error_rate() if bloom_filter else 0.0
+            ),
+            "items" : bloom_filter.count if bloom_filter else 0,
+            "capacity" : bloom_filter.capacity if bloom_filter else 0,
+            "rebuilds" : self.rebuilds,
+        }
+
+
+blacklist_token_filter : BlackListTokenFilter = BlackListTokenFilter()
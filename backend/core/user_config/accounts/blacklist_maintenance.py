@@ -0,0 +1,234 @@
+import re
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models.options import Options
+from django.utils import timezone
+from core_utils.utils.db_utils.batch_delete import delete_in_batches
+from user_config.accounts.constants import (
+    ACCOUNTS_BLACKLIST_PARTITIONS_AHEAD,
+    ACCOUNTS_BLACKLIST_PURGE_BATCH_SIZE,
+)
+from user_config.accounts.models import BlackListTokenModel
+
+
+class BlackListTokenPurger:
+    """
+    Deletes expired `BlackListTokenModel` rows in small batches.
+
+    Every batch is its own short transaction (see `delete_in_batches`).
+    """
+
+    batch_size : int = ACCOUNTS_BLACKLIST_PURGE_BATCH_SIZE
+
+    def __init__(self, batch_size : Optional[int] = None, sleep_seconds : float = 0.0):
+        self.batch_size = batch_size or self.batch_size
+        self.sleep_seconds = sleep_seconds
+
+    def purge(self, now : Optional[datetime] = None, log : Optional[Callable[[str], None]] = None) -> int :
+        """
+        Returns:
+            int: Number of deleted rows.
+        """
+        now = now or timezone.now()
+        return delete_in_batches(
+            BlackListTokenModel.all_objects.expired(now=now),
+            batch_size=self.batch_size,
+            sleep_seconds=self.sleep_seconds,
+            log=log,
+            label="expired blacklist rows",
+        )
+
+
+class BlackListTokenPartitioner:
+    """
+    Optional PostgreSQL range partitioning of the blacklist table by
+    `CORE_GENERIC_CREATED_AT`, one partition per month plus a DEFAULT one.
+
+    Whole months older than the retention window whose tokens have all
+    expired are dropped with `DROP TABLE`, which is instant and leaves no
+    dead tuples behind.
+
+    Note:
+        - A partitioned table's unique indexes must include the partition key,
+          so `token_digest` is a plain index (on the model too).
+          `blacklist_token()` still upserts by digest.
+        - PostgreSQL only; every method is a no-op elsewhere.
+    """
+
+    partitions_ahead : int = ACCOUNTS_BLACKLIST_PARTITIONS_AHEAD
+    partition_name_regex : re.Pattern = re.compile(r"_p(\d{4})_(\d{2})$")
+
+    def __init__(self):
+        self.table : str = BlackListTokenModel._meta.db_table
+        self.created_at_column : str = BlackListTokenModel._meta.get_field("core_generic_created_at").column
+
+    # -----------------------
+    # ? Helpers
+    # -----------------------
+
+    def is_supported(self) -> bool :
+        return connection.vendor == "postgresql"
+
+    def quote(self, name : str) -> str :
+        return connection.ops.quote_name(name)
+
+    def is_partitioned(self) -> bool :
+        if not self.is_supported() :
+            return False
+        with connection.cursor() as cursor :
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = %s",
+                [self.table],
+            )
+            return cursor.fetchone() is not None
+
+    def get_month_start(self, value : date, offset : int = 0) -> date :
+        month_index : int = value.year * 12 + value.month - 1 + offset
+        return date(month_index // 12, month_index % 12 + 1, 1)
+
+    def get_partition_name(self, month_start : date) -> str :
+        return f"{self.table}_p{month_start.year:04d}_{month_start.month:02d}"
+
+    def get_partitions(self) -> List[Tuple[str, date]] :
+        """
+        Returns (name, month start) for every monthly partition.
+        """
+        with connection.cursor() as cursor :
+            cursor.execute(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = %s",
+                [self.table],
+            )
+            partitions : List[Tuple[str, date]] = []
+            for (name,) in cursor.fetchall() :
+                match = self.partition_name_regex.search(name)
+                if match :
+                    partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+            return sorted(partitions, key=lambda partition : partition[1])
+
+    # -----------------------
+    # ? Partition Management
+    # -----------------------
+
+    def create_partition(self, cursor, month_start : date):
+        month_end : date = self.get_month_start(month_start, offset=1)
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.quote(self.get_partition_name(month_start))} "
+            f"PARTITION OF {self.quote(self.table)} "
+            f"FOR VALUES FROM (%s) TO (%s)",
+            [month_start, month_end],
+        )
+
+    def ensure_partitions(self, ahead : Optional[int] = None) -> int :
+        """
+        Creates the current month's partition and `ahead` future ones, so new
+        rows never land in the DEFAULT partition.
+        """
+        if not self.is_partitioned() :
+            return 0
+        ahead : int = self.partitions_ahead if ahead is None else ahead
+        this_month : date = self.get_month_start(timezone.now().date())
+        with connection.cursor() as cursor :
+            for offset in range(ahead + 1) :
+                self.create_partition(cursor, self.get_month_start(this_month, offset=offset))
+        return ahead + 1
+
+    def drop_expired_partitions(self, now : Optional[datetime] = None) -> List[str] :
+        """
+        Drops monthly partitions whose rows are all past the retention window
+        and whose tokens have all expired: a revocation must outlive its
+        token, however long the token lives.
+        """
+        if not self.is_partitioned() :
+            return []
+        now = now or timezone.now()
+        cutoff : date = (now - timedelta(days=settings.BLACKLIST_TOKEN_RETENTION_DAYS)).date()
+        expires_at : str = self.quote(BlackListTokenModel._meta.get_field("expires_at").column)
+        dropped : List[str] = []
+        with connection.cursor() as cursor :
+            for name, month_start in self.get_partitions() :
+                if self.get_month_start(month_start, offset=1) > cutoff :
+                    continue
+                #? rows without expires_at only count by creation, which the cutoff covers
+                cursor.execute(f"SELECT MAX({expires_at}) FROM {self.quote(name)}")
+                last_expires_at : Optional[datetime] = cursor.fetchone()[0]
+                if last_expires_at is not None and last_expires_at >= now :
+                    continue
+                cursor.execute(f"DROP TABLE IF EXISTS {self.quote(name)}")
+                dropped.append(name)
+        return dropped
+
+    def convert(self):
+        """
+        One-time conversion of the existing table into a partitioned table.
+
+        Runs in a single transaction; the old table is locked while its rows
+        are copied, so run it in a maintenance window (or right after a purge).
+        """
+        if not self.is_supported() :
+            raise RuntimeError("Blacklist partitioning requires PostgreSQL.")
+        if self.is_partitioned() :
+            return
+
+        table : str = self.quote(self.table)
+        legacy_table : str = self.quote(f"{self.table}_legacy")
+        created_at : str = self.quote(self.created_at_column)
+        meta : Options = BlackListTokenModel._meta
+
+        with transaction.atomic(), connection.cursor() as cursor :
+            cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+            cursor.execute(f"ALTER TABLE {table} RENAME TO {legacy_table}")
+            cursor.execute(
+                f"CREATE TABLE {table} (LIKE {legacy_table} INCLUDING DEFAULTS) "
+                f"PARTITION BY RANGE ({created_at})"
+            )
+            cursor.execute(f"ALTER TABLE {table} ALTER COLUMN {created_at} SET NOT NULL")
+            #? explicit name, the legacy table still owns "<table>_pkey" until dropped
+            cursor.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {self.quote(f'{self.table}_part_pkey')} "
+                f"PRIMARY KEY ({self.quote(meta.pk.column)}, {created_at})"
+            )
+            for field_name in ("token_digest", "expires_at", "user") :
+                column : str = meta.get_field(field_name).column
+                cursor.execute(
+                    f"CREATE INDEX {self.quote(f'{self.table}_{column.lower()}_idx')} "
+                    f"ON {table} ({self.quote(column)})"
+                )
+            for field_name in ("user", "core_generic_created_by", "core_generic_updated_by") :
+                field = meta.get_field(field_name)
+                cursor.execute(
+                    f"ALTER TABLE {table} ADD FOREIGN KEY ({self.quote(field.column)}) "
+                    f"REFERENCES {self.quote(field.related_model._meta.db_table)} "
+                    f"({self.quote(field.target_field.column)}) DEFERRABLE INITIALLY DEFERRED"
+                )
+            cursor.execute(
+                f"CREATE TABLE {self.quote(f'{self.table}_default')} PARTITION OF {table} DEFAULT"
+            )
+
+            #? monthly partitions for every month that already has rows
+            cursor.execute(f"SELECT MIN({created_at}) FROM {legacy_table}")
+            first_created_at : Optional[datetime] = cursor.fetchone()[0]
+            this_month : date = self.get_month_start(timezone.now().date())
+            month_start : date = self.get_month_start(
+                first_created_at.date() if first_created_at else this_month
+            )
+            while month_start <= self.get_month_start(this_month, offset=self.partitions_ahead) :
+                self.create_partition(cursor, month_start)
+                month_start = self.get_month_start(month_start, offset=1)
+
+            #? the partition key can't be NULL, undated legacy rows count from now
+            cursor.execute(
+                f"UPDATE {legacy_table} SET {created_at} = NOW() WHERE {created_at} IS NULL"
+            )
+            cursor.execute(f"INSERT INTO {table} SELECT * FROM {legacy_table}")
+            cursor.execute(f"DROP TABLE {legacy_table}")
+
+            #? Meta.indexes (inherited from CoreGenericModel), their names were held by the legacy table
+            with connection.schema_editor() as schema_editor :
+                for index in meta.indexes :
+                    schema_editor.add_index(BlackListTokenModel, index)
@@ -0,0 +1,7 @@
+ACCOUNTS_BLACKLIST_FILTER_CACHE_PREFIX = "accounts:blacklist_filter"
+ACCOUNTS_BLACKLIST_FILTER_MIN_CAPACITY = 10000
+ACCOUNTS_BLACKLIST_FILTER_ERROR_RATE = 0.001
+ACCOUNTS_BLACKLIST_FILTER_MAX_REPLAY = 1000
+ACCOUNTS_BLACKLIST_FILTER_CHANGE_TIMEOUT = 60 * 60 * 24
+ACCOUNTS_BLACKLIST_PURGE_BATCH_SIZE = 1000
+ACCOUNTS_BLACKLIST_PARTITIONS_AHEAD = 3
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+from user_config.accounts.blacklist_maintenance import BlackListTokenPartitioner
+
+
+class Command(BaseCommand):
+    help : str = "Converts the token blacklist into a monthly range-partitioned table (PostgreSQL only)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ahead", type=int, default=None, help="Future monthly partitions to create")
+
+    def handle(self, *args, **options):
+        partitioner = BlackListTokenPartitioner()
+        if not partitioner.is_supported() :
+            raise CommandError("Blacklist partitioning requires PostgreSQL.")
+
+        if not partitioner.is_partitioned() :
+            partitioner.convert()
+            self.stdout.write(f"Converted {partitioner.table} to a partitioned table")
+
+        partitioner.ensure_partitions(ahead=options["ahead"])
+        for partition_name, _ in partitioner.get_partitions() :
+            self.stdout.write(f"Partition: {partition_name}")
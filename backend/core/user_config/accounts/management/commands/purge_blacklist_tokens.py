@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from user_config.accounts.blacklist_maintenance import (
+    BlackListTokenPartitioner,
+    BlackListTokenPurger,
+)
+from user_config.accounts.constants import ACCOUNTS_BLACKLIST_PURGE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help : str = "Deletes expired token blacklist rows in batches (and drops old partitions when partitioned)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=ACCOUNTS_BLACKLIST_PURGE_BATCH_SIZE)
+        parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to pause between batches")
+
+    def handle(self, *args, **options):
+        if settings.BLACKLIST_TOKEN_PARTITIONING :
+            partitioner = BlackListTokenPartitioner()
+            partitioner.ensure_partitions()
+            for partition_name in partitioner.drop_expired_partitions() :
+                self.stdout.write(f"Dropped partition: {partition_name}")
+
+        purger = BlackListTokenPurger(batch_size=options["batch_size"], sleep_seconds=options["sleep"])
+        deleted = purger.purge(log=self.stdout.write)
+        self.stdout.write(f"Purged {deleted} expired blacklist rows")
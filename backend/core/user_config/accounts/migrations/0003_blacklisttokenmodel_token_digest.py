@@ -0,0 +1,81 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:20
+
+import hashlib
+from django.db import migrations, models
+from django.db.models import Count
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill_token_digest(apps, schema_editor):
+    """
+    Fills the digest of existing rows in small batches; the migration is not
+    atomic, so every batch commits on its own and row locks stay short.
+    """
+    token_model = apps.get_model("accounts", "BlackListTokenModel")
+    queryset = token_model.objects.using(schema_editor.connection.alias)
+    while True:
+        batch = list(
+            queryset.filter(token_digest__isnull=True)
+            .values_list("pk", "token")[:BACKFILL_BATCH_SIZE]
+        )
+        if not batch:
+            break
+        token_model.objects.using(schema_editor.connection.alias).bulk_update(
+            [
+                token_model(pk=pk, token_digest=hashlib.sha256((token or "").encode("utf-8")).hexdigest())
+                for pk, token in batch
+            ],
+            ["token_digest"],
+        )
+
+
+def remove_duplicate_digests(apps, schema_editor):
+    """
+    The same token blacklisted twice carries no extra information; keep the
+    oldest row so the unique index can be built.
+    """
+    token_model = apps.get_model("accounts", "BlackListTokenModel")
+    queryset = token_model.objects.using(schema_editor.connection.alias)
+    duplicates = (
+        queryset.values("token_digest")
+        .annotate(total=Count("pk"))
+        .filter(total__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        keep = (
+            queryset.filter(token_digest=duplicate["token_digest"])
+            .order_by("core_generic_created_at", "pk")
+            .values_list("pk", flat=True)
+            .first()
+        )
+        queryset.filter(token_digest=duplicate["token_digest"]).exclude(pk=keep).delete()
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blacklisttokenmodel',
+            name='token_digest',
+            field=models.CharField(db_column='JWT_TOKEN_DIGEST', editable=False, max_length=64, null=True),
+        ),
+        migrations.RunPython(backfill_token_digest, migrations.RunPython.noop),
+        migrations.RunPython(remove_duplicate_digests, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='blacklisttokenmodel',
+            name='token_digest',
+            field=models.CharField(db_column='JWT_TOKEN_DIGEST', editable=False, max_length=64, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='blacklisttokenmodel',
+            name='token',
+            field=models.TextField(blank=True, db_column='JWT_TOKEN', null=True),
+        ),
+    ]
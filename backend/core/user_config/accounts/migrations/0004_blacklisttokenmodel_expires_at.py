@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_blacklisttokenmodel_token_digest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blacklisttokenmodel',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, db_column='EXPIRES_AT', db_index=True, null=True),
+        ),
+    ]
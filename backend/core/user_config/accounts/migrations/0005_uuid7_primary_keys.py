@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:14
+
+import core_utils.utils.uuid7
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_blacklisttokenmodel_expires_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='blacklisttokenmodel',
+            name='id',
+            field=models.UUIDField(db_column='BLACK_LIST_TOKEN_ID', default=core_utils.utils.uuid7.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
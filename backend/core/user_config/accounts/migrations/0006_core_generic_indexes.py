@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:16
+
+from django.conf import settings
+from django.db import migrations, models
+from core_utils.utils.db_utils.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    #? CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0005_uuid7_primary_keys'),
+        ('user_auth', '0004_uuid7_primary_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='blacklisttokenmodel',
+            index=models.Index(fields=['core_generic_created_at', 'id'], name='blacklisttokenmodel_cg_ca_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='blacklisttokenmodel',
+            index=models.Index(fields=['core_generic_updated_at'], name='blacklisttokenmodel_cg_ua_idx'),
+        ),
+    ]
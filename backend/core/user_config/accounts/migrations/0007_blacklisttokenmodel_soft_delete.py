@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:18
+
+from django.conf import settings
+from django.db import migrations, models
+from core_utils.utils.db_utils.operations import AddIndexConcurrently, RemoveIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    #? CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0006_core_generic_indexes'),
+        ('user_auth', '0005_core_generic_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    #? build the partial indexes before dropping the full ones
+    operations = [
+        AddIndexConcurrently(
+            model_name='blacklisttokenmodel',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['core_generic_created_at', 'id'], name='blacklisttokenmodel_cg_cal_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='blacklisttokenmodel',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['core_generic_updated_at'], name='blacklisttokenmodel_cg_ual_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='blacklisttokenmodel',
+            name='blacklisttokenmodel_cg_ca_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='blacklisttokenmodel',
+            name='blacklisttokenmodel_cg_ua_idx',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_blacklisttokenmodel_soft_delete'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='blacklisttokenmodel',
+            name='token_digest',
+            field=models.CharField(db_column='JWT_TOKEN_DIGEST', db_index=True, editable=False, max_length=64),
+        ),
+    ]
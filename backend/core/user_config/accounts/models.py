@@ -1,14 +1,134 @@
-from django.db import models
-from core_utils.utils.generics.generic_models import CoreGenericModel
-import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+from core_utils.utils.generics.generic_models import (
+    CoreGenericSoftDeleteManager,
+    CoreGenericSoftDeleteModel,
+    CoreGenericSoftDeleteQuerySet,
+)
+from core_utils.utils.cache import is_shared_cache
+from core_utils.utils.uuid7 import uuid7
+from user_config.accounts.blacklist_filter import blacklist_token_filter
+import hashlib
 from user_config.user_auth.models import UserModel
 
 # Create your models here.
 
-class BlackListTokenModel(CoreGenericModel):
+
+def get_token_digest(token : str) -> str:
+    """
+    Fixed-width SHA-256 hex digest used to index and look up JWTs.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class BlackListTokenQuerySet(CoreGenericSoftDeleteQuerySet):
+    """
+    Queryset for BlackListTokenModel, looking tokens up by digest only.
+    """
+
+    def for_token(self, token : str):
+        return self.filter(token_digest=get_token_digest(token))
+
+    def active(self):
+        return self.alive()
+
+    def expired(self, now : Optional[datetime] = None, retention : Optional[timedelta] = None):
+        """
+        Rows that can no longer match a valid token.
+
+        Rows with `expires_at` are expired once it has passed; legacy rows
+        without it are kept for `retention` after creation.
+        """
+        now = now or timezone.now()
+        retention = retention or timedelta(days=settings.BLACKLIST_TOKEN_RETENTION_DAYS)
+        return self.filter(
+            models.Q(expires_at__lt=now)
+            | models.Q(expires_at__isnull=True, core_generic_created_at__lt=now - retention)
+        )
+
+
+class BlackListTokenManager(CoreGenericSoftDeleteManager.from_queryset(BlackListTokenQuerySet)):
+    """
+    Object Manager for BlackListTokenModel
+
+    The raw JWT column is deferred by default, checks never need it.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().defer("token")
+
+    def is_blacklisted(self, token : str) -> bool:
+        """
+        Checks a token, answering most negatives from the in-memory Bloom
+        filter and confirming positives with a unique-index lookup on its digest.
+
+        The filter only learns about revocations made by other processes
+        through the shared cache, so with a process-local cache every check
+        goes to the database.
+        """
+        token_digest : str = get_token_digest(token)
+        if is_shared_cache() and not blacklist_token_filter.might_contain(token_digest) :
+            return False
+        is_blacklisted : bool = self.filter(token_digest=token_digest).exists()
+        if not is_blacklisted :
+            blacklist_token_filter.record_false_positive()
+        return is_blacklisted
+
+    def blacklist_token(
+        self,
+        user : UserModel,
+        token : str,
+        expires_at : Optional[datetime] = None,
+        store_token : bool = False,
+        **extra_fields
+    ):
+        """
+        Revokes a token; re-revoking a soft-deleted entry revives it.
+
+        Args:
+            user (UserModel): Owner of the token.
+            token (str): The raw JWT.
+            expires_at (Optional[datetime]): The token's own expiry (`exp` claim);
+                                             the row is purged after it.
+            store_token (bool): Also keep the raw JWT (for auditing only).
+        """
+        defaults : dict = {
+            "user" : user,
+            "is_delete" : False,
+            "expires_at" : expires_at,
+            "token" : token if store_token else None,
+            **extra_fields,
+        }
+        token_digest : str = get_token_digest(token)
+        with transaction.atomic(using=self.db):
+            #? all_objects, so a soft-deleted row with this digest is revived, not duplicated;
+            #? the digest is not unique (see BlackListTokenPartitioner), so take the oldest row
+            instance = (
+                self.model.all_objects.select_for_update()
+                .filter(token_digest=token_digest)
+                .order_by("core_generic_created_at")
+                .first()
+            )
+            if instance is None :
+                instance = self.model.all_objects.create(token_digest=token_digest, **defaults)
+            else :
+                for field_name, field_value in defaults.items() :
+                    setattr(instance, field_name, field_value)
+                instance.save()
+        #? announced once visible, a rolled back revocation must not reach the filters
+        transaction.on_commit(
+            lambda : blacklist_token_filter.publish(token_digest), using=self.db, robust=True
+        )
+        return instance
+
+
+class BlackListTokenModel(CoreGenericSoftDeleteModel):
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         db_column="BLACK_LIST_TOKEN_ID"
     )
@@ -21,19 +141,35 @@ class BlackListTokenModel(CoreGenericModel):
     )
 
     token = models.TextField(
+        null=True,
+        blank=True,
         db_column="JWT_TOKEN"
     )
 
-    is_login = models.BooleanField(
-        default=False,
-        db_column="IS_LOGIN"
+    #? indexed but not unique: a partitioned table can't enforce it (see BlackListTokenPartitioner)
+    token_digest = models.CharField(
+        max_length=64,
+        db_index=True,
+        editable=False,
+        db_column="JWT_TOKEN_DIGEST"
     )
 
-    is_delete = models.BooleanField(
-        default=False,
-        db_column="IS_DELETE"
+    expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        db_column="EXPIRES_AT"
     )
 
+    is_login = models.BooleanField(
+        default=False,
+        db_column="IS_LOGIN"
+    )
 
+    objects = BlackListTokenManager()
+    all_objects = BlackListTokenManager(include_deleted=True)
 
-    
\ No newline at end of file
+    def save(self, *args, **kwargs):
+        if not self.token_digest and self.token :
+            self.token_digest = get_token_digest(self.token)
+        super().save(*args, **kwargs)
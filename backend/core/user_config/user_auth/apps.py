@@ -4,4 +4,7 @@ from django.apps import AppConfig
 class UserAuthConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'user_config.user_auth'
-    label = 'user_auth'
\ No newline at end of file
+    label = 'user_auth'
+
+    def ready(self):
+        from user_config.user_auth import signals  # noqa: F401
@@ -0,0 +1,62 @@
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from rest_framework.request import Request
+from user_config.user_auth.constants import USER_AUTH_JWT_AUTH_HEADER_PREFIX
+from user_config.user_auth.jwt_service import JWTError, jwt_service
+from user_config.user_auth.models import UserModel
+
+
+class JWTAuthentication(BaseAuthentication):
+    """
+    DRF authentication using `Authorization: Bearer <access token>`.
+
+    The request user is rebuilt from the token claims instead of being
+    fetched, so authentication costs no query. It carries the pk, email,
+    role id, staff/superuser flags and token version; call
+    `refresh_from_db()` before using any other field (it is left unsaved
+    on purpose, so it can never overwrite the row). Role and permission
+    checks go through `user_access_resolver`, which caches by pk.
+
+    The user is taken as active: deactivating a user bumps their token
+    version (see `UserModel.save`), so tokens of inactive users no longer
+    verify.
+    """
+
+    keyword : str = USER_AUTH_JWT_AUTH_HEADER_PREFIX
+
+    def get_raw_token(self, request : Request) -> Optional[str] :
+        auth_header = get_authorization_header(request).split()
+        if not auth_header or auth_header[0].lower() != self.keyword.lower().encode() :
+            return None
+        if len(auth_header) != 2 :
+            raise exceptions.AuthenticationFailed("Invalid Authorization header.")
+        return auth_header[1].decode("utf-8")
+
+    def get_user_from_claims(self, claims : Dict[str, Any]) -> UserModel :
+        role_id : Optional[str] = claims.get("rid")
+        user : UserModel = UserModel(
+            id=UUID(claims["sub"]),
+            email=claims.get("email") or "",
+            user_role_id=UUID(role_id) if role_id else None,
+            is_staff=claims.get("stf", False),
+            is_superuser=claims.get("su", False),
+            #? an inactive user's tokens fail the version check in verify()
+            is_active=True,
+            token_version=claims.get(jwt_service.version_claim) or 0,
+        )
+        return user
+
+    def authenticate(self, request : Request) -> Optional[Tuple[UserModel, Dict[str, Any]]] :
+        raw_token : Optional[str] = self.get_raw_token(request=request)
+        if raw_token is None :
+            return None
+        try :
+            claims : Dict[str, Any] = jwt_service.verify(token=raw_token)
+        except JWTError as e :
+            raise exceptions.AuthenticationFailed(str(e))
+        return self.get_user_from_claims(claims=claims), claims
+
+    def authenticate_header(self, request : Request) -> str :
+        return self.keyword
@@ -0,0 +1,38 @@
+from typing import Optional
+from django.contrib.auth.backends import ModelBackend
+from rest_framework.request import Request
+from user_config.user_auth.models import UserModel
+
+
+class EmailModelBackend(ModelBackend):
+    """
+    Authenticates by email, case-insensitively, through the
+    `LOWER("EMAIL")` unique index.
+    """
+
+    def get_user_for_email(self, email : str) -> Optional[UserModel] :
+        try :
+            return UserModel.objects.by_email(email).get()
+        except UserModel.DoesNotExist :
+            return None
+
+    def authenticate(
+        self,
+        request : Optional[Request],
+        username : Optional[str] = None,
+        password : Optional[str] = None,
+        **kwargs,
+    ) -> Optional[UserModel] :
+        email : Optional[str] = username or kwargs.get(UserModel.USERNAME_FIELD)
+        if not email or password is None :
+            return None
+
+        user : Optional[UserModel] = self.get_user_for_email(email=email)
+        if user is None :
+            #? run the hasher anyway to keep response times uniform (see ModelBackend)
+            UserModel().set_password(password)
+            return None
+
+        if user.check_password(password) and self.user_can_authenticate(user) :
+            return user
+        return None
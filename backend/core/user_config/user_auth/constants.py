@@ -0,0 +1,17 @@
+USER_AUTH_ACCESS_CACHE_PREFIX = "user_auth:access"
+USER_AUTH_ACCESS_CACHE_TIMEOUT = 60 * 15
+USER_AUTH_ACCESS_REQUEST_ATTR = "_user_auth_access_cache"
+USER_AUTH_ROLE_REGISTRY_VERSION_KEY = "user_auth:role_registry:version"
+USER_AUTH_ROLE_REGISTRY_CHECK_INTERVAL = 30
+USER_AUTH_BULK_HASH_MAX_WORKERS = 4
+USER_AUTH_BULK_HASH_MIN_PASSWORDS = 32
+USER_AUTH_BULK_CREATE_BATCH_SIZE = 500
+USER_AUTH_TOKEN_VERSION_CACHE_PREFIX = "user_auth:token_version"
+USER_AUTH_TOKEN_VERSION_CACHE_TIMEOUT = 60 * 60 * 24
+USER_AUTH_TOKEN_VERSION_LOCAL_TTL = 5
+USER_AUTH_TOKEN_VERSION_LOCAL_MAX_ENTRIES = 10000
+USER_AUTH_TOKEN_VERSION_CLAIM = "ver"
+USER_AUTH_JWT_ACCESS_TOKEN_TYPE = "access"
+USER_AUTH_JWT_REFRESH_TOKEN_TYPE = "refresh"
+USER_AUTH_JWT_AUTH_HEADER_PREFIX = "Bearer"
+USER_AUTH_SESSION_PURGE_BATCH_SIZE = 1000
@@ -0,0 +1,7 @@
+from core_utils.utils.enums import EnumChoices
+
+
+class BulkUserStatusEnum(EnumChoices):
+    CREATED = "CREATED"
+    DUPLICATE = "DUPLICATE"
+    INVALID = "INVALID"
@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunableArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2 hasher whose cost parameters come from settings.
+
+    Raising any of the costs makes `must_update()` true for older hashes, so
+    they are upgraded transparently on the next successful login.
+    """
+
+    @property
+    def time_cost(self) -> int :
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self) -> int :
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self) -> int :
+        return settings.PASSWORD_ARGON2_PARALLELISM
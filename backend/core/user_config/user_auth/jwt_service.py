@@ -0,0 +1,229 @@
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+import jwt
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from user_config.user_auth.constants import (
+    USER_AUTH_JWT_ACCESS_TOKEN_TYPE,
+    USER_AUTH_JWT_REFRESH_TOKEN_TYPE,
+    USER_AUTH_TOKEN_VERSION_CLAIM,
+)
+from user_config.user_auth.token_versions import user_token_version_store
+
+
+class JWTError(Exception):
+    """
+    Raised for any token that must not be accepted.
+    """
+
+
+class JWTKeyStore:
+    """
+    Loads and parses signing/verification keys once per process.
+
+    Parsing PEM keys is far more expensive than verifying a signature, so key
+    objects are built on first use and reused for every token. Tokens carry a
+    `kid` header so a previous public key can keep verifying during rotation.
+    """
+
+    def __init__(self):
+        self._lock : threading.Lock = threading.Lock()
+        self._is_loaded : bool = False
+        self.algorithm : str = ""
+        self.key_id : str = ""
+        self.signing_key : Any = None
+        self.verifying_keys : Dict[str, Any] = {}
+
+    def read_pem(self, value : str) -> bytes :
+        """
+        Accepts a PEM string or a path to a PEM file.
+        """
+        if value.lstrip().startswith("-----BEGIN") :
+            return value.encode("utf-8")
+        return Path(value).read_bytes()
+
+    def is_symmetric(self) -> bool :
+        return self.algorithm.startswith("HS")
+
+    def load(self):
+        algorithm : str = settings.JWT_ALGORITHM
+        key_id : str = settings.JWT_KEY_ID
+        verifying_keys : Dict[str, Any] = {}
+
+        if algorithm.startswith("HS") :
+            signing_key : Any = settings.SECRET_KEY
+            verifying_keys[key_id] = signing_key
+        else :
+            if settings.JWT_PRIVATE_KEY :
+                signing_key = load_pem_private_key(self.read_pem(settings.JWT_PRIVATE_KEY), password=None)
+            elif settings.DEBUG and algorithm == "EdDSA" :
+                #? dev only: tokens do not survive restarts or cross processes
+                signing_key = Ed25519PrivateKey.generate()
+            else :
+                raise ImproperlyConfigured("JWT_PRIVATE_KEY is required for asymmetric JWT algorithms.")
+            verifying_keys[key_id] = signing_key.public_key()
+
+        if settings.JWT_PREVIOUS_PUBLIC_KEY and not algorithm.startswith("HS") :
+            verifying_keys[settings.JWT_PREVIOUS_KEY_ID] = load_pem_public_key(
+                self.read_pem(settings.JWT_PREVIOUS_PUBLIC_KEY)
+            )
+
+        self.algorithm = algorithm
+        self.key_id = key_id
+        self.signing_key = signing_key
+        self.verifying_keys = verifying_keys
+        self._is_loaded = True
+
+    def ensure_loaded(self):
+        if not self._is_loaded :
+            with self._lock :
+                if not self._is_loaded :
+                    self.load()
+
+    def get_signing_key(self) -> Any :
+        self.ensure_loaded()
+        return self.signing_key
+
+    def get_verifying_key(self, key_id : Optional[str]) -> Any :
+        self.ensure_loaded()
+        verifying_key : Any = self.verifying_keys.get(key_id or self.key_id)
+        if verifying_key is None :
+            raise JWTError("Unknown signing key")
+        return verifying_key
+
+
+class JWTService:
+    """
+    Issues and verifies access/refresh tokens.
+
+    Verification never touches the database except for the blacklist check,
+    and that one is answered in memory by the Bloom filter for non-revoked
+    tokens. Session-wide revocation uses the per-user token version
+    (`ver` claim) held by `user_token_version_store`.
+    """
+
+    access_token_type : str = USER_AUTH_JWT_ACCESS_TOKEN_TYPE
+    refresh_token_type : str = USER_AUTH_JWT_REFRESH_TOKEN_TYPE
+    version_claim : str = USER_AUTH_TOKEN_VERSION_CLAIM
+
+    def __init__(self, key_store : Optional[JWTKeyStore] = None):
+        self.key_store : JWTKeyStore = key_store or JWTKeyStore()
+
+    # -----------------------
+    # ? Issuing
+    # -----------------------
+
+    def get_lifetime(self, token_type : str) -> timedelta :
+        if token_type == self.refresh_token_type :
+            return timedelta(seconds=settings.JWT_REFRESH_TOKEN_LIFETIME_SECONDS)
+        return timedelta(seconds=settings.JWT_ACCESS_TOKEN_LIFETIME_SECONDS)
+
+    def get_user_claims(self, user) -> Dict[str, Any] :
+        """
+        Claims needed to rebuild the request user without a query.
+        """
+        return {
+            "sub" : str(user.pk),
+            "email" : user.email,
+            "rid" : str(user.user_role_id) if user.user_role_id else None,
+            "stf" : user.is_staff,
+            "su" : user.is_superuser,
+            self.version_claim : user.token_version,
+        }
+
+    def issue_token(self, user, token_type : str) -> str :
+        issued_at : datetime = datetime.now(tz=dt_timezone.utc)
+        payload : Dict[str, Any] = {
+            **self.get_user_claims(user=user),
+            "iss" : settings.JWT_ISSUER,
+            "iat" : issued_at,
+            "exp" : issued_at + self.get_lifetime(token_type=token_type),
+            "jti" : uuid.uuid4().hex,
+            "typ" : token_type,
+        }
+        return jwt.encode(
+            payload,
+            self.key_store.get_signing_key(),
+            algorithm=self.key_store.algorithm,
+            headers={"kid" : self.key_store.key_id},
+        )
+
+    def issue_token_pair(self, user) -> Dict[str, str] :
+        return {
+            "access" : self.issue_token(user=user, token_type=self.access_token_type),
+            "refresh" : self.issue_token(user=user, token_type=self.refresh_token_type),
+        }
+
+    # -----------------------
+    # ? Verifying
+    # -----------------------
+
+    def decode(self, token : str) -> Dict[str, Any] :
+        """
+        Checks signature, expiry and issuer only (no revocation checks).
+        """
+        try :
+            key_id : Optional[str] = jwt.get_unverified_header(token).get("kid")
+            return jwt.decode(
+                token,
+                self.key_store.get_verifying_key(key_id=key_id),
+                algorithms=[self.key_store.algorithm],
+                issuer=settings.JWT_ISSUER,
+                options={"require" : ["exp", "iat", "sub", "typ"]},
+            )
+        except jwt.PyJWTError as e :
+            raise JWTError(str(e)) from e
+
+    def verify(self, token : str, token_type : Optional[str] = None) -> Dict[str, Any] :
+        """
+        Fully verifies a token.
+
+        Raises:
+            JWTError: If the token is invalid, of the wrong type, or revoked.
+        """
+        from user_config.accounts.models import BlackListTokenModel
+
+        claims : Dict[str, Any] = self.decode(token=token)
+        if claims["typ"] != (token_type or self.access_token_type) :
+            raise JWTError("Wrong token type")
+        if not user_token_version_store.is_current(
+            user_id=claims["sub"], version=claims.get(self.version_claim)
+        ):
+            raise JWTError("Token has been revoked")
+        if BlackListTokenModel.objects.is_blacklisted(token) :
+            raise JWTError("Token has been revoked")
+        return claims
+
+    def refresh(self, refresh_token : str, user) -> Dict[str, str] :
+        """
+        Rotates a refresh token: the old one is revoked, a new pair issued.
+        """
+        claims : Dict[str, Any] = self.verify(token=refresh_token, token_type=self.refresh_token_type)
+        if claims["sub"] != str(user.pk) :
+            raise JWTError("Token does not belong to user")
+        self.revoke(token=refresh_token, user=user, claims=claims)
+        return self.issue_token_pair(user=user)
+
+    def revoke(self, token : str, user, claims : Optional[Dict[str, Any]] = None):
+        """
+        Revokes a single token until it would have expired anyway.
+        """
+        from user_config.accounts.models import BlackListTokenModel
+
+        claims = claims or self.decode(token=token)
+        BlackListTokenModel.objects.blacklist_token(
+            user=user,
+            token=token,
+            expires_at=datetime.fromtimestamp(claims["exp"], tz=dt_timezone.utc),
+        )
+
+
+jwt_service : JWTService = JWTService()
@@ -0,0 +1,51 @@
+import time
+import uuid
+from typing import Callable
+from django.core.management.base import BaseCommand
+from user_config.user_auth.jwt_service import jwt_service
+from user_config.user_auth.models import UserModel
+
+
+class Command(BaseCommand):
+    help : str = "Measures JWT verifications per second on a single core"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seconds", type=float, default=3.0, help="Duration of each run")
+        parser.add_argument(
+            "--email",
+            default=None,
+            help="Existing user for the full verify path (version + blacklist checks)",
+        )
+
+    def measure(self, label : str, verify : Callable[[], object], seconds : float):
+        #? warm up key parsing, bloom filter and caches
+        for _ in range(100) :
+            verify()
+
+        iterations : int = 0
+        started_at : float = time.perf_counter()
+        deadline : float = started_at + seconds
+        while time.perf_counter() < deadline :
+            for _ in range(100) :
+                verify()
+            iterations += 100
+        elapsed : float = time.perf_counter() - started_at
+        self.stdout.write(
+            f"{label}: {iterations / elapsed:,.0f} verifications/s/core "
+            f"({elapsed / iterations * 1e6:.1f} us each)"
+        )
+
+    def handle(self, *args, **options):
+        seconds : float = options["seconds"]
+
+        if options["email"] :
+            user : UserModel = UserModel.objects.get_by_natural_key(options["email"])
+        else :
+            user = UserModel(id=uuid.uuid4(), email="benchmark@example.com")
+
+        token : str = jwt_service.issue_token(user=user, token_type=jwt_service.access_token_type)
+        self.stdout.write(f"Algorithm: {jwt_service.key_store.algorithm}, token size: {len(token)} bytes")
+
+        self.measure("signature + claims", lambda : jwt_service.decode(token=token), seconds)
+        if options["email"] :
+            self.measure("full verify", lambda : jwt_service.verify(token=token), seconds)
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from user_config.user_auth.constants import USER_AUTH_SESSION_PURGE_BATCH_SIZE
+from user_config.user_auth.sessions import ExpiredSessionPurger
+
+
+class Command(BaseCommand):
+    help : str = "Deletes expired sessions in batches (batched replacement for clearsessions)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=USER_AUTH_SESSION_PURGE_BATCH_SIZE)
+        parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to pause between batches")
+
+    def handle(self, *args, **options):
+        purger = ExpiredSessionPurger(batch_size=options["batch_size"], sleep_seconds=options["sleep"])
+        if purger.get_model_class() is None :
+            self.stdout.write(f"{settings.SESSION_ENGINE} does not store sessions in the database, nothing to purge")
+            return
+        deleted = purger.purge(log=self.stdout.write)
+        self.stdout.write(f"Purged {deleted} expired sessions")
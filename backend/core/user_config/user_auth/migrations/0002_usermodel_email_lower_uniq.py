@@ -0,0 +1,115 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:04
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count, F
+from django.db.models.functions import Lower
+
+BACKFILL_BATCH_SIZE = 1000
+EMAIL_LOWER_INDEX_NAME = "usermodel_email_lower_uniq"
+
+
+def validate_case_insensitive_emails(apps, schema_editor):
+    """
+    Refuses to continue if two users share an email differing only by case.
+    """
+    user_model = apps.get_model("user_auth", "UserModel")
+    duplicates = list(
+        user_model.objects.using(schema_editor.connection.alias)
+        .annotate(email_lower=Lower("email"))
+        .values("email_lower")
+        .annotate(total=Count("pk"))
+        .filter(total__gt=1)
+        .values_list("email_lower", flat=True)[:20]
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Resolve case-insensitive duplicate emails before migrating: "
+            + ", ".join(duplicates)
+        )
+
+
+def backfill_lowercase_emails(apps, schema_editor):
+    """
+    Lowercases stored emails in small batches; the migration is not atomic,
+    so every batch commits on its own and row locks stay short.
+    """
+    user_model = apps.get_model("user_auth", "UserModel")
+    queryset = user_model.objects.using(schema_editor.connection.alias)
+    while True:
+        batch_ids = list(
+            queryset.annotate(email_lower=Lower("email"))
+            .exclude(email=F("email_lower"))
+            .values_list("pk", flat=True)[:BACKFILL_BATCH_SIZE]
+        )
+        if not batch_ids:
+            break
+        queryset.filter(pk__in=batch_ids).update(email=Lower("email"))
+
+
+def create_email_lower_index(apps, schema_editor):
+    """
+    Builds the functional unique index without blocking writes on PostgreSQL.
+    """
+    user_model = apps.get_model("user_auth", "UserModel")
+    if schema_editor.connection.vendor == "postgresql":
+        table = schema_editor.quote_name(user_model._meta.db_table)
+        column = schema_editor.quote_name(user_model._meta.get_field("email").column)
+        #? an interrupted concurrent build leaves an INVALID index behind, which
+        #? IF NOT EXISTS would accept while it enforces nothing
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid "
+                "WHERE pg_class.relname = %s AND pg_table_is_visible(pg_class.oid) AND NOT pg_index.indisvalid",
+                [EMAIL_LOWER_INDEX_NAME],
+            )
+            is_invalid = cursor.fetchone() is not None
+        if is_invalid:
+            schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {EMAIL_LOWER_INDEX_NAME}")
+        schema_editor.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {EMAIL_LOWER_INDEX_NAME} "
+            f"ON {table} (LOWER({column}))"
+        )
+    else:
+        schema_editor.add_constraint(
+            user_model,
+            models.UniqueConstraint(Lower("email"), name=EMAIL_LOWER_INDEX_NAME),
+        )
+
+
+def drop_email_lower_index(apps, schema_editor):
+    user_model = apps.get_model("user_auth", "UserModel")
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {EMAIL_LOWER_INDEX_NAME}")
+    else:
+        schema_editor.remove_constraint(
+            user_model,
+            models.UniqueConstraint(Lower("email"), name=EMAIL_LOWER_INDEX_NAME),
+        )
+
+
+class Migration(migrations.Migration):
+
+    #? CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('user_auth', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(validate_case_insensitive_emails, migrations.RunPython.noop),
+        migrations.RunPython(backfill_lowercase_emails, migrations.RunPython.noop),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_email_lower_index, drop_email_lower_index),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='usermodel',
+                    constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='usermodel_email_lower_uniq'),
+                ),
+            ],
+        ),
+    ]
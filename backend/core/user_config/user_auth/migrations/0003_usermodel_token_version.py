@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_auth', '0002_usermodel_email_lower_uniq'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usermodel',
+            name='token_version',
+            field=models.PositiveIntegerField(db_column='TOKEN_VERSION', default=0),
+        ),
+    ]
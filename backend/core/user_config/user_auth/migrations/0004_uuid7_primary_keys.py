@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:14
+
+import core_utils.utils.uuid7
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_auth', '0003_usermodel_token_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usermodel',
+            name='id',
+            field=models.UUIDField(db_column='USER_ID', default=core_utils.utils.uuid7.uuid7, editable=False, primary_key=True, serialize=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='userrolemodel',
+            name='id',
+            field=models.UUIDField(db_column='USER_ROLE_ID', default=core_utils.utils.uuid7.uuid7, primary_key=True, serialize=False),
+        ),
+    ]
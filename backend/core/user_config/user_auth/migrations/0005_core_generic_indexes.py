@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:16
+
+from django.db import migrations, models
+from core_utils.utils.db_utils.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    #? CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('region_data', '0003_core_generic_indexes'),
+        ('user_auth', '0004_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='userdetailmodel',
+            index=models.Index(fields=['core_generic_created_at', 'id'], name='userdetailmodel_cg_ca_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='userdetailmodel',
+            index=models.Index(fields=['core_generic_updated_at'], name='userdetailmodel_cg_ua_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='usermodel',
+            index=models.Index(fields=['core_generic_created_at', 'id'], name='usermodel_cg_ca_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='usermodel',
+            index=models.Index(fields=['core_generic_updated_at'], name='usermodel_cg_ua_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='userrolemodel',
+            index=models.Index(fields=['core_generic_created_at', 'id'], name='userrolemodel_cg_ca_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='userrolemodel',
+            index=models.Index(fields=['core_generic_updated_at'], name='userrolemodel_cg_ua_idx'),
+        ),
+    ]
@@ -1,6 +1,5 @@
 from django.db import models,transaction
 from core_utils.region_data.models import CityModel, CountryModel, StateModel
-import uuid
 from user_config.accounts.enums import UserRoleEnum
 from django.contrib.auth.models import (
     AbstractBaseUser,
@@ -8,14 +7,27 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.apps import apps
-from core_utils.utils.generics.generic_models import CoreGenericModel
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db.models.functions import Lower
+from core_utils.utils.generics.generic_models import CoreGenericModel, CoreGenericQuerySet
+from core_utils.utils.uuid7 import uuid7
+from user_config.user_auth.constants import (
+    USER_AUTH_BULK_CREATE_BATCH_SIZE,
+    USER_AUTH_BULK_HASH_MAX_WORKERS,
+)
+from user_config.user_auth.enums import BulkUserStatusEnum
+from user_config.user_auth.passwords import hash_passwords, password_service
+from user_config.user_auth.role_registry import user_role_registry
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Union
 # Create your models here.
 
 
 class UserRoleModel(CoreGenericModel):
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         db_column="USER_ROLE_ID"
     )
 
@@ -33,13 +45,76 @@ class UserRoleModel(CoreGenericModel):
     )
 
 
-class CustomUserManager(BaseUserManager):
+class UserModelQuerySet(CoreGenericQuerySet):
+    """
+    Queryset for UserModel with role-scoped filters.
+    """
+
+    def by_email(self, email : str):
+        """
+        Case-insensitive email filter that compiles to `LOWER("EMAIL") = %s`,
+        so it is served by the functional unique index (unlike `email__iexact`).
+        """
+        return self.alias(email_lower=Lower("email")).filter(
+            email_lower=(email or "").strip().lower()
+        )
+
+    def with_role(self, *roles : Union[UserRoleEnum, str]):
+        """
+        Filters users by role through the in-memory role registry,
+        avoiding a join on UserRoleModel.
+        """
+        return self.filter(user_role_id__in=user_role_registry.get_role_ids(roles))
+
+    def tenants(self):
+        return self.with_role(UserRoleEnum.TENANT)
+
+    def managers(self):
+        return self.with_role(UserRoleEnum.MANAGER)
+
+    def admins(self):
+        return self.with_role(UserRoleEnum.ADMIN)
+
+
+@dataclass
+class BulkUserResult:
+    """
+    Outcome of one input row of `CustomUserManager.bulk_create_users`.
+    """
+    index : int
+    email : str
+    status : BulkUserStatusEnum
+    user : Optional["UserModel"] = None
+    error : Optional[str] = None
+
+
+class CustomUserManager(BaseUserManager.from_queryset(UserModelQuerySet)):
     """
     Object Manager for UserModel
     """
 
+    @classmethod
+    def normalize_email(cls, email : str) -> str:
+        """
+        Emails are stored lowercased so they match the `LOWER("EMAIL")` index.
+        """
+        return super().normalize_email(email).lower()
+
+    def get_by_natural_key(self, username : str):
+        return self.by_email(username).get()
+
+    async def aget_by_natural_key(self, username : str):
+        return await self.by_email(username).aget()
+
+    def set_role_from_registry(self, extra_fields : dict, role : Union[UserRoleEnum, str, None]):
+        """
+        Resolves `role` to `user_role_id` using the role registry (no query).
+        """
+        if role is not None and "user_role" not in extra_fields :
+            extra_fields.setdefault("user_role_id", user_role_registry.get_role_id(role))
+
     def create_user(
-        self,email : str, password : str , **extra_fields
+        self,email : str, password : str , role : Union[UserRoleEnum, str, None] = None, **extra_fields
     ):
         """
         This is a manager method to create a user
@@ -47,14 +122,17 @@ class CustomUserManager(BaseUserManager):
         with transaction.atomic():
             if not email:
                 raise ValueError("Email is required")
-            
+
+            email = self.normalize_email(email)
+            self.set_role_from_registry(extra_fields=extra_fields, role=role)
+
             user : AbstractBaseUser = self.model(email=email, **extra_fields)
 
             if password :
                 user.set_password(password)
             user.save(using=self._db)
             
-            user_detail_model = apps.get_model("UserDetailModel_user")
+            user_detail_model = apps.get_model("user_auth", "UserDetailModel")
 
             user_detail_model.objects.create(user=user)
         
@@ -64,21 +142,131 @@ class CustomUserManager(BaseUserManager):
         """
         This is a manager method to create a superuser
         """
-        extra_fields :dict = {
+        extra_fields.update({
             "is_superuser": True,
             "is_active": True,
             "is_staff": True,
-        }
+        })
+
+        if "user_role" not in extra_fields and "user_role_id" not in extra_fields :
+            extra_fields["user_role_id"] = user_role_registry.get_role_id(
+                UserRoleEnum.ADMIN, create_missing=True
+            )
 
         return self.create_user(email=email,password=password,**extra_fields)
 
+    def bulk_create_users(
+        self,
+        rows : List[Dict[str, Any]],
+        batch_size : int = USER_AUTH_BULK_CREATE_BATCH_SIZE,
+        max_workers : int = USER_AUTH_BULK_HASH_MAX_WORKERS,
+    ) -> List[BulkUserResult]:
+        """
+        Creates many users (and their UserDetailModel rows) at once.
+
+        Each row is a dict with `email`, `password`, `role` (UserRoleEnum or value),
+        an optional `detail` dict for UserDetailModel and any other UserModel field.
+
+        Steps:
+            1. Validate emails and roles, and drop in-batch duplicates.
+            2. Check existing emails with a single query.
+            3. Hash passwords across a process pool.
+            4. `bulk_create` users and details in chunks inside one transaction.
+
+        Note:
+            - Rows are not saved one by one, so `post_save` signals are not sent.
+            - If a concurrent insert takes one of the emails, the whole batch is rolled back.
+
+        Returns:
+            List[BulkUserResult]: One outcome per input row, in input order.
+        """
+        results : List[Optional[BulkUserResult]] = [None] * len(rows)
+        pending : List[tuple] = []
+        seen_emails : Set[str] = set()
+
+        #? per-row validation, no queries
+        for index, row in enumerate(rows):
+            email : str = self.normalize_email(row.get("email") or "")
+            try :
+                validate_email(email)
+            except ValidationError :
+                results[index] = BulkUserResult(
+                    index=index, email=email, status=BulkUserStatusEnum.INVALID, error="Invalid email"
+                )
+                continue
+            #? user_role is NOT NULL, one row without it would fail the whole bulk INSERT
+            if all(row.get(key) is None for key in ("role", "user_role", "user_role_id")) :
+                results[index] = BulkUserResult(
+                    index=index, email=email, status=BulkUserStatusEnum.INVALID, error="Role is required"
+                )
+                continue
+            if email in seen_emails :
+                results[index] = BulkUserResult(
+                    index=index, email=email, status=BulkUserStatusEnum.DUPLICATE, error="Duplicate email in batch"
+                )
+                continue
+            seen_emails.add(email)
+            pending.append((index, email, row))
+
+        #? one query for every email already registered
+        existing_emails : Set[str] = set(
+            self.annotate(email_lower=Lower("email"))
+            .filter(email_lower__in=seen_emails)
+            .values_list("email_lower", flat=True)
+        )
+
+        users : List[UserModel] = []
+        user_rows : List[tuple] = []
+        for index, email, row in pending :
+            if email in existing_emails :
+                results[index] = BulkUserResult(
+                    index=index, email=email, status=BulkUserStatusEnum.DUPLICATE, error="Email already exists"
+                )
+                continue
+            extra_fields : Dict[str, Any] = {
+                key : value for key, value in row.items()
+                if key not in ("email", "password", "role", "detail")
+            }
+            try :
+                self.set_role_from_registry(extra_fields=extra_fields, role=row.get("role"))
+                user : UserModel = self.model(email=email, **extra_fields)
+            except (TypeError, ValueError, UserRoleModel.DoesNotExist) as e :
+                results[index] = BulkUserResult(
+                    index=index, email=email, status=BulkUserStatusEnum.INVALID, error=str(e)
+                )
+                continue
+            users.append(user)
+            user_rows.append((index, email, row))
+
+        hashed_passwords : List[str] = hash_passwords(
+            [row.get("password") for _, _, row in user_rows], max_workers=max_workers
+        )
+        for user, hashed_password in zip(users, hashed_passwords):
+            user.password = hashed_password
+
+        user_detail_model = apps.get_model("user_auth", "UserDetailModel")
+        details : List = [
+            user_detail_model(user=user, **(row.get("detail") or {}))
+            for user, (_, _, row) in zip(users, user_rows)
+        ]
+
+        with transaction.atomic(using=self._db):
+            self.bulk_create(users, batch_size=batch_size)
+            user_detail_model.objects.using(self._db).bulk_create(details, batch_size=batch_size)
+
+        for user, (index, email, _) in zip(users, user_rows):
+            results[index] = BulkUserResult(
+                index=index, email=email, status=BulkUserStatusEnum.CREATED, user=user
+            )
+        return results
+
 
 
 class UserModel(AbstractBaseUser,PermissionsMixin,CoreGenericModel):
     id = models.UUIDField(
         unique=True,
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         db_column='USER_ID'
     )
@@ -135,10 +323,70 @@ class UserModel(AbstractBaseUser,PermissionsMixin,CoreGenericModel):
         db_column="IS_SUPERUSER"
     )
 
+    token_version = models.PositiveIntegerField(
+        default=0,
+        db_column="TOKEN_VERSION"
+    )
+
     USERNAME_FIELD ='email'
     
     objects = CustomUserManager()
 
+    #? `token_version` is only ever written by `revoke_all_tokens` (an F()
+    #? update), so a stale instance can never roll it back on save
+    save_excluded_fields = ("token_version",)
+
+    history_enabled = True
+    history_excluded_fields = ("password", "last_login", "token_version")
+
+    def check_password(self, raw_password : str) -> bool:
+        """
+        Checks the password, upgrading an outdated hash in the background
+        instead of saving it inline.
+        """
+        return password_service.check_password(user=self, raw_password=raw_password)
+
+    async def acheck_password(self, raw_password : str) -> bool:
+        return await password_service.acheck_password(user=self, raw_password=raw_password)
+
+    def set_password(self, raw_password : str):
+        """
+        Sets the password and marks every token issued so far, those of the
+        current session included, for revocation once the user is saved
+        (see `user_config.user_auth.signals`).
+        """
+        super().set_password(raw_password)
+        self._revoke_tokens_on_save = True
+
+    def save(self, *args, **kwargs):
+        """
+        Deactivating a user, like a password change, logs them out of every
+        session once saved. `QuerySet.update(is_active=False)` sends no
+        signal: call `revoke_all_tokens()` after it.
+        """
+        loaded_values : Dict[str, Any] = getattr(self, "_loaded_values", None) or {}
+        if not self._state.adding and not self.is_active and loaded_values.get("is_active", True) :
+            self._revoke_tokens_on_save = True
+        super().save(*args, **kwargs)
+
+    def revoke_all_tokens(self) -> None:
+        """
+        Logs the user out everywhere by bumping the token version.
+        """
+        from user_config.user_auth.token_versions import user_token_version_store
+
+        version = user_token_version_store.revoke_all(user_id=self.pk)
+        if version is not None :
+            self.token_version = version
+
+    class Meta(CoreGenericModel.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                Lower("email"),
+                name="usermodel_email_lower_uniq",
+            ),
+        ]
+
 
 class UserDetailModel(CoreGenericModel):
     user = models.OneToOneField(
@@ -200,3 +448,4 @@ class UserDetailModel(CoreGenericModel):
         db_column="EMERGENCY_CONTACT_NUMBER"
     )
 
+    history_enabled = True
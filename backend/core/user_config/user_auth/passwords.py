@@ -0,0 +1,194 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional
+import django
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from django.db import connections
+from user_config.user_auth.constants import (
+    USER_AUTH_BULK_HASH_MAX_WORKERS,
+    USER_AUTH_BULK_HASH_MIN_PASSWORDS,
+)
+
+
+def init_hash_worker():
+    """
+    Makes sure Django is configured in pool workers started with `spawn`.
+    """
+    if not apps.ready :
+        django.setup()
+
+
+def hash_password(raw_password : Optional[str]) -> str :
+    return make_password(raw_password)
+
+
+class PasswordService:
+    """
+    Runs password hashing off the request thread.
+
+    The hashers shipped with Django (PBKDF2, Argon2, scrypt) release the GIL
+    while hashing, so a small bounded thread pool gives real parallelism for
+    request-time work. Bulk imports use a process pool instead, which also
+    scales for pure-Python hashers.
+
+    Legacy or under-cost hashes are upgraded after a successful check on the
+    same pool, so the login response never waits for the rehash. Pending
+    rehashes are capped; when the cap is hit the upgrade is simply retried on
+    the next login.
+    """
+
+    def __init__(
+        self,
+        max_workers : Optional[int] = None,
+        max_pending_rehashes : Optional[int] = None,
+    ):
+        self.max_workers : int = max_workers or settings.PASSWORD_HASH_MAX_WORKERS
+        self.max_pending_rehashes : int = (
+            max_pending_rehashes or settings.PASSWORD_REHASH_MAX_PENDING
+        )
+        self._executor : Optional[Executor] = None
+        self._executor_lock : threading.Lock = threading.Lock()
+        self._rehash_slots : threading.BoundedSemaphore = threading.BoundedSemaphore(
+            self.max_pending_rehashes
+        )
+
+    def get_executor(self) -> Executor :
+        """
+        Lazily starts the shared hashing thread pool.
+        """
+        if self._executor is None :
+            with self._executor_lock :
+                if self._executor is None :
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="password-hash",
+                    )
+        return self._executor
+
+    # -----------------------
+    # ? Hashing
+    # -----------------------
+
+    def make_password(self, raw_password : Optional[str]) -> str :
+        return hash_password(raw_password)
+
+    async def amake_password(self, raw_password : Optional[str]) -> str :
+        """
+        Hashes on the pool without blocking the event loop (ASGI).
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.get_executor(), hash_password, raw_password)
+
+    def make_passwords(
+        self,
+        raw_passwords : List[Optional[str]],
+        max_workers : int = USER_AUTH_BULK_HASH_MAX_WORKERS,
+    ) -> List[str] :
+        """
+        Hashes many passwords across a process pool.
+
+        Small batches are hashed inline since starting workers costs more
+        than it saves.
+
+        Args:
+            raw_passwords (List[Optional[str]]): Raw passwords; None produces an unusable password.
+            max_workers (int): Upper bound on worker processes (capped at the CPU count).
+
+        Returns:
+            List[str]: Encoded passwords in the same order as the input.
+        """
+        max_workers = min(max_workers, os.cpu_count() or 1)
+        if len(raw_passwords) < USER_AUTH_BULK_HASH_MIN_PASSWORDS or max_workers <= 1 :
+            return [hash_password(raw_password) for raw_password in raw_passwords]
+
+        chunk_size : int = max(1, len(raw_passwords) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=init_hash_worker) as executor :
+            return list(executor.map(hash_password, raw_passwords, chunksize=chunk_size))
+
+    def set_password(self, user, raw_password : Optional[str]):
+        """
+        Equivalent of `AbstractBaseUser.set_password`.
+        """
+        user.password = self.make_password(raw_password)
+        user._password = raw_password
+
+    async def aset_password(self, user, raw_password : Optional[str]):
+        user.password = await self.amake_password(raw_password)
+        user._password = raw_password
+
+    # -----------------------
+    # ? Checking
+    # -----------------------
+
+    def check_password(self, user, raw_password : str) -> bool :
+        """
+        Equivalent of `AbstractBaseUser.check_password`, except that an
+        outdated hash is upgraded in the background instead of inline.
+        """
+        encoded_password : str = user.password
+
+        def setter(raw_password : str):
+            self.schedule_rehash(
+                user_id=user.pk,
+                encoded_password=encoded_password,
+                raw_password=raw_password,
+            )
+
+        return check_password(raw_password, encoded_password, setter)
+
+    async def acheck_password(self, user, raw_password : str) -> bool :
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.get_executor(), self.check_password, user, raw_password
+        )
+
+    # -----------------------
+    # ? Rehash
+    # -----------------------
+
+    def schedule_rehash(self, user_id, encoded_password : str, raw_password : str) -> bool :
+        """
+        Queues a hash upgrade, returning False when too many are already pending.
+        """
+        if not self._rehash_slots.acquire(blocking=False) :
+            return False
+        future = self.get_executor().submit(
+            self.rehash,
+            user_id=user_id,
+            encoded_password=encoded_password,
+            raw_password=raw_password,
+        )
+        future.add_done_callback(lambda _ : self._rehash_slots.release())
+        return True
+
+    def rehash(self, user_id, encoded_password : str, raw_password : str) -> bool :
+        """
+        Stores a hash made with the preferred hasher.
+
+        The update is conditional on the old hash, so a password changed
+        meanwhile is never overwritten.
+        """
+        from user_config.user_auth.models import UserModel
+
+        try :
+            return bool(
+                UserModel.objects.filter(pk=user_id, password=encoded_password)
+                .update(password=make_password(raw_password))
+            )
+        finally :
+            #? pool threads outlive requests, never keep their connections open
+            connections.close_all()
+
+
+password_service : PasswordService = PasswordService()
+
+
+def hash_passwords(
+    raw_passwords : List[Optional[str]],
+    max_workers : int = USER_AUTH_BULK_HASH_MAX_WORKERS,
+) -> List[str] :
+    return password_service.make_passwords(raw_passwords=raw_passwords, max_workers=max_workers)
@@ -0,0 +1,242 @@
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, List, Optional, Tuple, Union
+from django.core.cache import cache
+from django.db.models import QuerySet
+from rest_framework.permissions import BasePermission
+from rest_framework.request import Request
+from core_utils.utils.cache import is_shared_cache
+from user_config.accounts.enums import UserRoleEnum
+from user_config.user_auth.constants import (
+    USER_AUTH_ACCESS_CACHE_PREFIX,
+    USER_AUTH_ACCESS_CACHE_TIMEOUT,
+    USER_AUTH_ACCESS_REQUEST_ATTR,
+)
+from user_config.user_auth.role_registry import user_role_registry
+
+
+@dataclass(frozen=True)
+class UserAccess:
+    """
+    Snapshot of everything an authorization check needs to know about a user.
+
+    Attributes:
+        role (Optional[str]): The `UserRoleEnum` value of the user's role.
+        is_active (bool): Mirrors `UserModel.is_active`.
+        is_superuser (bool): Mirrors `UserModel.is_superuser`.
+        permissions (FrozenSet[str]): Effective "app_label.codename" permissions,
+                                      direct and inherited from groups.
+    """
+    role : Optional[str]
+    is_active : bool
+    is_superuser : bool
+    permissions : FrozenSet[str]
+
+
+class UserAccessResolver:
+    """
+    Resolves and caches a user's role and effective permissions.
+
+    Lookups go through three layers:
+        1. The user instance attached to the current request (per-request cache).
+        2. The shared Django cache, keyed by a per-user and a global version.
+        3. A single UNION query over direct and group permissions, with the
+           role value resolved in memory by `user_role_registry`.
+
+    Versions are bumped from `user_config.user_auth.signals` whenever a user's
+    role, groups or permissions (or a group's permissions) change, so stale
+    entries are never read again and simply expire.
+
+    With a process-local cache the bumps would not reach the other workers,
+    so layer 2 is skipped and every request loads from the database.
+    """
+
+    cache_prefix : str = USER_AUTH_ACCESS_CACHE_PREFIX
+    cache_timeout : int = USER_AUTH_ACCESS_CACHE_TIMEOUT
+    request_attr : str = USER_AUTH_ACCESS_REQUEST_ATTR
+
+    # -----------------------
+    # ? Version Keys
+    # -----------------------
+
+    def get_global_version_key(self) -> str :
+        return f"{self.cache_prefix}:version"
+
+    def get_user_version_key(self, user_id) -> str :
+        return f"{self.cache_prefix}:version:{user_id}"
+
+    def get_version(self, key : str) -> int :
+        """
+        Reads a version counter from the shared cache, initialising it if missing.
+        """
+        version : Optional[int] = cache.get(key)
+        if version is None :
+            cache.add(key, 1, timeout=None)
+            version = cache.get(key, 1)
+        return version
+
+    def bump_version(self, key : str) :
+        """
+        Increments a version counter, invalidating every entry built on it.
+        """
+        try :
+            cache.incr(key)
+        except ValueError :
+            #? key missing (evicted or never read), any fresh value invalidates
+            cache.set(key, 2, timeout=None)
+
+    def bump_user_version(self, user_id) :
+        self.bump_version(self.get_user_version_key(user_id=user_id))
+
+    def bump_global_version(self) :
+        self.bump_version(self.get_global_version_key())
+
+    def get_access_cache_key(self, user_id) -> str :
+        global_version : int = self.get_version(self.get_global_version_key())
+        user_version : int = self.get_version(self.get_user_version_key(user_id=user_id))
+        return f"{self.cache_prefix}:{user_id}:{global_version}:{user_version}"
+
+    # -----------------------
+    # ? Loading
+    # -----------------------
+
+    def get_access_queryset(self, user_id) -> QuerySet :
+        """
+        Builds one UNION query returning the role flags alongside every
+        direct and group permission of the user.
+
+        Each row is (role id, is_active, is_superuser, app_label, codename); the
+        permission columns are NULL for users without any permission.
+        """
+        from user_config.user_auth.models import UserModel
+
+        base_queryset : QuerySet = UserModel.objects.filter(pk=user_id)
+        direct_permissions : QuerySet = base_queryset.values_list(
+            "user_role_id",
+            "is_active",
+            "is_superuser",
+            "user_permissions__content_type__app_label",
+            "user_permissions__codename",
+        )
+        group_permissions : QuerySet = base_queryset.values_list(
+            "user_role_id",
+            "is_active",
+            "is_superuser",
+            "groups__permissions__content_type__app_label",
+            "groups__permissions__codename",
+        )
+        return direct_permissions.union(group_permissions)
+
+    def load_access(self, user_id) -> Optional[UserAccess] :
+        """
+        Loads the access snapshot from the database.
+
+        Returns:
+            Optional[UserAccess]: None if the user does not exist.
+        """
+        rows : List[Tuple] = list(self.get_access_queryset(user_id=user_id))
+        if not rows :
+            return None
+
+        role_id, is_active, is_superuser = rows[0][:3]
+        permissions : FrozenSet[str] = frozenset(
+            f"{app_label}.{codename}"
+            for *_, app_label, codename in rows
+            if app_label and codename
+        )
+        return UserAccess(
+            role=user_role_registry.get_role(role_id=role_id),
+            is_active=is_active,
+            is_superuser=is_superuser,
+            permissions=permissions,
+        )
+
+    def get_access(self, user) -> Optional[UserAccess] :
+        """
+        Returns the access snapshot for a user, hitting the database at most once.
+
+        Args:
+            user: A `UserModel` instance (anonymous users resolve to None).
+
+        Returns:
+            Optional[UserAccess]: The resolved access or None for anonymous users.
+        """
+        if user is None or not getattr(user, "is_authenticated", False) :
+            return None
+
+        #? per-request cache, the same user instance lives for the whole request
+        access : Optional[UserAccess] = getattr(user, self.request_attr, None)
+        if access is not None :
+            return access
+
+        cache_key : Optional[str] = self.get_access_cache_key(user_id=user.pk) if is_shared_cache() else None
+        if cache_key is not None :
+            access = cache.get(cache_key)
+        if access is None :
+            access = self.load_access(user_id=user.pk)
+            if access is None :
+                return None
+            if cache_key is not None :
+                cache.set(cache_key, access, timeout=self.cache_timeout)
+
+        setattr(user, self.request_attr, access)
+        return access
+
+    # -----------------------
+    # ? Checks
+    # -----------------------
+
+    def has_role(self, user, *roles : Union[UserRoleEnum, str]) -> bool :
+        """
+        Checks whether the user holds any of the given roles.
+        """
+        access : Optional[UserAccess] = self.get_access(user=user)
+        if access is None or not access.is_active :
+            return False
+        allowed_roles : set = {
+            role.value if isinstance(role, UserRoleEnum) else role for role in roles
+        }
+        return access.role in allowed_roles
+
+    def has_perm(self, user, perm : str) -> bool :
+        """
+        Checks a single "app_label.codename" permission, honouring superusers.
+        """
+        access : Optional[UserAccess] = self.get_access(user=user)
+        if access is None or not access.is_active :
+            return False
+        return access.is_superuser or perm in access.permissions
+
+    def has_perms(self, user, perms : Iterable[str]) -> bool :
+        return all(self.has_perm(user=user, perm=perm) for perm in perms)
+
+
+user_access_resolver : UserAccessResolver = UserAccessResolver()
+
+
+def has_role(user, *roles : Union[UserRoleEnum, str]) -> bool :
+    return user_access_resolver.has_role(user, *roles)
+
+
+def has_perm(user, perm : str) -> bool :
+    return user_access_resolver.has_perm(user=user, perm=perm)
+
+
+class CoreGenericRolePermission(BasePermission):
+    """
+    DRF permission enforcing `allowed_roles` and `required_permissions`
+    declared on a generic view.
+
+    Views without either attribute are allowed through unchanged.
+    """
+
+    def has_permission(self, request : Request, view) -> bool :
+        allowed_roles : List = getattr(view, "allowed_roles", None) or []
+        required_permissions : List[str] = getattr(view, "required_permissions", None) or []
+
+        if allowed_roles and not user_access_resolver.has_role(request.user, *allowed_roles) :
+            return False
+        if required_permissions and not user_access_resolver.has_perms(
+            user=request.user, perms=required_permissions
+        ):
+            return False
+        return True
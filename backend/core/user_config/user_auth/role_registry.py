@@ -0,0 +1,156 @@
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Union
+from uuid import UUID
+from django.core.cache import cache
+from core_utils.utils.cache import is_shared_cache
+from user_config.accounts.enums import UserRoleEnum
+from user_config.user_auth.constants import (
+    USER_AUTH_ROLE_REGISTRY_CHECK_INTERVAL,
+    USER_AUTH_ROLE_REGISTRY_VERSION_KEY,
+)
+
+
+class UserRoleRegistry:
+    """
+    Process-wide, in-memory mapping between `UserRoleEnum` values and
+    `UserRoleModel` primary keys.
+
+    The table is tiny and practically static, so it is loaded lazily on first
+    use and kept for the life of the process. Role saves/deletes invalidate it
+    locally (see `user_config.user_auth.signals`) and bump a version in the
+    shared cache, which other processes poll at most once every
+    `check_interval` seconds. With a process-local cache, where those bumps
+    are never seen, every process reloads once per `check_interval` instead.
+
+    Note:
+        - Only the first role row per enum value is registered.
+        - Safe to use from multiple threads.
+    """
+
+    version_key : str = USER_AUTH_ROLE_REGISTRY_VERSION_KEY
+    check_interval : float = USER_AUTH_ROLE_REGISTRY_CHECK_INTERVAL
+
+    def __init__(self):
+        self._lock : threading.Lock = threading.Lock()
+        self._role_to_id : Dict[str, UUID] = {}
+        self._id_to_role : Dict[UUID, str] = {}
+        self._is_loaded : bool = False
+        self._version : Optional[int] = None
+        self._checked_at : float = 0.0
+
+    # -----------------------
+    # ? Loading
+    # -----------------------
+
+    def load(self):
+        """
+        (Re)loads every role row with a single query.
+        """
+        from user_config.user_auth.models import UserRoleModel
+
+        #? read the version first so a concurrent bump is never missed
+        version : Optional[int] = cache.get(self.version_key)
+        role_to_id : Dict[str, UUID] = {}
+        id_to_role : Dict[UUID, str] = {}
+        for role_id, role in UserRoleModel.objects.order_by("core_generic_created_at").values_list("id", "role"):
+            role_to_id.setdefault(role, role_id)
+            id_to_role[role_id] = role
+
+        with self._lock :
+            self._role_to_id = role_to_id
+            self._id_to_role = id_to_role
+            self._version = version
+            self._checked_at = time.monotonic()
+            self._is_loaded = True
+
+    def invalidate(self):
+        """
+        Drops the local mapping and tells other processes to do the same.
+        """
+        with self._lock :
+            self._is_loaded = False
+        try :
+            cache.incr(self.version_key)
+        except ValueError :
+            cache.set(self.version_key, 1, timeout=None)
+
+    def ensure_loaded(self):
+        """
+        Loads the mapping if missing or if another process changed the roles.
+        """
+        if self._is_loaded and time.monotonic() - self._checked_at < self.check_interval :
+            return
+        if self._is_loaded and is_shared_cache() and cache.get(self.version_key) == self._version :
+            self._checked_at = time.monotonic()
+            return
+        self.load()
+
+    # -----------------------
+    # ? Lookups
+    # -----------------------
+
+    def get_role_value(self, role : Union[UserRoleEnum, str]) -> str :
+        return role.value if isinstance(role, UserRoleEnum) else role
+
+    def get_role_id(self, role : Union[UserRoleEnum, str], create_missing : bool = False) -> UUID :
+        """
+        Returns the `UserRoleModel` primary key for a role.
+
+        Args:
+            role (Union[UserRoleEnum, str]): The role enum or its value.
+            create_missing (bool): Create the role row if it does not exist yet.
+
+        Raises:
+            UserRoleModel.DoesNotExist: If the role has no row and `create_missing` is False.
+        """
+        from user_config.user_auth.models import UserRoleModel
+
+        role_value : str = self.get_role_value(role=role)
+        self.ensure_loaded()
+        role_id : Optional[UUID] = self._role_to_id.get(role_value)
+        if role_id is not None :
+            return role_id
+
+        #? the row may have been created since the last load
+        self.load()
+        role_id = self._role_to_id.get(role_value)
+        if role_id is not None :
+            return role_id
+
+        if not create_missing :
+            raise UserRoleModel.DoesNotExist(f"UserRoleModel for role '{role_value}' does not exist.")
+        role_instance : UserRoleModel = UserRoleModel.objects.create(
+            role=role_value,
+            title=UserRoleEnum(role_value).name.capitalize(),
+        )
+        return role_instance.pk
+
+    def get_role_ids(self, roles : Iterable[Union[UserRoleEnum, str]]) -> List[UUID] :
+        """
+        Returns the primary keys of the given roles, skipping roles without a row.
+        """
+        self.ensure_loaded()
+        return [
+            self._role_to_id[role_value]
+            for role_value in map(self.get_role_value, roles)
+            if role_value in self._role_to_id
+        ]
+
+    def get_role(self, role_id : Union[UUID, str, None]) -> Optional[str] :
+        """
+        Returns the `UserRoleEnum` value for a role primary key.
+        """
+        if role_id is None :
+            return None
+        if not isinstance(role_id, UUID) :
+            role_id = UUID(str(role_id))
+        self.ensure_loaded()
+        role : Optional[str] = self._id_to_role.get(role_id)
+        if role is None :
+            self.load()
+            role = self._id_to_role.get(role_id)
+        return role
+
+
+user_role_registry : UserRoleRegistry = UserRoleRegistry()
@@ -0,0 +1,51 @@
+from datetime import datetime
+from importlib import import_module
+from typing import Callable, Optional
+from django.conf import settings
+from django.utils import timezone
+from core_utils.utils.db_utils.batch_delete import delete_in_batches
+from user_config.user_auth.constants import USER_AUTH_SESSION_PURGE_BATCH_SIZE
+
+
+class ExpiredSessionPurger:
+    """
+    Deletes expired rows of the session table in small batches.
+
+    `clearsessions` issues a single `DELETE` over every expired row, which on
+    a large table holds locks for a long time. Here each batch is its own
+    short transaction (see `delete_in_batches`). Cached copies need no cleanup, the cache entry expires
+    together with the session.
+    """
+
+    batch_size : int = USER_AUTH_SESSION_PURGE_BATCH_SIZE
+
+    def __init__(self, batch_size : Optional[int] = None, sleep_seconds : float = 0.0):
+        self.batch_size = batch_size or self.batch_size
+        self.sleep_seconds = sleep_seconds
+
+    def get_model_class(self):
+        """
+        Returns the session model of `SESSION_ENGINE`, None when sessions are
+        not stored in the database (cache, signed_cookies).
+        """
+        session_store_class = import_module(settings.SESSION_ENGINE).SessionStore
+        if not hasattr(session_store_class, "get_model_class") :
+            return None
+        return session_store_class.get_model_class()
+
+    def purge(self, now : Optional[datetime] = None, log : Optional[Callable[[str], None]] = None) -> int :
+        """
+        Returns:
+            int: Number of deleted rows.
+        """
+        session_model = self.get_model_class()
+        if session_model is None :
+            return 0
+        now = now or timezone.now()
+        return delete_in_batches(
+            session_model.objects.filter(expire_date__lt=now),
+            batch_size=self.batch_size,
+            sleep_seconds=self.sleep_seconds,
+            log=log,
+            label="expired sessions",
+        )
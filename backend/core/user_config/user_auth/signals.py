@@ -0,0 +1,85 @@
+from functools import partial
+from typing import Optional
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from user_config.user_auth.models import UserModel, UserRoleModel
+from user_config.user_auth.permissions import user_access_resolver
+from user_config.user_auth.role_registry import user_role_registry
+from user_config.user_auth.token_versions import user_token_version_store
+
+M2M_CHANGE_ACTIONS = {"post_add", "post_remove", "post_clear"}
+
+
+def bump_on_commit(bump, using : Optional[str] = None, **kwargs):
+    """
+    Runs a version bump once the transaction on `using` commits (at once
+    outside a transaction): before the commit, a concurrent miss would
+    cache the old rows under the new version.
+    """
+    transaction.on_commit(partial(bump, **kwargs), using=using, robust=True)
+
+
+@receiver(post_save, sender=UserModel)
+@receiver(post_delete, sender=UserModel)
+def invalidate_user_access_on_user_change(sender, instance : UserModel, using : Optional[str] = None, **kwargs):
+    """
+    Role, active and superuser flags live on the user row, so any save bumps
+    that user's access version.
+    """
+    bump_on_commit(user_access_resolver.bump_user_version, using=using, user_id=instance.pk)
+
+
+@receiver(post_save, sender=UserModel)
+def revoke_tokens_on_password_change(sender, instance : UserModel, created : bool, **kwargs):
+    """
+    A saved password change or deactivation logs the user out of every
+    session, including the one that made the change: its tokens carry the
+    old version too, so the client has to log in again.
+    """
+    if getattr(instance, "_revoke_tokens_on_save", False) :
+        instance._revoke_tokens_on_save = False
+        if not created :
+            instance.revoke_all_tokens()
+
+
+@receiver(post_save, sender=UserRoleModel)
+@receiver(post_delete, sender=UserRoleModel)
+def invalidate_access_on_role_change(sender, using : Optional[str] = None, **kwargs):
+    """
+    A role row is shared by many users, so the global version is bumped
+    and the role registry reloaded.
+    """
+    bump_on_commit(user_role_registry.invalidate, using=using)
+    bump_on_commit(user_access_resolver.bump_global_version, using=using)
+
+
+@receiver(m2m_changed, sender=UserModel.groups.through)
+@receiver(m2m_changed, sender=UserModel.user_permissions.through)
+def invalidate_user_access_on_m2m_change(
+    sender, instance, action : str, reverse : bool, pk_set, using : Optional[str] = None, **kwargs
+):
+    """
+    Bumps the versions of the users whose groups or direct permissions changed.
+    """
+    if action not in M2M_CHANGE_ACTIONS :
+        return
+    if not reverse :
+        bump_on_commit(user_access_resolver.bump_user_version, using=using, user_id=instance.pk)
+    elif pk_set :
+        #? reverse side (group.user_set / permission.user_set), pk_set holds user ids
+        for user_id in pk_set :
+            bump_on_commit(user_access_resolver.bump_user_version, using=using, user_id=user_id)
+    else :
+        #? reverse clear does not report the affected users
+        bump_on_commit(user_access_resolver.bump_global_version, using=using)
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_access_on_group_permission_change(sender, action : str, using : Optional[str] = None, **kwargs):
+    """
+    Group permissions fan out to every member, so the global version is bumped.
+    """
+    if action in M2M_CHANGE_ACTIONS :
+        bump_on_commit(user_access_resolver.bump_global_version, using=using)
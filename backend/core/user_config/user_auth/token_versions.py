@@ -0,0 +1,136 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models import F
+from core_utils.utils.cache import is_shared_cache
+from user_config.user_auth.constants import (
+    USER_AUTH_TOKEN_VERSION_CACHE_PREFIX,
+    USER_AUTH_TOKEN_VERSION_CACHE_TIMEOUT,
+    USER_AUTH_TOKEN_VERSION_LOCAL_MAX_ENTRIES,
+    USER_AUTH_TOKEN_VERSION_LOCAL_TTL,
+)
+
+
+class UserTokenVersionStore:
+    """
+    Per-user token version used for O(1) "log out everywhere".
+
+    Every issued JWT embeds the user's current `UserModel.token_version`. A
+    token is valid only while its version matches, so revoking every session
+    of a user is a single counter bump instead of one blacklist row per token.
+
+    Reads go through a short-lived per-process map (at most
+    `local_max_entries` users), then the shared cache, then the database.
+    Once the revoking transaction commits, the revoking process updates the
+    cache and its map; other processes see the new version after at most
+    `local_ttl` seconds. With a process-local cache, which the other
+    processes can't see, the cache is skipped and the map falls back to
+    the database.
+    """
+
+    cache_prefix : str = USER_AUTH_TOKEN_VERSION_CACHE_PREFIX
+    cache_timeout : int = USER_AUTH_TOKEN_VERSION_CACHE_TIMEOUT
+    local_ttl : float = USER_AUTH_TOKEN_VERSION_LOCAL_TTL
+    local_max_entries : int = USER_AUTH_TOKEN_VERSION_LOCAL_MAX_ENTRIES
+
+    def __init__(self):
+        self._lock : threading.Lock = threading.Lock()
+        self._local : Dict[str, Tuple[int, float]] = {}
+
+    def get_cache_key(self, user_id) -> str :
+        return f"{self.cache_prefix}:{user_id}"
+
+    def set_local(self, user_id, version : int):
+        now : float = time.monotonic()
+        with self._lock :
+            #? re-inserted, so the map stays ordered by expiry
+            self._local.pop(str(user_id), None)
+            self._local[str(user_id)] = (version, now + self.local_ttl)
+            if len(self._local) > self.local_max_entries :
+                self.prune_local(now=now)
+
+    def prune_local(self, now : float):
+        """
+        Drops expired entries, then the oldest ones while over `local_max_entries`.
+        Called with the lock held.
+        """
+        while self._local :
+            user_key : str = next(iter(self._local))
+            if self._local[user_key][1] >= now and len(self._local) <= self.local_max_entries :
+                break
+            del self._local[user_key]
+
+    def get_local(self, user_id) -> Optional[int] :
+        entry : Optional[Tuple[int, float]] = self._local.get(str(user_id))
+        if entry is None or entry[1] < time.monotonic() :
+            return None
+        return entry[0]
+
+    def get_version(self, user_id) -> Optional[int] :
+        """
+        Returns the user's current token version, or None if the user is gone.
+        """
+        from user_config.user_auth.models import UserModel
+
+        version : Optional[int] = self.get_local(user_id=user_id)
+        if version is not None :
+            return version
+
+        use_cache : bool = is_shared_cache()
+        version = cache.get(self.get_cache_key(user_id=user_id)) if use_cache else None
+        if version is None :
+            version = (
+                UserModel.objects.filter(pk=user_id)
+                .values_list("token_version", flat=True)
+                .first()
+            )
+            if version is None :
+                return None
+            if use_cache :
+                #? add, not set: a revoke_all committed since the read must not be overwritten
+                cache.add(self.get_cache_key(user_id=user_id), version, timeout=self.cache_timeout)
+
+        self.set_local(user_id=user_id, version=version)
+        return version
+
+    def is_current(self, user_id, version : Optional[int]) -> bool :
+        """
+        Checks the version claimed by a token against the user's current one.
+        """
+        if version is None :
+            return False
+        return self.get_version(user_id=user_id) == version
+
+    def revoke_all(self, user_id) -> Optional[int] :
+        """
+        Invalidates every token issued to the user so far.
+
+        Returns:
+            Optional[int]: The new token version, None if the user does not exist.
+        """
+        from user_config.user_auth.models import UserModel
+
+        updated : int = UserModel.objects.filter(pk=user_id).update(
+            token_version=F("token_version") + 1
+        )
+        if not updated :
+            return None
+        version : int = (
+            UserModel.objects.filter(pk=user_id)
+            .values_list("token_version", flat=True)
+            .get()
+        )
+
+        def publish_version():
+            if is_shared_cache() :
+                cache.set(self.get_cache_key(user_id=user_id), version, timeout=self.cache_timeout)
+            self.set_local(user_id=user_id, version=version)
+
+        #? on rollback the version never existed, it must not reach the cache
+        transaction.on_commit(publish_version, using=router.db_for_write(UserModel), robust=True)
+        return version
+
+
+user_token_version_store : UserTokenVersionStore = UserTokenVersionStore()